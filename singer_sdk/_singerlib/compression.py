@@ -0,0 +1,147 @@
+"""Compressed Singer message streams.
+
+Readers detect compressed input from its magic bytes, so compressed and uncompressed
+streams can be piped into the same plugin. gzip is always available, and zstd requires
+the `zstandard <https://pypi.org/project/zstandard/>`_ package.
+"""
+
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import io
+import typing as t
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+_MAGIC_BYTES = {GZIP: GZIP_MAGIC, ZSTD: ZSTD_MAGIC}
+
+
+def peek(stream: t.Any, size: int) -> bytes:  # noqa: ANN401
+    """Read the first bytes of a binary stream without consuming them.
+
+    Args:
+        stream: The input stream.
+        size: The number of bytes to read.
+
+    Returns:
+        Up to `size` bytes, or no bytes if the stream is in text mode or can neither
+        be peeked at nor seeked.
+    """
+    if isinstance(stream, io.TextIOBase):
+        return b""
+
+    if hasattr(stream, "peek"):
+        return stream.peek(size)[:size]  # type: ignore[no-any-return]
+
+    if getattr(stream, "seekable", lambda: False)():
+        position = stream.tell()
+        data = stream.read(size)
+        stream.seek(position)
+        return data if isinstance(data, bytes) else b""
+
+    return b""
+
+
+def detect_compression(stream: t.Any) -> str | None:  # noqa: ANN401
+    """Detect the compression of a binary stream from its magic bytes.
+
+    Args:
+        stream: The input stream.
+
+    Returns:
+        The compression name, or None if the stream is not compressed.
+    """
+    head = peek(stream, max(map(len, _MAGIC_BYTES.values())))
+    for compression, magic in _MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def _import_zstandard() -> t.Any:  # noqa: ANN401
+    if importlib.util.find_spec("zstandard") is None:
+        msg = f"'{ZSTD}' compression requires the 'zstandard' package"
+        raise ValueError(msg)
+
+    import zstandard
+
+    return zstandard
+
+
+def open_decompressed(stream: t.Any) -> t.Any:  # noqa: ANN401
+    """Wrap a binary stream so that compressed input is decompressed on read.
+
+    Args:
+        stream: The input stream.
+
+    Returns:
+        A buffered binary stream of decompressed data, or `stream` itself if it is
+        not compressed.
+    """
+    compression = detect_compression(stream)
+    if compression == GZIP:
+        return gzip.GzipFile(fileobj=stream, mode="rb")
+    if compression == ZSTD:
+        decompressor = _import_zstandard().ZstdDecompressor()
+        reader = decompressor.stream_reader(stream, read_across_frames=True)
+        return io.BufferedReader(reader)
+    return stream
+
+
+class CompressedOutput:
+    """A compressed binary output stream.
+
+    Flushing writes out all data received so far as a complete compressed block, so
+    that the reader can decode it without waiting for the stream to end.
+    """
+
+    def __init__(self, stream: t.BinaryIO, compression: str) -> None:
+        """Initialize the output stream.
+
+        Args:
+            stream: The binary stream to write compressed data to.
+            compression: The compression name.
+
+        Raises:
+            ValueError: If the compression is not supported.
+        """
+        self.stream = stream
+        self.compression = compression
+        if compression == GZIP:
+            self._writer: t.Any = gzip.GzipFile(fileobj=stream, mode="wb")
+        elif compression == ZSTD:
+            zstandard = _import_zstandard()
+            self._flush_mode = zstandard.FLUSH_BLOCK
+            self._writer = zstandard.ZstdCompressor().stream_writer(
+                stream,
+                closefd=False,
+            )
+        else:
+            msg = f"Unsupported compression '{compression}'"
+            raise ValueError(msg)
+
+    def write(self, data: bytes) -> None:
+        """Compress data.
+
+        Args:
+            data: The uncompressed data.
+        """
+        self._writer.write(data)
+
+    def flush(self) -> None:
+        """Write out all data received so far."""
+        if self.compression == ZSTD:
+            self._writer.flush(self._flush_mode)
+        else:
+            self._writer.flush()
+        self.stream.flush()
+
+    def close(self) -> None:
+        """End the compressed stream, leaving the underlying stream open."""
+        self._writer.close()
+        self.stream.flush()
@@ -0,0 +1,352 @@
+"""Pluggable JSON codecs for reading and writing Singer messages.
+
+Every codec decodes JSON numbers with a fractional part or exponent as
+:class:`decimal.Decimal`, and encodes :class:`~datetime.datetime` values as ISO 8601
+strings. Codecs accept ``str`` or ``bytes`` input, so lines read from a binary stream
+can be decoded without an intermediate UTF-8 decode step.
+
+The codec is selected by name, from the ``SINGER_SDK_JSON_CODEC`` environment
+variable, or automatically from the installed libraries. Auto-detection differs for
+input and output: any lossless backend may decode messages, but encoding defaults to
+simplejson so that the bytes written by a plugin do not depend on which optional
+libraries happen to be installed.
+"""
+
+from __future__ import annotations
+
+import abc
+import decimal
+import importlib.util
+import json
+import math
+import os
+import typing as t
+from datetime import datetime
+
+import simplejson
+
+JSON_CODEC_ENV_VAR = "SINGER_SDK_JSON_CODEC"
+
+# Preferred backends when no codec is configured, fastest first. Only backends with
+# lossless Decimal handling are auto-detected.
+DECODE_AUTO_DETECT = ("msgspec", "stdlib")
+ENCODE_AUTO_DETECT = ("simplejson",)
+
+
+def _default_encoding(obj: t.Any) -> str:  # noqa: ANN401
+    """Default JSON encoder.
+
+    Args:
+        obj: The object to encode.
+
+    Returns:
+        The encoded object.
+    """
+    return obj.isoformat(sep="T") if isinstance(obj, datetime) else str(obj)
+
+
+def _to_decimal(obj: t.Any) -> t.Any:  # noqa: ANN401
+    """Convert finite floats in a decoded document to Decimals.
+
+    Floats are converted from their shortest representation, which is how JSON
+    encoders write them.
+
+    Args:
+        obj: A decoded document.
+
+    Returns:
+        The document, with Decimals instead of floats.
+    """
+    if isinstance(obj, float):
+        return decimal.Decimal(repr(obj)) if math.isfinite(obj) else obj
+    if isinstance(obj, dict):
+        return {key: _to_decimal(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_to_decimal(value) for value in obj]
+    return obj
+
+
+class JSONCodec(metaclass=abc.ABCMeta):
+    """Base class for JSON encoding and decoding backends."""
+
+    #: Name used to select the codec.
+    name: str
+
+    #: Importable module the codec depends on.
+    module: str
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Check if the backend library is installed.
+
+        Returns:
+            True if the codec can be used.
+        """
+        return importlib.util.find_spec(cls.module) is not None
+
+    @abc.abstractmethod
+    def loads(self, data: str | bytes) -> t.Any:  # noqa: ANN401
+        """Deserialize a JSON document.
+
+        Args:
+            data: A JSON document, as text or UTF-8 encoded bytes.
+
+        Returns:
+            The deserialized object.
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON.
+        """
+
+    @abc.abstractmethod
+    def dumps(self, obj: t.Any) -> str:  # noqa: ANN401
+        """Serialize an object to a JSON string.
+
+        Args:
+            obj: The object to serialize.
+
+        Returns:
+            The JSON document.
+        """
+
+    def dumps_bytes(self, obj: t.Any) -> bytes:  # noqa: ANN401
+        """Serialize an object to UTF-8 encoded JSON.
+
+        Args:
+            obj: The object to serialize.
+
+        Returns:
+            The JSON document.
+        """
+        return self.dumps(obj).encode("utf-8")
+
+    def raw(self, data: str) -> t.Any:  # noqa: ANN401
+        """Wrap an encoded JSON value so that :meth:`dumps` writes it verbatim.
+
+        Codecs that cannot embed encoded JSON decode the value instead.
+
+        Args:
+            data: An encoded JSON value.
+
+        Returns:
+            An object to use in place of the value when encoding.
+        """
+        return self.loads(data)
+
+    def loads_deferred(
+        self,
+        data: str | bytes,
+        key: str,  # noqa: ARG002
+    ) -> tuple[dict[str, t.Any], t.Any | None]:
+        """Deserialize a JSON object, leaving the value of one key undecoded.
+
+        Codecs that cannot skip over a value decode the whole object, in which case
+        the key is left in the returned object and no raw value is returned.
+
+        Args:
+            data: A JSON object, as text or UTF-8 encoded bytes.
+            key: The key whose value should not be decoded.
+
+        Returns:
+            The decoded object and the raw JSON value of `key`, if it was deferred.
+        """
+        return self.loads(data), None
+
+
+class StdlibJSONCodec(JSONCodec):
+    """Codec backed by the standard library :mod:`json` module.
+
+    The standard library encoder cannot write arbitrary-precision numbers, so
+    messages are encoded with :mod:`simplejson`, a core dependency of the SDK, to
+    keep :class:`~decimal.Decimal` values lossless.
+    """
+
+    name = "stdlib"
+    module = "json"
+
+    def loads(self, data: str | bytes) -> t.Any:  # noqa: ANN401
+        return json.loads(data, parse_float=decimal.Decimal)
+
+    def dumps(self, obj: t.Any) -> str:  # noqa: ANN401
+        return simplejson.dumps(obj, use_decimal=True, default=_default_encoding)
+
+    def raw(self, data: str) -> t.Any:  # noqa: ANN401
+        return simplejson.RawJSON(data)
+
+
+class SimpleJSONCodec(JSONCodec):
+    """Codec backed by :mod:`simplejson`."""
+
+    name = "simplejson"
+    module = "simplejson"
+
+    def loads(self, data: str | bytes) -> t.Any:  # noqa: ANN401
+        try:
+            return simplejson.loads(data, use_decimal=True, parse_constant=float)
+        except simplejson.JSONDecodeError as exc:
+            raise json.JSONDecodeError(exc.msg, exc.doc, exc.pos) from exc
+
+    def dumps(self, obj: t.Any) -> str:  # noqa: ANN401
+        return simplejson.dumps(obj, use_decimal=True, default=_default_encoding)
+
+    def raw(self, data: str) -> t.Any:  # noqa: ANN401
+        return simplejson.RawJSON(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by `orjson <https://github.com/ijl/orjson>`_.
+
+    orjson has no float hook, so decoded floats are converted to
+    :class:`~decimal.Decimal` from their shortest representation. Numbers with more
+    than 17 significant digits lose precision, which is why this codec is never
+    auto-detected. Decimals are encoded losslessly with orjson 3.9 or newer.
+    """
+
+    name = "orjson"
+    module = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize the codec."""
+        import orjson
+
+        self._orjson = orjson
+        self._fragment = getattr(orjson, "Fragment", None)
+
+    def _default(self, obj: t.Any) -> t.Any:  # noqa: ANN401
+        if isinstance(obj, decimal.Decimal):
+            if self._fragment is not None:
+                return self._fragment(str(obj))
+            return int(obj) if obj == obj.to_integral_value() else float(obj)
+        return _default_encoding(obj)
+
+    def raw(self, data: str) -> t.Any:  # noqa: ANN401
+        if self._fragment is not None:
+            return self._fragment(data)
+        return self.loads(data)
+
+    def loads(self, data: str | bytes) -> t.Any:  # noqa: ANN401
+        return _to_decimal(self._orjson.loads(data))
+
+    def dumps(self, obj: t.Any) -> str:  # noqa: ANN401
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: t.Any) -> bytes:  # noqa: ANN401
+        return self._orjson.dumps(  # type: ignore[no-any-return]
+            obj,
+            default=self._default,
+            option=self._orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec backed by `msgspec <https://jcristharif.com/msgspec/>`_.
+
+    msgspec rejects the non-standard ``NaN`` and ``Infinity`` literals, so documents
+    it cannot decode are retried with the standard library decoder, which accepts
+    them like the SDK always has.
+    """
+
+    name = "msgspec"
+    module = "msgspec"
+
+    def __init__(self) -> None:
+        """Initialize the codec."""
+        import msgspec
+
+        self._decode_error = msgspec.DecodeError
+        self._raw = msgspec.Raw
+        self._decoder = msgspec.json.Decoder(float_hook=decimal.Decimal)
+        self._raw_decoder = msgspec.json.Decoder(t.Dict[str, msgspec.Raw])
+        self._encoder = msgspec.json.Encoder(
+            enc_hook=_default_encoding,
+            decimal_format="number",
+        )
+
+    def loads(self, data: str | bytes) -> t.Any:  # noqa: ANN401
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error:
+            return json.loads(data, parse_float=decimal.Decimal)
+
+    def loads_deferred(
+        self,
+        data: str | bytes,
+        key: str,
+    ) -> tuple[dict[str, t.Any], t.Any | None]:
+        try:
+            raw = self._raw_decoder.decode(data)
+            deferred = raw.pop(key, None)
+            return {k: self._decoder.decode(v) for k, v in raw.items()}, deferred
+        except self._decode_error:
+            return self.loads(data), None
+
+    def dumps(self, obj: t.Any) -> str:  # noqa: ANN401
+        return self._encoder.encode(obj).decode("utf-8")
+
+    def raw(self, data: str) -> t.Any:  # noqa: ANN401
+        return self._raw(data)
+
+    def dumps_bytes(self, obj: t.Any) -> bytes:  # noqa: ANN401
+        return self._encoder.encode(obj)
+
+
+CODECS: dict[str, type[JSONCodec]] = {
+    codec.name: codec
+    for codec in (StdlibJSONCodec, SimpleJSONCodec, OrjsonCodec, MsgspecCodec)
+}
+_instances: dict[str, JSONCodec] = {}
+# Default codecs, by auto-detect preference, resolved once per process
+_defaults: dict[tuple[str, ...], JSONCodec] = {}
+
+
+def get_codec(
+    name: str | None = None,
+    *,
+    auto_detect: t.Sequence[str] = DECODE_AUTO_DETECT,
+) -> JSONCodec:
+    """Get a JSON codec instance.
+
+    The default codec is resolved the first time it is requested, and reused
+    afterwards. Call :func:`reset_codecs` to resolve it again.
+
+    Args:
+        name: Name of the codec. If not provided, the ``SINGER_SDK_JSON_CODEC``
+            environment variable is used, and otherwise the first installed codec in
+            `auto_detect`.
+        auto_detect: Codec names to try, in order, when no codec is configured.
+
+    Returns:
+        A shared codec instance.
+
+    Raises:
+        ValueError: If the codec is unknown or its backend is not installed.
+    """
+    if name:
+        return _get_named_codec(name)
+
+    key = tuple(auto_detect)
+    if key not in _defaults:
+        name = os.environ.get(JSON_CODEC_ENV_VAR) or next(
+            n for n in auto_detect if CODECS[n].is_available()
+        )
+        _defaults[key] = _get_named_codec(name)
+    return _defaults[key]
+
+
+def reset_codecs() -> None:
+    """Forget the default codecs, so they are resolved again from the environment."""
+    _defaults.clear()
+
+
+def _get_named_codec(name: str) -> JSONCodec:
+    if name not in _instances:
+        if name not in CODECS:
+            msg = f"Unknown JSON codec '{name}'. Choose one of: {', '.join(CODECS)}"
+            raise ValueError(msg)
+        codec_class = CODECS[name]
+        if not codec_class.is_available():
+            msg = f"JSON codec '{name}' requires the '{codec_class.module}' package"
+            raise ValueError(msg)
+        _instances[name] = codec_class()
+
+    return _instances[name]
@@ -8,7 +8,7 @@ import typing as t
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 
-import simplejson as json
+from singer_sdk._singerlib.json import ENCODE_AUTO_DETECT, get_codec
 
 if sys.version_info < (3, 11):
     from backports.datetime_fromisoformat import MonkeyPatch
@@ -26,18 +26,6 @@ class SingerMessageType(str, enum.Enum):
     BATCH = "BATCH"
 
 
-def _default_encoding(obj: t.Any) -> str:  # noqa: ANN401
-    """Default JSON encoder.
-
-    Args:
-        obj: The object to encode.
-
-    Returns:
-        The encoded object.
-    """
-    return obj.isoformat(sep="T") if isinstance(obj, datetime) else str(obj)
-
-
 def exclude_null_dict(pairs: list[tuple[str, t.Any]]) -> dict[str, t.Any]:
     """Exclude null values from a dictionary.
 
@@ -121,6 +109,40 @@ class RecordMessage(Message):
             else None,
         )
 
+    @classmethod
+    def unchecked(
+        cls: type[RecordMessage],
+        stream: str,
+        record: dict[str, t.Any],
+        *,
+        version: int | None = None,
+        time_extracted: datetime | None = None,
+    ) -> RecordMessage:
+        """Create a record message without validating its fields.
+
+        This skips the dataclass constructor and the time zone checks and conversion
+        of `time_extracted`, which is significantly faster when emitting many records.
+
+        Args:
+            stream: The stream name.
+            record: The record data.
+            version: The record version.
+            time_extracted: The time the record was extracted. Must be None or an
+                aware datetime in UTC.
+
+        Returns:
+            The created message.
+        """
+        message = cls.__new__(cls)
+        message.__dict__ = {
+            "type": SingerMessageType.RECORD,
+            "stream": stream,
+            "record": record,
+            "version": version,
+            "time_extracted": time_extracted,
+        }
+        return message
+
     def to_dict(self) -> dict[str, t.Any]:
         """Return a dictionary representation of the message.
 
@@ -226,7 +248,7 @@ def format_message(message: Message) -> str:
     Returns:
         The formatted message.
     """
-    return json.dumps(message.to_dict(), use_decimal=True, default=_default_encoding)
+    return get_codec(auto_detect=ENCODE_AUTO_DETECT).dumps(message.to_dict())
 
 
 def write_message(message: Message) -> None:
@@ -0,0 +1,155 @@
+"""Memory-mapped reading of Singer message files."""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+import stat
+import typing as t
+from pathlib import Path
+
+_NEWLINE = b"\n"
+
+
+class MappedInput:
+    """Iterate over the lines of a file through a memory map.
+
+    Lines are found by scanning the mapped bytes for newlines, and are yielded as
+    ``bytes`` including their line terminator, like iterating over a file opened in
+    binary mode. Only the byte range from `start` to `end` is read.
+    """
+
+    def __init__(
+        self,
+        buffer: mmap.mmap | bytes,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        path: str | None = None,
+    ) -> None:
+        """Initialize the input.
+
+        Args:
+            buffer: The mapped file contents.
+            start: Offset of the first byte to read.
+            end: Offset after the last byte to read. Defaults to the end of the file.
+            path: Path of the mapped file, if it can be opened by other processes.
+        """
+        self.buffer = buffer
+        self.start = start
+        self.end = len(buffer) if end is None else end
+        self.path = path
+
+    @classmethod
+    def from_file(cls, file: t.Any) -> MappedInput | None:  # noqa: ANN401
+        """Memory-map the rest of a binary file.
+
+        Args:
+            file: A file object opened in binary mode.
+
+        Returns:
+            The mapped input, starting at the current position of `file`, or None if
+            `file` is not a regular file on disk.
+        """
+        if not isinstance(file, (io.BufferedReader, io.FileIO)):
+            return None
+
+        try:
+            fileno = file.fileno()
+            file_stat = os.fstat(fileno)
+        except (OSError, ValueError):
+            return None
+
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+
+        start = file.tell()
+        if file_stat.st_size <= start:
+            return cls(b"")
+
+        path = file.name if isinstance(file.name, str) else None
+        if path is not None and not (
+            Path(path).is_file() and os.path.samestat(Path(path).stat(), file_stat)
+        ):
+            path = None
+
+        buffer = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        return cls(buffer, start=start, path=path)
+
+    @classmethod
+    def from_path(
+        cls,
+        path: str,
+        start: int = 0,
+        end: int | None = None,
+    ) -> MappedInput:
+        """Memory-map a byte range of a file.
+
+        Args:
+            path: The path of the file.
+            start: Offset of the first byte to read.
+            end: Offset after the last byte to read.
+
+        Returns:
+            The mapped input.
+        """
+        with Path(path).open("rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return cls(b"", path=path)
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, start=start, end=end, path=path)
+
+    def __iter__(self) -> t.Iterator[bytes]:
+        """Iterate over lines.
+
+        Yields:
+            Each line, including its line terminator.
+        """
+        buffer, position, end = self.buffer, self.start, self.end
+        find = buffer.find
+        while position < end:
+            newline = find(_NEWLINE, position, end)
+            line_end = end if newline == -1 else newline + 1
+            yield buffer[position:line_end]
+            position = line_end
+
+    def peek(self, size: int) -> bytes:
+        """Get the first bytes of the input without consuming them.
+
+        Args:
+            size: The number of bytes.
+
+        Returns:
+            Up to `size` bytes.
+        """
+        return self.buffer[self.start : min(self.start + size, self.end)]
+
+    def split(self, lines: int) -> t.Iterator[tuple[int, int]]:
+        """Split the input into byte ranges of whole lines.
+
+        Args:
+            lines: The number of lines in each range.
+
+        Yields:
+            The start and end offset of each range.
+        """
+        buffer, position, end = self.buffer, self.start, self.end
+        find = buffer.find
+        while position < end:
+            range_end = position
+            for _ in range(lines):
+                newline = find(_NEWLINE, range_end, end)
+                if newline == -1:
+                    range_end = end
+                    break
+                range_end = newline + 1
+                if range_end >= end:
+                    break
+            yield position, range_end
+            position = range_end
+
+    def close(self) -> None:
+        """Release the memory map."""
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
@@ -0,0 +1,330 @@
+"""Columnar batch record buffers, backed by Arrow arrays."""
+
+from __future__ import annotations
+
+import importlib.util
+import typing as t
+
+from singer_sdk.helpers._typing import get_datelike_property_type
+
+if t.TYPE_CHECKING:
+    import pyarrow as pa
+
+# Number of records whose values are converted to Arrow arrays together
+_CHUNK_SIZE = 10000
+
+
+def _import_pyarrow() -> t.Any:  # noqa: ANN401
+    if importlib.util.find_spec("pyarrow") is None:
+        msg = "Columnar buffers require the 'pyarrow' package"
+        raise ValueError(msg)
+
+    import pyarrow as pa
+
+    return pa
+
+
+def _property_type(
+    property_schema: dict,
+    *,
+    parse_timestamps: bool,
+) -> pa.DataType | None:
+    pa = _import_pyarrow()
+
+    datelike_type = get_datelike_property_type(property_schema)
+    if datelike_type:
+        if not parse_timestamps:
+            return pa.string()
+        return {
+            "date-time": pa.timestamp("us", tz="UTC"),
+            "date": pa.date32(),
+            "time": pa.time64("us"),
+        }[datelike_type]
+
+    schema_type = property_schema.get("type", [])
+    type_names = [schema_type] if isinstance(schema_type, str) else schema_type
+    type_names = [name for name in type_names if name != "null"]
+    if len(type_names) != 1:
+        return None
+    # Numbers are decoded as decimals, whose precision is inferred from the values
+    return {
+        "boolean": pa.bool_(),
+        "integer": pa.int64(),
+        "string": pa.string(),
+    }.get(type_names[0])
+
+
+def arrow_fields(
+    schema: dict,
+    *,
+    parse_timestamps: bool = True,
+) -> list[tuple[str, pa.DataType | None]]:
+    """Get the Arrow type of each property of a schema.
+
+    Args:
+        schema: An object schema.
+        parse_timestamps: If False, date-like properties are typed as strings.
+
+    Returns:
+        The name and Arrow type of each property. The type is None for properties,
+        such as objects and arrays, whose type is inferred from their values.
+
+    Raises:
+        ValueError: If pyarrow is not installed.
+    """
+    return [
+        (name, _property_type(property_schema, parse_timestamps=parse_timestamps))
+        for name, property_schema in schema.get("properties", {}).items()
+    ]
+
+
+def _common_type(types: set[pa.DataType]) -> pa.DataType | None:
+    """Get the type that the chunks of a column with inferred types are cast to.
+
+    Args:
+        types: The types inferred for the chunks, other than null.
+
+    Returns:
+        The common type, or None if the chunks cannot be cast to one without loss.
+    """
+    pa = _import_pyarrow()
+    if len(types) <= 1:
+        return next(iter(types), pa.null())
+
+    # Decimal and integer chunks are cast to a decimal type that fits all of them
+    if not all(
+        pa.types.is_decimal(data_type) or pa.types.is_integer(data_type)
+        for data_type in types
+    ):
+        return None
+    decimal_types = [data_type for data_type in types if pa.types.is_decimal(data_type)]
+    scale = max(data_type.scale for data_type in decimal_types)
+    integer_digits = max(
+        data_type.precision - data_type.scale
+        if pa.types.is_decimal(data_type)
+        else len(str(2 ** (data_type.bit_width - 1)))
+        for data_type in types
+    )
+    precision = integer_digits + scale
+    if precision > 38:  # noqa: PLR2004
+        return pa.decimal256(precision, scale) if precision <= 76 else None  # noqa: PLR2004
+    return pa.decimal128(precision, scale)
+
+
+class ColumnarRecords:
+    """The records of a batch, stored column by column in Arrow arrays.
+
+    Values are collected per column and converted to Arrow arrays every 10,000
+    records. Properties that are missing from a record are stored as nulls in the
+    table, and left out of the dicts built from it. Columns without a type derived
+    from the schema, such as numbers, objects and arrays, get the type Arrow infers
+    from their values, so numbers decoded as decimals are stored as exact Arrow
+    decimals.
+
+    If a record has a property that is not in the schema, or values do not convert
+    to the type of their column, the batch falls back to a list of dicts.
+
+    Iterating yields the records as dicts, which are built again on each iteration
+    unless the batch fell back to dicts.
+    """
+
+    def __init__(self, fields: list[tuple[str, pa.DataType | None]]) -> None:
+        """Initialize the buffer.
+
+        Args:
+            fields: The name and Arrow type of each column, as from
+                :func:`arrow_fields`.
+        """
+        self.fields = fields
+
+        #: Function applied to each record built from the Arrow arrays.
+        self.on_read: t.Callable[[dict], None] | None = None
+
+        self._names = frozenset(name for name, _ in fields)
+        self._values: dict[str, list] = {name: [] for name, _ in fields}
+        self._arrays: dict[str, list[pa.Array]] = {name: [] for name, _ in fields}
+        self._num_pending = 0
+        self._num_converted = 0
+        self._records: list[dict] | None = None if fields else []
+        # Properties missing from the records that do not have all of them, by index
+        self._missing: dict[int, list[str]] = {}
+
+    def append(self, record: dict) -> None:
+        """Add a record.
+
+        Args:
+            record: The record to add.
+        """
+        if self._records is None and not self._names.issuperset(record):
+            self._fall_back()
+        if self._records is not None:
+            self._records.append(record)
+            return
+
+        if len(record) < len(self._names):
+            self._missing[self._num_converted + self._num_pending] = [
+                name for name in self._values if name not in record
+            ]
+        for name, values in self._values.items():
+            values.append(record.get(name))
+        self._num_pending += 1
+        if self._num_pending >= _CHUNK_SIZE:
+            self._convert_pending()
+
+    def _convert_pending(self) -> None:
+        pa = _import_pyarrow()
+        if not self._num_pending or self._records is not None:
+            return
+
+        try:
+            arrays = {
+                name: pa.array(self._values[name], type=data_type)
+                for name, data_type in self.fields
+            }
+        except (pa.ArrowException, OverflowError, TypeError, ValueError):
+            self._fall_back()
+            return
+
+        for name, array in arrays.items():
+            self._arrays[name].append(array)
+            self._values[name] = []
+        self._num_converted += self._num_pending
+        self._num_pending = 0
+
+    def _fall_back(self) -> None:
+        names = [name for name, _ in self.fields]
+        columns = [
+            [value for array in self._arrays[name] for value in array.to_pylist()]
+            + self._values[name]
+            for name in names
+        ]
+        self._records = [
+            self._drop_missing(index, dict(zip(names, row)))
+            for index, row in enumerate(zip(*columns))
+        ]
+        self._values = {}
+        self._arrays = {}
+        self._missing = {}
+        self._num_pending = self._num_converted = 0
+
+    def _drop_missing(self, index: int, record: dict) -> dict:
+        """Remove the properties that were missing from a record when it was added.
+
+        Args:
+            index: Position of the record in the batch.
+            record: The record built from the columns.
+
+        Returns:
+            The record.
+        """
+        for name in self._missing.get(index, ()):
+            del record[name]
+        return record
+
+    def dict_records(self) -> list[dict] | None:
+        """Get the records if the batch fell back to dicts.
+
+        Returns:
+            The records, or None if they are stored in Arrow arrays.
+        """
+        self._convert_pending()
+        return self._records
+
+    def to_table(self) -> pa.Table | None:
+        """Get the records as an Arrow table.
+
+        Returns:
+            The table, or None if the batch fell back to dicts.
+        """
+        pa = _import_pyarrow()
+        self._convert_pending()
+        if self._records is not None:
+            return None
+
+        columns = []
+        for name, data_type in self.fields:
+            arrays = self._arrays[name]
+            column_type = data_type or _common_type(
+                {array.type for array in arrays if array.type != pa.null()},
+            )
+            if column_type is None:
+                # Inferred types of the chunks cannot be cast to a common type
+                self._fall_back()
+                return None
+            try:
+                columns.append(
+                    pa.chunked_array(
+                        [
+                            array
+                            if array.type == column_type
+                            else array.cast(column_type)
+                            for array in arrays
+                        ],
+                        type=column_type,
+                    ),
+                )
+            except (pa.ArrowException, TypeError, ValueError):
+                self._fall_back()
+                return None
+
+        return pa.Table.from_arrays(columns, names=[name for name, _ in self.fields])
+
+    def __len__(self) -> int:
+        """Count the records.
+
+        Returns:
+            The number of records.
+        """
+        if self._records is not None:
+            return len(self._records)
+        return self._num_converted + self._num_pending
+
+    def __iter__(self) -> t.Iterator[dict]:
+        """Iterate over the records.
+
+        Yields:
+            The records, as dicts.
+        """
+        table = self.to_table()
+        if table is None:
+            yield from self._records or []
+            return
+
+        index = 0
+        for batch in table.to_batches():
+            for record in batch.to_pylist():
+                if self._missing:
+                    self._drop_missing(index, record)
+                index += 1
+                if self.on_read is not None:
+                    self.on_read(record)
+                yield record
+
+
+class TableRecords:
+    """The records of an Arrow table, built as dicts on each iteration."""
+
+    def __init__(self, table: pa.Table) -> None:
+        """Initialize the records.
+
+        Args:
+            table: The table to read the records from.
+        """
+        self.table = table
+
+    def __len__(self) -> int:
+        """Count the records.
+
+        Returns:
+            The number of records.
+        """
+        return self.table.num_rows
+
+    def __iter__(self) -> t.Iterator[dict]:
+        """Iterate over the records.
+
+        Yields:
+            The records, as dicts.
+        """
+        for batch in self.table.to_batches():
+            yield from batch.to_pylist()
@@ -0,0 +1,311 @@
+"""Parallel decoding and validation of Singer messages for targets."""
+
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import queue
+import threading
+import typing as t
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from jsonschema import ValidationError
+
+from singer_sdk._singerlib.json import get_codec
+from singer_sdk._singerlib.messages import SingerMessageType
+from singer_sdk._singerlib.mmap_input import MappedInput
+
+if t.TYPE_CHECKING:
+    from jsonschema import FormatChecker
+    from jsonschema.protocols import Validator
+
+    _SchemaSpec = t.Tuple[int, t.Type[Validator], t.Optional[FormatChecker], dict]
+    _ChunkResult = t.List[t.Tuple[t.Union[dict, str, bytes], bool]]
+
+_END = object()
+
+# Validators built in a worker process, by schema token
+_worker_validators: dict[int, Validator] = {}
+
+# Files mapped in a worker process, by path
+_worker_inputs: dict[str, MappedInput] = {}
+
+
+def _get_worker_validator(spec: _SchemaSpec) -> Validator:
+    token, validator_class, format_checker, schema = spec
+    if token not in _worker_validators:
+        _worker_validators[token] = validator_class(
+            schema,
+            format_checker=format_checker,
+        )
+    return _worker_validators[token]
+
+
+def decode_chunk(
+    codec_name: str,
+    lines: t.Iterable[str | bytes],
+    schemas: dict[str, _SchemaSpec],
+) -> _ChunkResult:
+    """Decode a chunk of Singer messages, validating records where possible.
+
+    Runs in a worker process. Lines that cannot be decoded are returned as is, so the
+    error can be raised by the target in the same position of the input.
+
+    Args:
+        codec_name: Name of the JSON codec used to decode lines.
+        lines: Lines of input, in order.
+        schemas: Schemas to validate records against, by stream name.
+
+    Returns:
+        The decoded messages, or undecodable lines, with a flag that is True if the
+        message is a RECORD that is valid according to the schema of its stream.
+    """
+    codec = get_codec(codec_name)
+    results: _ChunkResult = []
+    for line in lines:
+        try:
+            message = codec.loads(line)
+        except ValueError:
+            results.append((line, False))
+            continue
+
+        validated = False
+        if (
+            isinstance(message, dict)
+            and message.get("type") == SingerMessageType.RECORD
+            and message.get("stream") in schemas
+            and isinstance(message.get("record"), dict)
+        ):
+            validator = _get_worker_validator(schemas[message["stream"]])
+            try:
+                validator.validate(message["record"])
+            except ValidationError:
+                pass
+            else:
+                validated = True
+
+        results.append((message, validated))
+    return results
+
+
+def decode_range(
+    codec_name: str,
+    path: str,
+    start: int,
+    end: int,
+    schemas: dict[str, _SchemaSpec],
+) -> _ChunkResult:
+    """Decode the Singer messages in a byte range of a file.
+
+    Runs in a worker process, which memory-maps the file itself so that lines are
+    never copied between processes.
+
+    Args:
+        codec_name: Name of the JSON codec used to decode lines.
+        path: Path of the file.
+        start: Offset of the first line in the range.
+        end: Offset after the last line in the range.
+        schemas: Schemas to validate records against, by stream name.
+
+    Returns:
+        The decoded messages, as returned by :func:`decode_chunk`.
+    """
+    if path not in _worker_inputs:
+        _worker_inputs[path] = MappedInput.from_path(path)
+    mapped = _worker_inputs[path]
+    lines = MappedInput(mapped.buffer, start=start, end=end)
+    return decode_chunk(codec_name, lines, schemas)
+
+
+class DecodePipeline:
+    """Decode messages in a process pool while preserving their order.
+
+    A reader thread splits the input into chunks of lines, which are decoded by a
+    pool of worker processes. Records of streams registered with :meth:`set_schemas`
+    are also validated by the workers. Decoded messages are yielded in the exact
+    order of the input, so STATE messages stay behind the records that precede them.
+    """
+
+    def __init__(
+        self,
+        file_input: t.Iterable[str | bytes],
+        *,
+        codec_name: str,
+        workers: int,
+        chunk_size: int,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            file_input: Readable stream of messages, each on a separate line.
+            codec_name: Name of the JSON codec used by the worker processes.
+            workers: Number of worker processes.
+            chunk_size: Number of lines decoded at a time by a worker.
+        """
+        self.file_input = file_input
+        self.codec_name = codec_name
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+        self._tokens = itertools.count()
+        self._schemas: dict[str, _SchemaSpec] = {}
+        self._pending: queue.Queue = queue.Queue(maxsize=2 * workers)
+        self._stop = threading.Event()
+        self._executor: ProcessPoolExecutor | None = None
+        self._reader: threading.Thread | None = None
+
+    def set_schemas(
+        self,
+        schemas: dict[str, tuple[type[Validator], FormatChecker | None, dict]],
+    ) -> None:
+        """Set the schemas that worker processes validate records against.
+
+        Chunks that are already being decoded keep the schemas they were submitted
+        with. Consumers should check that the schema returned with a message is
+        still current before relying on the validation.
+
+        Args:
+            schemas: Validator class, format checker and schema, by stream name.
+        """
+        specs: dict[str, _SchemaSpec] = {}
+        for stream_name, (validator_class, format_checker, schema) in schemas.items():
+            previous = self._schemas.get(stream_name)
+            if (
+                previous is not None
+                and previous[1] is validator_class
+                and previous[2] is format_checker
+                and previous[3] is schema
+            ):
+                specs[stream_name] = previous
+                continue
+            token = next(self._tokens)
+            specs[stream_name] = (token, validator_class, format_checker, schema)
+        self._schemas = specs
+
+    def _put(self, item: t.Any) -> bool:  # noqa: ANN401
+        while not self._stop.is_set():
+            try:
+                self._pending.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def _submit(self, lines: list[str | bytes]) -> bool:
+        assert self._executor is not None  # noqa: S101
+        schemas = self._schemas
+        future = self._executor.submit(decode_chunk, self.codec_name, lines, schemas)
+        return self._put((future, schemas))
+
+    def _submit_range(self, path: str, start: int, end: int) -> bool:
+        assert self._executor is not None  # noqa: S101
+        schemas = self._schemas
+        future = self._executor.submit(
+            decode_range,
+            self.codec_name,
+            path,
+            start,
+            end,
+            schemas,
+        )
+        return self._put((future, schemas))
+
+    def _read_lines(self) -> bool:
+        chunk: list[str | bytes] = []
+        for line in self.file_input:
+            chunk.append(line)
+            if len(chunk) >= self.chunk_size:
+                if not self._submit(chunk):
+                    return False
+                chunk = []
+        return not chunk or self._submit(chunk)
+
+    def _read_ranges(self, mapped_input: MappedInput, path: str) -> bool:
+        # Workers map the file themselves and decode byte ranges of it
+        for start, end in mapped_input.split(self.chunk_size):
+            if not self._submit_range(path, start, end):
+                return False
+        return True
+
+    def _read(self) -> None:
+        try:
+            if isinstance(self.file_input, MappedInput) and self.file_input.path:
+                completed = self._read_ranges(self.file_input, self.file_input.path)
+            else:
+                completed = self._read_lines()
+        except BaseException as exc:  # noqa: BLE001
+            self._put(exc)
+        else:
+            if completed:
+                self._put(_END)
+
+    def start(self) -> None:
+        """Start the worker processes and the reader thread."""
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._reader = threading.Thread(
+            target=self._read,
+            name="singer-sdk-decode-reader",
+            daemon=True,
+        )
+        self._reader.start()
+
+    def close(self) -> None:
+        """Stop reading input and shut down the worker processes."""
+        # The reader thread may be blocked on input, it exits on its next submission
+        self._stop.set()
+        # Cancel chunks that no worker has picked up yet
+        while True:
+            try:
+                item = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, tuple):
+                item[0].cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> DecodePipeline:
+        """Start the pipeline.
+
+        Returns:
+            The pipeline.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Shut down the pipeline.
+
+        Args:
+            args: Exception details, if any.
+        """
+        self.close()
+
+    def __iter__(self) -> t.Iterator[tuple[dict | str | bytes, dict | None]]:
+        """Iterate over decoded messages, in input order.
+
+        Yields:
+            Each decoded message, or the line if it could not be decoded, with the
+            schema the message was validated against if it is a valid RECORD.
+
+        Raises:
+            BaseException: If reading the input failed.
+        """
+        while True:
+            item = self._pending.get()
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+
+            future: Future[_ChunkResult] = item[0]
+            schemas: dict[str, _SchemaSpec] = item[1]
+            for message, validated in future.result():
+                if validated:
+                    # The submitted schema object, not the copy the worker received
+                    yield message, schemas[message["stream"]][3]  # type: ignore[index]
+                else:
+                    yield message, None
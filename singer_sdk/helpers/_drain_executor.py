@@ -0,0 +1,190 @@
+"""Long-lived thread pool for draining target sinks."""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+if t.TYPE_CHECKING:
+    from singer_sdk.sinks import Sink
+
+# Relative change in smoothed throughput that is treated as noise
+_THROUGHPUT_TOLERANCE = 0.1
+# Weight of the latest round of drains in the smoothed throughput
+_THROUGHPUT_SMOOTHING = 0.3
+# Rounds of drains measured at a parallelism before it is compared to another
+_ROUNDS_PER_MEASUREMENT = 3
+
+
+class DrainExecutor:
+    """Drain sinks in a thread pool that lives as long as the target.
+
+    The number of sinks drained at once adapts to the drain throughput of rounds of
+    drains that were limited by the current parallelism, smoothed with an exponential
+    moving average. Parallelism starts at `max_workers`, and is only changed once the
+    smoothed throughput moved by more than 10%: it is then measured again, and moved
+    one step at a time, down if throughput dropped and up if it rose, as long as each
+    step improves throughput by more than 10%. A step that does not is undone, and
+    parallelism stays there until throughput moves again. It always stays between 1
+    and `max_workers`.
+
+    Sinks that share a :attr:`~singer_sdk.Sink.drain_concurrency_group` are never
+    drained more than :attr:`~singer_sdk.Sink.max_concurrent_drains` at a time.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of sinks drained at the same time.
+        """
+        self.max_workers = max_workers
+        self.parallelism = max_workers
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="singer-sdk-drain",
+        )
+        self._group_limits: dict[t.Hashable, threading.BoundedSemaphore] = {}
+        self._group_limits_lock = threading.Lock()
+
+        # Smoothed throughput of the rounds drained at the current parallelism
+        self._throughput = 0.0
+        self._rounds = 0
+        # Smoothed throughput that the current one is compared to
+        self._reference: float | None = None
+        # Direction of the parallelism steps being tried, or 0 once settled
+        self._direction = 0
+        self._previous_parallelism = max_workers
+
+    def _group_limit(self, sink: Sink) -> threading.BoundedSemaphore | None:
+        if sink.max_concurrent_drains <= 0:
+            return None
+
+        group = sink.drain_concurrency_group
+        with self._group_limits_lock:
+            if group not in self._group_limits:
+                self._group_limits[group] = threading.BoundedSemaphore(
+                    sink.max_concurrent_drains,
+                )
+            return self._group_limits[group]
+
+    def submit(
+        self,
+        sink: Sink,
+        fn: t.Callable[..., None],
+        *args: t.Any,
+        after: Future | None = None,
+    ) -> Future:
+        """Schedule a drain of a sink.
+
+        Args:
+            sink: The sink to drain.
+            fn: The function that drains the sink.
+            args: Arguments to `fn`.
+            after: A drain that must be done first. Its error, if any, is raised
+                instead of running `fn`.
+
+        Returns:
+            A future for the drain.
+        """
+        limit = self._group_limit(sink)
+
+        def _drain() -> None:
+            if after is not None:
+                after.result()
+            if limit is None:
+                fn(*args)
+                return
+            with limit:
+                fn(*args)
+
+        return self._pool.submit(_drain)
+
+    def drain(self, sinks: t.Sequence[Sink], fn: t.Callable[[Sink], None]) -> None:
+        """Drain sinks in parallel and wait until all of them are drained.
+
+        Args:
+            sinks: The sinks to drain.
+            fn: The function that drains a sink.
+        """
+        pending = [sink for sink in sinks if sink.current_size]
+        records = sum(sink.current_size for sink in pending)
+        limited = len(pending) > self.parallelism
+        parallelism = self.parallelism
+
+        started_at = time.perf_counter()
+        running: set[Future] = set()
+        try:
+            for sink in pending:
+                if len(running) >= parallelism:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                running.add(self.submit(sink, fn, sink))
+
+            for future in running:
+                future.result()
+        finally:
+            wait(running)
+
+        if limited and records:
+            self._adapt(records / max(time.perf_counter() - started_at, 1e-9))
+
+    def _adapt(self, throughput: float) -> None:
+        """Move parallelism towards higher drain throughput.
+
+        Args:
+            throughput: Records drained per second in the last round.
+        """
+        if self._rounds:
+            self._throughput += _THROUGHPUT_SMOOTHING * (throughput - self._throughput)
+        else:
+            self._throughput = throughput
+        self._rounds += 1
+        if self._rounds < _ROUNDS_PER_MEASUREMENT:
+            return
+
+        smoothed = self._throughput
+        reference = self._reference
+        if reference is None:
+            # The current parallelism is measured
+            self._reference = smoothed
+            if self._direction:
+                self._step()
+            return
+
+        change = (smoothed - reference) / reference
+        if not self._direction:
+            if abs(change) <= _THROUGHPUT_TOLERANCE:
+                return
+            # Throughput moved, so measure it again before trying other steps
+            self._direction = -1 if change < 0 else 1
+            self._reference = None
+            self._rounds = 0
+        elif change > _THROUGHPUT_TOLERANCE:
+            self._reference = smoothed
+            self._step()
+        else:
+            # The last step did not help, so undo it and settle
+            self.parallelism = self._previous_parallelism
+            self._direction = 0
+            self._reference = None
+            self._rounds = 0
+
+    def _step(self) -> None:
+        """Move parallelism one step in the current direction, or settle."""
+        parallelism = min(max(self.parallelism + self._direction, 1), self.max_workers)
+        if parallelism == self.parallelism:
+            self._direction = 0
+            return
+
+        self._previous_parallelism = self.parallelism
+        self.parallelism = parallelism
+        self._rounds = 0
+
+    def shutdown(self) -> None:
+        """Wait for scheduled drains and stop the worker threads."""
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,96 @@
+"""Read several sources concurrently, yielding their items in order."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+T = t.TypeVar("T")
+
+# Seconds between checks that the consumer is still reading
+_POLL_INTERVAL = 0.1
+
+_DONE = object()
+
+
+class _Error(t.NamedTuple):
+    exc: BaseException
+
+
+def _put(items: queue.Queue, item: t.Any, stop: threading.Event) -> bool:  # noqa: ANN401
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=_POLL_INTERVAL)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _read(
+    source: t.Callable[[], t.Iterable],
+    items: queue.Queue,
+    stop: threading.Event,
+) -> None:
+    if stop.is_set():
+        return
+    try:
+        for item in source():
+            if not _put(items, item, stop):
+                return
+    except BaseException as exc:  # noqa: BLE001
+        _put(items, _Error(exc), stop)
+    else:
+        _put(items, _DONE, stop)
+
+
+def prefetch(
+    sources: t.Sequence[t.Callable[[], t.Iterable[T]]],
+    *,
+    max_workers: int,
+    max_pending: int = 2,
+) -> t.Iterator[T]:
+    """Read sources in a thread pool, and yield their items source by source.
+
+    Up to `max_workers` sources are read at once. Each source is read at most
+    `max_pending` items ahead of the consumer, so memory use stays bounded.
+
+    Args:
+        sources: Functions that return the iterables to read, such as file readers.
+        max_workers: Maximum number of sources read at the same time.
+        max_pending: Maximum number of items read ahead for each source.
+
+    Yields:
+        The items of the first source, then of the second source, and so on.
+
+    Raises:
+        BaseException: The first error raised while reading a source.
+    """
+    stop = threading.Event()
+    pending: list[queue.Queue] = []
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="singer-sdk-prefetch",
+    ) as pool:
+        try:
+            next_source = 0
+            while next_source < len(sources) or pending:
+                while next_source < len(sources) and len(pending) < max_workers:
+                    items: queue.Queue = queue.Queue(maxsize=max_pending)
+                    pool.submit(_read, sources[next_source], items, stop)
+                    pending.append(items)
+                    next_source += 1
+
+                items = pending.pop(0)
+                while True:
+                    item = items.get()
+                    if item is _DONE:
+                        break
+                    if isinstance(item, _Error):
+                        raise item.exc
+                    yield item
+        finally:
+            # Readers of sources that are not consumed stop at their next item
+            stop.set()
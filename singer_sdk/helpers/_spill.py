@@ -0,0 +1,105 @@
+"""Batch record buffers that spill to disk."""
+
+from __future__ import annotations
+
+import gzip
+import pickle
+import tempfile
+import typing as t
+
+# Number of records pickled together in the temporary file
+_CHUNK_SIZE = 1000
+
+
+class SpilledRecords:
+    """The records of a batch, partly kept in memory and partly in a temporary file.
+
+    Iterating yields the records kept in memory, then the spilled records, in the
+    order they were added. Spilled records are pickled to a gzip-compressed
+    temporary file, so they are read back with the same Python types, such as
+    parsed datetimes or decimals. Each iteration reads them from disk again, as new
+    objects.
+    """
+
+    def __init__(self, records: list[dict]) -> None:
+        """Initialize the buffer.
+
+        Args:
+            records: The records kept in memory.
+        """
+        self.in_memory = records
+        self.spilled_count = 0
+
+        #: Function applied to each spilled record as it is read back.
+        self.on_read: t.Callable[[dict], None] | None = None
+
+        self._file = tempfile.TemporaryFile(prefix="singer-sdk-spill-")
+        self._writer: gzip.GzipFile | None = gzip.GzipFile(
+            fileobj=self._file,
+            mode="wb",
+            compresslevel=1,
+        )
+        self._chunk: list[dict] = []
+
+    def append(self, record: dict) -> None:
+        """Spill a record.
+
+        Args:
+            record: The record to add.
+
+        Raises:
+            RuntimeError: If the records were already read.
+        """
+        if self._writer is None:
+            msg = "Cannot add records to a spilled batch after reading it"
+            raise RuntimeError(msg)
+
+        self._chunk.append(record)
+        self.spilled_count += 1
+        if len(self._chunk) >= _CHUNK_SIZE:
+            self._write_chunk()
+
+    def _write_chunk(self) -> None:
+        if self._chunk and self._writer is not None:
+            pickle.dump(self._chunk, self._writer, protocol=pickle.HIGHEST_PROTOCOL)
+            self._chunk = []
+
+    def __len__(self) -> int:
+        """Count the records.
+
+        Returns:
+            The number of records, in memory and spilled.
+        """
+        return len(self.in_memory) + self.spilled_count
+
+    def __iter__(self) -> t.Iterator[dict]:
+        """Iterate over the records.
+
+        Yields:
+            The records in memory, then the spilled records.
+        """
+        yield from self.in_memory
+
+        if self._writer is not None:
+            self._write_chunk()
+            self._writer.close()
+            self._writer = None
+
+        self._file.seek(0)
+        with gzip.GzipFile(fileobj=self._file, mode="rb") as reader:
+            while True:
+                try:
+                    chunk = pickle.load(reader)  # noqa: S301
+                except EOFError:
+                    break
+                for record in chunk:
+                    if self.on_read is not None:
+                        self.on_read(record)
+                    yield record
+
+    def close(self) -> None:
+        """Delete the temporary file."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._file.close()
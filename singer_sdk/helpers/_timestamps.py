@@ -0,0 +1,269 @@
+"""Parsing of date-like record values, planned once per schema."""
+
+from __future__ import annotations
+
+import functools
+import typing as t
+
+from singer_sdk.helpers._compat import (
+    date_fromisoformat,
+    datetime_fromisoformat,
+    time_fromisoformat,
+)
+from singer_sdk.helpers._typing import (
+    get_datelike_property_type,
+    handle_invalid_timestamp_in_record,
+)
+
+if t.TYPE_CHECKING:
+    import logging
+
+    from singer_sdk.helpers._typing import DatetimeErrorTreatmentEnum
+
+# Dates and times repeat a lot within a stream, so recently parsed values are reused
+_PARSE_CACHE_SIZE = 4096
+
+_PARSERS: dict[str, t.Callable[[t.Any], t.Any]] = {
+    "date-time": datetime_fromisoformat,
+    "date": functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)(date_fromisoformat),
+    "time": functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)(time_fromisoformat),
+}
+
+
+class FieldPlan(t.NamedTuple):
+    """How to parse the date-like values of a field."""
+
+    #: 'date-time', 'date' or 'time' if the field value itself is date-like.
+    kind: str | None = None
+
+    #: Plans for the properties of an object value.
+    properties: tuple[tuple[str, FieldPlan], ...] = ()
+
+    #: Plan for the items of an array value.
+    items: FieldPlan | None = None
+
+
+def _find_subschema(property_schema: dict, keyword: str) -> t.Any:  # noqa: ANN401
+    if keyword in property_schema:
+        return property_schema[keyword]
+    for subschema in property_schema.get("anyOf", []):
+        if keyword in subschema:
+            return subschema[keyword]
+    return None
+
+
+def _plan_field(property_schema: dict, *, nested: bool) -> FieldPlan | None:
+    kind = get_datelike_property_type(property_schema)
+    if kind or not nested:
+        return FieldPlan(kind=kind) if kind else None
+
+    properties = _find_subschema(property_schema, "properties")
+    if isinstance(properties, dict):
+        fields = plan_properties(properties, nested=nested)
+        return FieldPlan(properties=fields) if fields else None
+
+    items = _find_subschema(property_schema, "items")
+    if isinstance(items, dict):
+        item_plan = _plan_field(items, nested=nested)
+        return FieldPlan(items=item_plan) if item_plan else None
+
+    return None
+
+
+def plan_properties(
+    properties: dict[str, dict],
+    *,
+    nested: bool = False,
+) -> tuple[tuple[str, FieldPlan], ...]:
+    """Find the date-like fields of a schema.
+
+    Args:
+        properties: The `properties` of an object schema.
+        nested: Also find date-like fields in nested objects and arrays.
+
+    Returns:
+        The field name and plan of each property that contains date-like values.
+    """
+    plans = []
+    for name, property_schema in properties.items():
+        field_plan = _plan_field(property_schema, nested=nested)
+        if field_plan is not None:
+            plans.append((name, field_plan))
+    return tuple(plans)
+
+
+class SchemaPlan(t.NamedTuple):
+    """How to parse the date-like values of the records of a schema."""
+
+    #: Names of the schema properties.
+    property_names: frozenset[str]
+
+    #: Plans of the top-level fields that contain date-like values.
+    fields: tuple[tuple[str, FieldPlan], ...]
+
+
+def plan_schema(schema: dict, *, nested: bool = False) -> SchemaPlan:
+    """Plan how to parse the date-like values of the records of a schema.
+
+    Args:
+        schema: An object schema.
+        nested: Also parse date-like values in nested objects and arrays.
+
+    Returns:
+        The parsing plan.
+    """
+    properties = schema["properties"]
+    return SchemaPlan(
+        property_names=frozenset(properties),
+        fields=plan_properties(properties, nested=nested),
+    )
+
+
+def parse_value(
+    record: dict,
+    value: t.Any,  # noqa: ANN401
+    kind: str,
+    breadcrumb: list[str],
+    treatment: DatetimeErrorTreatmentEnum,
+    logger: logging.Logger,
+) -> t.Any:  # noqa: ANN401
+    """Parse a single date-like value, repairing or erroring on failure.
+
+    Args:
+        record: The record the value belongs to.
+        value: The value to parse.
+        kind: 'date-time', 'date' or 'time'.
+        breadcrumb: Path of the value in the record.
+        treatment: How to handle values that cannot be parsed.
+        logger: Logger for repaired values.
+
+    Returns:
+        The parsed value, or the repaired value if it cannot be parsed.
+    """
+    if value is None:
+        return None
+    try:
+        return _PARSERS[kind](value)
+    except ValueError as ex:
+        return handle_invalid_timestamp_in_record(
+            record,
+            breadcrumb,
+            value,
+            kind,
+            ex,
+            treatment,
+            logger,
+        )
+
+
+def parse_fields(
+    record: dict,
+    target: dict,
+    fields: tuple[tuple[str, FieldPlan], ...],
+    breadcrumb: list[str],
+    treatment: DatetimeErrorTreatmentEnum,
+    logger: logging.Logger,
+) -> None:
+    """Parse the planned fields of an object in place.
+
+    Nested objects and arrays are replaced by parsed copies, so that shallow copies
+    of the record keep their unparsed values.
+
+    Args:
+        record: The record the object belongs to.
+        target: The object to update, which is the record itself at the top level.
+        fields: The plans of the object fields.
+        breadcrumb: Path of the object in the record.
+        treatment: How to handle values that cannot be parsed.
+        logger: Logger for repaired values.
+    """
+    for name, field_plan in fields:
+        if name in target:
+            target[name] = _parse_field(
+                record,
+                target[name],
+                field_plan,
+                [*breadcrumb, name],
+                treatment,
+                logger,
+            )
+
+
+def parse_columns(
+    records: t.Sequence[dict],
+    fields: tuple[tuple[str, FieldPlan], ...],
+    treatment: DatetimeErrorTreatmentEnum,
+    logger: logging.Logger,
+) -> None:
+    """Parse the planned fields of a batch of records in place, one field at a time.
+
+    Each distinct value of a top-level date-like field is parsed, or repaired, once
+    per batch. Fields with nested date-like values are parsed record by record.
+
+    Args:
+        records: The records of the batch.
+        fields: The plans of the top-level record fields.
+        treatment: How to handle values that cannot be parsed.
+        logger: Logger for repaired values.
+    """
+    nested_fields = tuple(
+        (name, field_plan) for name, field_plan in fields if not field_plan.kind
+    )
+    for name, field_plan in fields:
+        if field_plan.kind:
+            _parse_column(records, name, field_plan.kind, treatment, logger)
+
+    if nested_fields:
+        for record in records:
+            parse_fields(record, record, nested_fields, [], treatment, logger)
+
+
+def _parse_column(
+    records: t.Sequence[dict],
+    name: str,
+    kind: str,
+    treatment: DatetimeErrorTreatmentEnum,
+    logger: logging.Logger,
+) -> None:
+    parsed: dict[t.Any, t.Any] = {}
+    for record in records:
+        if name not in record:
+            continue
+        value = record[name]
+        try:
+            record[name] = parsed[value]
+        except KeyError:
+            record[name] = parsed[value] = parse_value(
+                record,
+                value,
+                kind,
+                [name],
+                treatment,
+                logger,
+            )
+
+
+def _parse_field(
+    record: dict,
+    value: t.Any,  # noqa: ANN401
+    field_plan: FieldPlan,
+    breadcrumb: list[str],
+    treatment: DatetimeErrorTreatmentEnum,
+    logger: logging.Logger,
+) -> t.Any:  # noqa: ANN401
+    if field_plan.kind:
+        return parse_value(
+            record, value, field_plan.kind, breadcrumb, treatment, logger
+        )
+
+    if field_plan.properties and isinstance(value, dict):
+        value = dict(value)
+        parse_fields(
+            record, value, field_plan.properties, breadcrumb, treatment, logger
+        )
+    elif field_plan.items and isinstance(value, list):
+        value = [
+            _parse_field(record, item, field_plan.items, breadcrumb, treatment, logger)
+            for item in value
+        ]
+    return value
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import collections
 import json
+import threading
 import typing as t
 from pathlib import Path, PurePath
 
 import pendulum
 
+_K = t.TypeVar("_K")
+_V = t.TypeVar("_V")
+
 
 def read_json_file(path: PurePath | str) -> dict[str, t.Any]:
     """Read json file, throwing an error if missing."""
@@ -28,3 +33,62 @@ def read_json_file(path: PurePath | str) -> dict[str, t.Any]:
 def utc_now() -> pendulum.DateTime:
     """Return current time in UTC."""
     return pendulum.now(tz="UTC")
+
+
+def approximate_size(value: t.Any) -> int:  # noqa: ANN401
+    """Approximate the size in bytes of a value serialized as JSON.
+
+    Strings, containers and keys are measured, other values count as 8 bytes.
+    """
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, dict):
+        return 2 + sum(len(key) + 4 + approximate_size(v) for key, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 2 + sum(approximate_size(item) + 1 for item in value)
+    return 8
+
+
+class BoundedCache(t.Generic[_K, _V]):
+    """A thread-safe cache that evicts its least recently used entries.
+
+    Args:
+        maxsize: The maximum number of entries kept.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: collections.OrderedDict[_K, _V] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: _K, factory: t.Callable[[], _V]) -> _V:
+        """Get the value of a key, created by a factory if it is not cached.
+
+        The factory is called outside of the lock, so two threads may both create
+        a missing value, and the last one wins.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        value = factory()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: object) -> bool:
+        """Whether a key is cached."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """The number of cached entries."""
+        return len(self._entries)
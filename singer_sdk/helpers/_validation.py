@@ -0,0 +1,404 @@
+"""Fast JSON Schema validation of records.
+
+Record checks answer whether a record is valid as quickly as possible. They never
+accept a record that the reference :class:`jsonschema.Draft7Validator` would reject,
+but they may reject valid records that use schema features they do not support.
+Records that fail a check are validated again by the reference validator, which
+decides and reports the error, so checks never change which records are accepted.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import importlib.util
+import json
+import numbers
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+from jsonschema import Draft7Validator
+
+from singer_sdk.helpers._util import BoundedCache
+
+if t.TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from jsonschema.protocols import Validator
+
+    RecordCheck = t.Callable[[t.Any], bool]
+
+JSONSCHEMA_BACKEND = "jsonschema"
+COMPILED_BACKEND = "compiled"
+FASTJSONSCHEMA_BACKEND = "fastjsonschema"
+
+VALIDATION_BACKENDS = (JSONSCHEMA_BACKEND, COMPILED_BACKEND, FASTJSONSCHEMA_BACKEND)
+
+FULL_VALIDATION = "full"
+SAMPLE_VALIDATION = "sample"
+BATCH_VALIDATION = "batch"
+
+#: Number of records validated together in the background in `batch` mode.
+BATCH_VALIDATION_CHUNK_SIZE = 1000
+
+# Keywords that do not affect validation
+_ANNOTATIONS = frozenset(
+    {
+        "$comment",
+        "$schema",
+        "default",
+        "definitions",
+        "description",
+        "examples",
+        "readOnly",
+        "title",
+        "writeOnly",
+    },
+)
+
+_COMPILED_KEYWORDS = frozenset(
+    {
+        "additionalProperties",
+        "allOf",
+        "anyOf",
+        "exclusiveMaximum",
+        "exclusiveMinimum",
+        "format",
+        "items",
+        "maxItems",
+        "maxLength",
+        "maximum",
+        "minItems",
+        "minLength",
+        "minimum",
+        "properties",
+        "required",
+        "type",
+    },
+)
+
+_MISSING = object()
+
+
+def _is_integer(value: t.Any) -> bool:  # noqa: ANN401
+    return (isinstance(value, int) and not isinstance(value, bool)) or (
+        isinstance(value, float) and value.is_integer()
+    )
+
+
+def _is_number(value: t.Any) -> bool:  # noqa: ANN401
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+_TYPE_CHECKS: dict[str, RecordCheck] = {
+    "array": lambda value: isinstance(value, list),
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": _is_integer,
+    "null": lambda value: value is None,
+    "number": _is_number,
+    "object": lambda value: isinstance(value, dict),
+    "string": lambda value: isinstance(value, str),
+}
+
+
+def schema_fingerprint(schema: dict) -> str:
+    """Get a stable hash of a schema.
+
+    Args:
+        schema: A JSON Schema.
+
+    Returns:
+        The hex digest of the canonical JSON of the schema.
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class _SchemaCompiler:
+    """Compile a Draft 7 schema into nested closures."""
+
+    def __init__(self, validator: Validator) -> None:
+        self.validator = validator
+        self.format_checker = validator.format_checker
+
+    def compile_schema(self, schema: dict | bool) -> RecordCheck:  # noqa: C901, PLR0912
+        if schema is True:
+            return lambda _: True
+        if schema is False:
+            return lambda _: False
+
+        keywords = set(schema) - _ANNOTATIONS
+        if not self._is_supported(schema, keywords):
+            # Unsupported keywords, such as $ref, are left to the reference validator
+            return self.validator.evolve(schema=schema).is_valid
+
+        checks: list[RecordCheck] = []
+        if "type" in schema:
+            checks.append(self._compile_type(schema["type"]))
+        if "format" in schema:
+            checks.extend(self._compile_format(schema["format"]))
+        if keywords & {"properties", "required", "additionalProperties"}:
+            checks.append(self._compile_object(schema))
+        if keywords & {"items", "minItems", "maxItems"}:
+            checks.append(self._compile_array(schema))
+        if keywords & {"minLength", "maxLength"}:
+            checks.append(self._compile_length(schema))
+        if keywords & {"minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"}:
+            checks.append(self._compile_bounds(schema))
+        if "anyOf" in schema:
+            any_of = [self.compile_schema(subschema) for subschema in schema["anyOf"]]
+            checks.append(lambda value: any(check(value) for check in any_of))
+        if "allOf" in schema:
+            checks.extend(
+                self.compile_schema(subschema) for subschema in schema["allOf"]
+            )
+
+        if not checks:
+            return lambda _: True
+        if len(checks) == 1:
+            return checks[0]
+        return lambda value: all(check(value) for check in checks)
+
+    @staticmethod
+    def _is_supported(schema: dict, keywords: set[str]) -> bool:
+        if not keywords <= _COMPILED_KEYWORDS or isinstance(schema.get("items"), list):
+            return False
+        schema_type = schema.get("type", [])
+        type_names = [schema_type] if isinstance(schema_type, str) else schema_type
+        return all(name in _TYPE_CHECKS for name in type_names)
+
+    @staticmethod
+    def _compile_type(schema_type: str | list[str]) -> RecordCheck:
+        if isinstance(schema_type, str):
+            return _TYPE_CHECKS[schema_type]
+
+        type_checks = [_TYPE_CHECKS[name] for name in schema_type]
+        if "null" in schema_type:
+            # Nullable types are the most common union in Singer schemas
+            others = [_TYPE_CHECKS[name] for name in schema_type if name != "null"]
+            return lambda value: value is None or any(check(value) for check in others)
+        return lambda value: any(check(value) for check in type_checks)
+
+    def _compile_format(self, schema_format: str) -> list[RecordCheck]:
+        format_checker = self.format_checker
+        if format_checker is None or schema_format not in format_checker.checkers:
+            return []
+        return [lambda value: format_checker.conforms(value, schema_format)]
+
+    def _compile_object(self, schema: dict) -> RecordCheck:
+        properties = [
+            (name, self.compile_schema(subschema))
+            for name, subschema in schema.get("properties", {}).items()
+        ]
+        property_names = frozenset(schema.get("properties", {}))
+        required = tuple(schema.get("required", ()))
+        additional = schema.get("additionalProperties", True)
+        additional_check = (
+            None if additional is True else self.compile_schema(additional)
+        )
+
+        def check(value: t.Any) -> bool:  # noqa: ANN401
+            if not isinstance(value, dict):
+                return True
+            for name in required:
+                if name not in value:
+                    return False
+            for name, property_check in properties:
+                property_value = value.get(name, _MISSING)
+                if property_value is not _MISSING and not property_check(
+                    property_value,
+                ):
+                    return False
+            if additional_check is not None:
+                for name, property_value in value.items():
+                    if name not in property_names and not additional_check(
+                        property_value,
+                    ):
+                        return False
+            return True
+
+        return check
+
+    def _compile_array(self, schema: dict) -> RecordCheck:
+        items = schema.get("items", True)
+        item_check = None if items is True else self.compile_schema(items)
+        min_items = schema.get("minItems", 0)
+        max_items = schema.get("maxItems")
+
+        def check(value: t.Any) -> bool:  # noqa: ANN401
+            if not isinstance(value, list):
+                return True
+            if len(value) < min_items or (
+                max_items is not None and len(value) > max_items
+            ):
+                return False
+            return item_check is None or all(item_check(item) for item in value)
+
+        return check
+
+    @staticmethod
+    def _compile_length(schema: dict) -> RecordCheck:
+        min_length = schema.get("minLength", 0)
+        max_length = schema.get("maxLength")
+
+        def check(value: t.Any) -> bool:  # noqa: ANN401
+            if not isinstance(value, str):
+                return True
+            return len(value) >= min_length and (
+                max_length is None or len(value) <= max_length
+            )
+
+        return check
+
+    @staticmethod
+    def _compile_bounds(schema: dict) -> RecordCheck:
+        minimum = schema.get("minimum")
+        maximum = schema.get("maximum")
+        exclusive_minimum = schema.get("exclusiveMinimum")
+        exclusive_maximum = schema.get("exclusiveMaximum")
+
+        def check(value: t.Any) -> bool:  # noqa: ANN401
+            if not _is_number(value):
+                return True
+            return (
+                (minimum is None or value >= minimum)
+                and (maximum is None or value <= maximum)
+                and (exclusive_minimum is None or value > exclusive_minimum)
+                and (exclusive_maximum is None or value < exclusive_maximum)
+            )
+
+        return check
+
+
+def compile_record_check(schema: dict) -> RecordCheck:
+    """Compile a schema into a record check.
+
+    Args:
+        schema: A Draft 7 JSON Schema.
+
+    Returns:
+        A function that returns True if a record is valid.
+    """
+    validator = Draft7Validator(schema, format_checker=Draft7Validator.FORMAT_CHECKER)
+    return _SchemaCompiler(validator).compile_schema(schema)
+
+
+def _fastjsonschema_record_check(schema: dict) -> RecordCheck:
+    if importlib.util.find_spec("fastjsonschema") is None:
+        msg = (
+            f"The '{FASTJSONSCHEMA_BACKEND}' validation backend requires the "
+            "'fastjsonschema' package"
+        )
+        raise ValueError(msg)
+
+    import fastjsonschema
+
+    validate = fastjsonschema.compile(schema, use_default=False)
+
+    def check(record: t.Any) -> bool:  # noqa: ANN401
+        try:
+            validate(record)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+    return check
+
+
+# Number of distinct schemas whose validators and record checks are kept
+_SCHEMA_CACHE_SIZE = 256
+
+_record_checks: BoundedCache[tuple[str, str], RecordCheck] = BoundedCache(
+    _SCHEMA_CACHE_SIZE,
+)
+_validators: BoundedCache[str, Draft7Validator] = BoundedCache(_SCHEMA_CACHE_SIZE)
+
+
+def get_validator(schema: dict, fingerprint: str | None = None) -> Draft7Validator:
+    """Get the reference validator for a schema.
+
+    Validators of recently seen schemas are cached by schema fingerprint, so sinks
+    created for a schema that was seen before reuse its validator.
+
+    Args:
+        schema: A Draft 7 JSON Schema.
+        fingerprint: The fingerprint of the schema, if already known.
+
+    Returns:
+        The validator, which checks formats.
+    """
+    # The schema is copied, since the validator outlives the sink that built it
+    return _validators.get(
+        fingerprint or schema_fingerprint(schema),
+        lambda: Draft7Validator(
+            copy.deepcopy(schema),
+            format_checker=Draft7Validator.FORMAT_CHECKER,
+        ),
+    )
+
+
+def get_record_check(
+    backend: str,
+    schema: dict,
+    fingerprint: str | None = None,
+) -> RecordCheck | None:
+    """Get the record check of a validation backend for a schema.
+
+    Checks of recently seen schemas are cached by schema fingerprint, so sinks
+    created for a schema that was seen before reuse its check.
+
+    Args:
+        backend: The validation backend name.
+        schema: A Draft 7 JSON Schema.
+        fingerprint: The fingerprint of the schema, if already known.
+
+    Returns:
+        The record check, or None for the reference `jsonschema` backend.
+
+    Raises:
+        ValueError: If the backend is unknown or not installed.
+    """
+    if backend == JSONSCHEMA_BACKEND:
+        return None
+
+    if backend not in VALIDATION_BACKENDS:
+        msg = f"Unknown validation backend '{backend}'"
+        raise ValueError(msg)
+
+    compile_check = (
+        compile_record_check
+        if backend == COMPILED_BACKEND
+        else _fastjsonschema_record_check
+    )
+    return _record_checks.get(
+        (backend, fingerprint or schema_fingerprint(schema)),
+        lambda: compile_check(schema),
+    )
+
+
+_batch_validation_executor: ThreadPoolExecutor | None = None
+
+
+def submit_batch_validation(
+    fn: t.Callable[..., None],
+    *args: t.Any,
+) -> Future:
+    """Validate a chunk of records in the background.
+
+    Validation holds the GIL, so chunks are validated by a single thread, shared by
+    all sinks.
+
+    Args:
+        fn: The function that validates the records.
+        args: Arguments to `fn`.
+
+    Returns:
+        A future for the validation, which raises its error.
+    """
+    global _batch_validation_executor  # noqa: PLW0603
+    if _batch_validation_executor is None:
+        _batch_validation_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="singer-sdk-validate",
+        )
+    return _batch_validation_executor.submit(fn, *args)
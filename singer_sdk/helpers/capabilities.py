@@ -107,6 +107,77 @@ ADD_RECORD_METADATA_CONFIG = PropertiesList(
     ),
 ).to_dict()
 
+TARGET_BUFFER_CONFIG = PropertiesList(
+    Property(
+        "max_buffer_bytes",
+        IntegerType(),
+        description=(
+            "Approximate maximum size in bytes of the records buffered across all "
+            "sinks. When reached, sinks are drained until the buffered records fit "
+            "again. Unlimited if not set."
+        ),
+    ),
+    Property(
+        "buffer_drain_order",
+        StringType(),
+        description=(
+            "Which sinks to drain first when `max_buffer_bytes` is reached: the "
+            "`largest` buffers or the `oldest` ones."
+        ),
+        allowed_values=["largest", "oldest"],
+        default="largest",
+    ),
+).to_dict()
+
+TARGET_VALIDATION_CONFIG = PropertiesList(
+    Property(
+        "validation_backend",
+        StringType(),
+        description=(
+            "How records are validated against their stream schema. `jsonschema` "
+            "uses the reference validator for every record. `compiled` compiles each "
+            "schema into a faster check once, and `fastjsonschema` uses the "
+            "fastjsonschema package. With the faster backends, records that fail "
+            "the check are validated again by the reference validator, which reports "
+            "the error."
+        ),
+        allowed_values=["jsonschema", "compiled", "fastjsonschema"],
+        default="jsonschema",
+    ),
+    Property(
+        "validation_mode",
+        StringType(),
+        description=(
+            "Which records are validated. `full` validates every record as it is "
+            "read. `sample` only validates the records picked by "
+            "`validation_sample_rate` and `validation_sample_size`, for upstream taps "
+            "that are trusted to conform records to their schema. `batch` validates "
+            "every record as read, in chunks in a background thread, before its "
+            "batch is drained."
+        ),
+        allowed_values=["full", "sample", "batch"],
+        default="full",
+    ),
+    Property(
+        "validation_sample_rate",
+        IntegerType(),
+        description=(
+            "In `sample` validation mode, validate one record out of this many in "
+            "each batch, starting with the first."
+        ),
+        default=100,
+    ),
+    Property(
+        "validation_sample_size",
+        IntegerType(),
+        description=(
+            "In `sample` validation mode, also validate this many records at the "
+            "start of each batch."
+        ),
+        default=0,
+    ),
+).to_dict()
+
 
 class TargetLoadMethods(str, Enum):
     """Target-specific capabilities."""
@@ -3,37 +3,219 @@
 from __future__ import annotations
 
 import abc
-import decimal
 import json
 import logging
+import queue
 import sys
+import threading
+import time
 import typing as t
 from collections import Counter, defaultdict
 
+from singer_sdk._singerlib.compression import CompressedOutput, open_decompressed
+from singer_sdk._singerlib.framing import (
+    JSONL_FORMAT,
+    MSGPACK_FORMAT,
+    MSGPACK_MAGIC,
+    get_framing,
+    is_framed,
+)
+from singer_sdk._singerlib.json import (
+    DECODE_AUTO_DETECT,
+    ENCODE_AUTO_DETECT,
+    JSONCodec,
+    get_codec,
+)
 from singer_sdk._singerlib.messages import Message, SingerMessageType
-from singer_sdk._singerlib.messages import format_message as singer_format_message
-from singer_sdk._singerlib.messages import write_message as singer_write_message
+from singer_sdk._singerlib.mmap_input import MappedInput
 from singer_sdk.helpers._compat import final
+from singer_sdk.metrics import Gauge, writer_queue_gauge
 
 logger = logging.getLogger(__name__)
 
 
+class LazyMessageDict(dict):
+    """A message dictionary whose ``record`` value is decoded on first access.
+
+    Reading ``type`` or ``stream``, or checking which keys are present, does not
+    decode the record. Any other access to the record, or to the dictionary as a
+    whole, decodes it first.
+    """
+
+    __slots__ = ("_codec", "_raw_record")
+
+    def __init__(
+        self,
+        envelope: dict[str, t.Any],
+        raw_record: t.Any,  # noqa: ANN401
+        codec: JSONCodec,
+    ) -> None:
+        """Initialize the message.
+
+        Args:
+            envelope: The decoded message, without its record.
+            raw_record: The undecoded JSON of the record.
+            codec: The codec used to decode the record.
+        """
+        super().__init__(envelope)
+        self._raw_record = raw_record
+        self._codec = codec
+
+    @property
+    def is_decoded(self) -> bool:
+        """Check whether the record has been decoded.
+
+        Returns:
+            True if the record has been decoded.
+        """
+        return self._raw_record is None
+
+    @property
+    def raw_record(self) -> str | None:
+        """Get the undecoded JSON of the record.
+
+        Returns:
+            The record JSON, or None if the record has already been decoded.
+        """
+        if self._raw_record is None:
+            return None
+        return bytes(memoryview(self._raw_record)).decode("utf-8")
+
+    def _decode(self) -> None:
+        if self._raw_record is not None:
+            dict.__setitem__(self, "record", self._codec.loads(self._raw_record))
+            self._raw_record = None
+
+    def __missing__(self, key: str) -> t.Any:  # noqa: ANN401, D105
+        if key == "record" and self._raw_record is not None:
+            self._decode()
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:  # noqa: D105
+        return (key == "record" and self._raw_record is not None) or (
+            super().__contains__(key)
+        )
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:  # noqa: ANN401, D102
+        if key == "record":
+            self._decode()
+        return super().get(key, default)
+
+    def __iter__(self) -> t.Iterator[str]:  # noqa: D105
+        self._decode()
+        return super().__iter__()
+
+    def __len__(self) -> int:  # noqa: D105
+        self._decode()
+        return super().__len__()
+
+    def __eq__(self, other: object) -> bool:  # noqa: D105
+        self._decode()
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:  # noqa: D105
+        self._decode()
+        return super().__repr__()
+
+    def keys(self) -> t.KeysView[str]:  # type: ignore[override]  # noqa: D102
+        self._decode()
+        return super().keys()
+
+    def values(self) -> t.ValuesView[t.Any]:  # type: ignore[override]  # noqa: D102
+        self._decode()
+        return super().values()
+
+    def items(self) -> t.ItemsView[str, t.Any]:  # type: ignore[override]  # noqa: D102
+        self._decode()
+        return super().items()
+
+    def pop(self, key: str, *args: t.Any) -> t.Any:  # noqa: ANN401, D102
+        self._decode()
+        return super().pop(key, *args)
+
+    def copy(self) -> dict[str, t.Any]:  # noqa: D102
+        self._decode()
+        return dict(super().items())
+
+    def __reduce__(self) -> tuple[type[dict], tuple[dict[str, t.Any]]]:  # noqa: D105
+        return dict, (self.copy(),)
+
+
 class SingerReader(metaclass=abc.ABCMeta):
     """Interface for all plugins reading Singer messages from stdin."""
 
+    #: Decode only the envelope of RECORD messages up front, and the record itself
+    #: on first access. Messages are passed to `_process_record_message` as
+    #: :class:`LazyMessageDict` objects, so records from streams that are filtered
+    #: out are never decoded. Requires a codec that can defer decoding, such as
+    #: ``msgspec``; with other codecs, messages are decoded in full.
+    lazy_messages: bool = False
+
+    #: Wire format of the input: "jsonl", "msgpack", or "auto" to detect framed
+    #: MessagePack input from its stream header and read JSONL otherwise.
+    input_format: str = "auto"
+
+    #: Read regular files through a memory map, finding line boundaries on the raw
+    #: bytes instead of reading them through a file object.
+    mmap_input: bool = False
+
+    _input_codec: JSONCodec | None = None
+
+    @property
+    def input_codec(self) -> JSONCodec:
+        """Get the JSON codec used to decode input messages.
+
+        Defaults to the codec named by the ``SINGER_SDK_JSON_CODEC`` environment
+        variable, or else the fastest installed lossless codec.
+
+        Returns:
+            The JSON codec instance.
+        """
+        if self._input_codec is None:
+            self._input_codec = get_codec(auto_detect=DECODE_AUTO_DETECT)
+        return self._input_codec
+
+    @input_codec.setter
+    def input_codec(self, new_value: JSONCodec | str) -> None:
+        """Set the JSON codec used to decode input messages.
+
+        Args:
+            new_value: A codec instance or the name of a codec.
+        """
+        self._input_codec = (
+            get_codec(new_value) if isinstance(new_value, str) else new_value
+        )
+
     @final
-    def listen(self, file_input: t.IO[str] | None = None) -> None:
+    def listen(self, file_input: t.IO[str] | t.IO[bytes] | None = None) -> None:
         """Read from input until all messages are processed.
 
         Args:
-            file_input: Readable stream of messages. Defaults to standard in.
+            file_input: Readable stream of messages, in text or binary mode. Defaults
+                to the binary buffer of standard in, or standard in itself if it has no
+                binary buffer. gzip and zstd compressed binary input is decompressed
+                transparently. Uncompressed files on disk are memory-mapped if
+                :attr:`mmap_input` is enabled.
 
         This method is internal to the SDK and should not need to be overridden.
         """
         if not file_input:
-            file_input = sys.stdin
+            # Fall back to text mode when stdin has been replaced, e.g. in tests.
+            file_input = getattr(sys.stdin, "buffer", sys.stdin)
+
+        file_input = open_decompressed(file_input)
+        mapped_input = None
+        if self.mmap_input and not self._is_framed_input(file_input):
+            mapped_input = MappedInput.from_file(file_input)
 
-        self._process_lines(file_input)
+        try:
+            self._process_lines(mapped_input or file_input)
+        finally:
+            if mapped_input is not None:
+                mapped_input.close()
         self._process_endofpipe()
 
     @staticmethod
@@ -47,16 +229,16 @@ class SingerReader(metaclass=abc.ABCMeta):
         Raises:
             Exception: TODO
         """
-        if not requires.issubset(line_dict):
-            missing = requires - set(line_dict)
+        if not all(key in line_dict for key in requires):
+            missing = {key for key in requires if key not in line_dict}
             msg = f"Line is missing required {', '.join(missing)} key(s): {line_dict}"
             raise Exception(msg)  # TODO: Raise a more specific exception
 
-    def deserialize_json(self, line: str) -> dict:
+    def deserialize_json(self, line: str | bytes) -> dict:
         """Deserialize a line of json.
 
         Args:
-            line: A single line of json.
+            line: A single line of json, as text or UTF-8 encoded bytes.
 
         Returns:
             A dictionary of the deserialized json.
@@ -65,15 +247,44 @@ class SingerReader(metaclass=abc.ABCMeta):
             json.decoder.JSONDecodeError: raised if any lines are not valid json
         """
         try:
-            return json.loads(  # type: ignore[no-any-return]
-                line,
-                parse_float=decimal.Decimal,
-            )
+            return self.input_codec.loads(line)  # type: ignore[no-any-return]
+        except json.decoder.JSONDecodeError as exc:
+            logger.error("Unable to parse:\n%s", line, exc_info=exc)
+            raise
+
+    def deserialize_json_lazy(self, line: str | bytes) -> dict:
+        """Deserialize a line of json, deferring the decoding of RECORD bodies.
+
+        Args:
+            line: A single line of json, as text or UTF-8 encoded bytes.
+
+        Returns:
+            A :class:`LazyMessageDict` for RECORD messages if the input codec can
+            defer decoding, and a plain dictionary otherwise.
+
+        Raises:
+            json.decoder.JSONDecodeError: raised if any lines are not valid json
+        """
+        codec = self.input_codec
+        try:
+            envelope, raw_record = codec.loads_deferred(line, "record")
         except json.decoder.JSONDecodeError as exc:
             logger.error("Unable to parse:\n%s", line, exc_info=exc)
             raise
 
-    def _process_lines(self, file_input: t.IO[str]) -> t.Counter[str]:
+        if raw_record is None:
+            return envelope
+
+        if envelope.get("type") != SingerMessageType.RECORD:
+            envelope["record"] = codec.loads(raw_record)
+            return envelope
+
+        return LazyMessageDict(envelope, raw_record, codec)
+
+    def _process_lines(
+        self,
+        file_input: t.IO[str] | t.IO[bytes],
+    ) -> t.Counter[str]:
         """Internal method to process jsonl lines from a Singer tap.
 
         Args:
@@ -83,8 +294,7 @@ class SingerReader(metaclass=abc.ABCMeta):
             A counter object for the processed lines.
         """
         stats: dict[str, int] = defaultdict(int)
-        for line in file_input:
-            line_dict = self.deserialize_json(line)
+        for line_dict in self._iter_messages(file_input):
             self._assert_line_requires(line_dict, requires={"type"})
 
             record_type: SingerMessageType = line_dict["type"]
@@ -110,6 +320,43 @@ class SingerReader(metaclass=abc.ABCMeta):
 
         return Counter(**stats)
 
+    def _iter_messages(
+        self,
+        file_input: t.Iterable[str | bytes],
+    ) -> t.Iterator[dict]:
+        """Deserialize each line of input.
+
+        Args:
+            file_input: Readable stream of messages, each on a separate line.
+
+        Yields:
+            A dictionary for each message.
+        """
+        if self._is_framed_input(file_input):
+            yield from get_framing().iter_messages(file_input)  # type: ignore[arg-type]
+            return
+
+        deserialize = (
+            self.deserialize_json_lazy if self.lazy_messages else self.deserialize_json
+        )
+        for line in file_input:
+            yield deserialize(line)
+
+    def _is_framed_input(self, file_input: t.Iterable[str | bytes]) -> bool:
+        """Check if the input is a framed binary message stream.
+
+        Args:
+            file_input: Readable stream of messages.
+
+        Returns:
+            True if messages should be read as frames rather than lines.
+        """
+        if self.input_format == JSONL_FORMAT:
+            return False
+        if self.input_format == MSGPACK_FORMAT:
+            return True
+        return is_framed(file_input)
+
     @abc.abstractmethod
     def _process_schema_message(self, message_dict: dict) -> None:
         ...
@@ -147,9 +394,121 @@ class SingerReader(metaclass=abc.ABCMeta):
         logger.debug("End of pipe reached")
 
 
+class _FormattedMessage(t.NamedTuple):
+    """A message that has already been serialized."""
+
+    type: str  # noqa: A003
+    line: str
+
+
+class _OutputBuffer:
+    """Accumulate formatted messages until they are due to be flushed."""
+
+    def __init__(self, max_size: int, flush_interval: float) -> None:
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.lines: list[t.Any] = []
+        self.size = 0
+        self.last_flush_at = time.monotonic()
+
+    def append(self, line: str | bytes) -> bool:
+        """Add a line and check whether the buffer should be flushed.
+
+        Args:
+            line: A formatted message, including the trailing newline, or a frame.
+
+        Returns:
+            True if the buffer is over its size or age limit.
+        """
+        self.lines.append(line)
+        self.size += len(line)
+        return (
+            self.size >= self.max_size
+            or time.monotonic() - self.last_flush_at >= self.flush_interval
+        )
+
+    def drain(self) -> str | bytes:
+        """Empty the buffer.
+
+        Returns:
+            The concatenated buffered lines.
+        """
+        data = self.lines[0][:0].join(self.lines) if self.lines else ""
+        self.lines = []
+        self.size = 0
+        self.last_flush_at = time.monotonic()
+        return data
+
+
 class SingerWriter:
     """Interface for all plugins writting Singer messages to stdout."""
 
+    #: Collect formatted messages in memory instead of flushing stdout after each
+    #: one. Buffered messages are always flushed right after a STATE message, so
+    #: checkpoints reach the target as soon as they are emitted.
+    buffered_output: bool = False
+
+    #: Number of characters after which the output buffer is flushed.
+    output_buffer_size: int = 1024 * 1024
+
+    #: Number of seconds after which the output buffer is flushed. A background
+    #: thread enforces the interval, so buffered messages are also written while
+    #: the plugin is idle.
+    output_flush_interval: float = 1.0
+
+    #: Serialize and write messages on a dedicated thread, so that extraction can
+    #: continue while messages are encoded and written to stdout. Messages other
+    #: than STATE must not be modified after they are passed to
+    #: :meth:`write_message`.
+    threaded_output: bool = False
+
+    #: Maximum number of messages waiting for the writer thread. Once the queue is
+    #: full, :meth:`write_message` blocks until the writer catches up.
+    output_queue_size: int = 10_000
+
+    #: Wire format of the output: "jsonl", or "msgpack" for length-prefixed
+    #: MessagePack frames that only SDK-based targets can read.
+    output_format: str = JSONL_FORMAT
+
+    #: Compress the output stream with "gzip" or "zstd". Each flush of the output
+    #: ends a compressed block, so this works best with :attr:`buffered_output`.
+    output_compression: str | None = None
+
+    _output_codec: JSONCodec | None = None
+    _compressed_output: CompressedOutput | None = None
+    _frame_header_written: bool = False
+    _output_buffer: _OutputBuffer | None = None
+    _output_lock: threading.RLock | None = None
+    _output_flush_stop: threading.Event | None = None
+    _output_queue: queue.Queue[Message | _FormattedMessage] | None = None
+    _output_queue_gauge: Gauge | None = None
+    _output_error: Exception | None = None
+
+    @property
+    def output_codec(self) -> JSONCodec:
+        """Get the JSON codec used to encode output messages.
+
+        Defaults to the codec named by the ``SINGER_SDK_JSON_CODEC`` environment
+        variable, or else simplejson.
+
+        Returns:
+            The JSON codec instance.
+        """
+        if self._output_codec is None:
+            self._output_codec = get_codec(auto_detect=ENCODE_AUTO_DETECT)
+        return self._output_codec
+
+    @output_codec.setter
+    def output_codec(self, new_value: JSONCodec | str) -> None:
+        """Set the JSON codec used to encode output messages.
+
+        Args:
+            new_value: A codec instance or the name of a codec.
+        """
+        self._output_codec = (
+            get_codec(new_value) if isinstance(new_value, str) else new_value
+        )
+
     def format_message(self, message: Message) -> str:
         """Format a message as a JSON string.
 
@@ -159,12 +518,221 @@ class SingerWriter:
         Returns:
             The formatted message.
         """
-        return singer_format_message(message)
+        return self.output_codec.dumps(message.to_dict())
 
     def write_message(self, message: Message) -> None:
         """Write a message to stdout.
 
+        If :attr:`buffered_output` is enabled, the message is held in memory until
+        the buffer is full, the flush interval has elapsed, or a STATE message is
+        written.
+
+        If :attr:`threaded_output` is enabled, the message is handed to the writer
+        thread instead. Errors raised by the writer thread are re-raised by the next
+        call to this method or to :meth:`flush_output`.
+
         Args:
             message: The message to write.
         """
-        singer_write_message(message)
+        self._emit_message(message)
+
+    def _emit_message(self, message: Message | _FormattedMessage) -> None:
+        if self.threaded_output:
+            self._enqueue_message(message)
+        else:
+            self._raise_output_error()
+            self._write_message(message)
+
+    def _enqueue_message(self, message: Message | _FormattedMessage) -> None:
+        if self._output_queue is None:
+            self._start_output_thread()
+
+        # Streams keep mutating their live state dict, so STATE messages are encoded
+        # before they are queued to keep bookmarks from running ahead of records.
+        if (
+            not isinstance(message, _FormattedMessage)
+            and message.type == SingerMessageType.STATE
+        ):
+            message = _FormattedMessage(message.type, self.format_message(message))
+
+        output_queue = t.cast(queue.Queue, self._output_queue)
+        while True:
+            self._raise_output_error()
+            try:
+                output_queue.put(message, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+
+        t.cast(Gauge, self._output_queue_gauge).set(output_queue.qsize())
+
+    def _start_output_thread(self) -> None:
+        self._output_queue = queue.Queue(maxsize=self.output_queue_size)
+        self._output_queue_gauge = writer_queue_gauge()
+        threading.Thread(
+            target=self._output_worker,
+            name="singer-sdk-writer",
+            daemon=True,
+        ).start()
+
+    def _output_worker(self) -> None:
+        output_queue = t.cast(queue.Queue, self._output_queue)
+        while True:
+            message = output_queue.get()
+            try:
+                # After a failure, keep consuming so producers never block forever.
+                if self._output_error is None:
+                    self._write_message(message)
+            except Exception as exc:  # noqa: BLE001
+                self._output_error = exc
+            finally:
+                output_queue.task_done()
+
+    def _raise_output_error(self) -> None:
+        if self._output_error is not None:
+            error, self._output_error = self._output_error, None
+            raise error
+
+    def write_raw_message(self, line: str | bytes, message_type: str) -> None:
+        """Write an already formatted message to stdout.
+
+        This allows messages read from the input to be forwarded without
+        re-encoding them. The line is subject to the same buffering as
+        :meth:`write_message`.
+
+        Args:
+            line: A single JSON-encoded Singer message.
+            message_type: The type of the message.
+        """
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        self._emit_message(_FormattedMessage(message_type, line.rstrip("\r\n")))
+
+    def _format_frame(self, message: Message | _FormattedMessage) -> bytes:
+        message_dict = (
+            self.output_codec.loads(message.line)
+            if isinstance(message, _FormattedMessage)
+            else message.to_dict()
+        )
+        frame = get_framing().encode_frame(message_dict)
+        if not self._frame_header_written:
+            self._frame_header_written = True
+            return MSGPACK_MAGIC + frame
+        return frame
+
+    def _write_output(self, data: str | bytes) -> None:
+        if self.output_compression:
+            if self._compressed_output is None:
+                sys.stdout.flush()
+                self._compressed_output = CompressedOutput(
+                    sys.stdout.buffer,
+                    self.output_compression,
+                )
+            self._compressed_output.write(
+                data.encode("utf-8") if isinstance(data, str) else data,
+            )
+            self._compressed_output.flush()
+        elif isinstance(data, bytes):
+            sys.stdout.flush()
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+        else:
+            sys.stdout.write(data)
+            sys.stdout.flush()
+
+    def _write_message(self, message: Message | _FormattedMessage) -> None:
+        line: str | bytes
+        if self.output_format == MSGPACK_FORMAT:
+            line = self._format_frame(message)
+        else:
+            line = (
+                message.line
+                if isinstance(message, _FormattedMessage)
+                else self.format_message(message)
+            ) + "\n"
+
+        if not self.buffered_output:
+            self._write_output(line)
+            return
+
+        if self._output_buffer is None:
+            self._output_lock = threading.RLock()
+            self._output_buffer = _OutputBuffer(
+                self.output_buffer_size,
+                self.output_flush_interval,
+            )
+            if self.output_flush_interval > 0:
+                self._start_flush_thread()
+
+        with t.cast(threading.RLock, self._output_lock):
+            if (
+                self._output_buffer.append(line)
+                or message.type == SingerMessageType.STATE
+            ):
+                self._flush_output_buffer()
+
+    def _start_flush_thread(self) -> None:
+        self._output_flush_stop = threading.Event()
+        threading.Thread(
+            target=self._flush_worker,
+            args=(self._output_buffer, self._output_flush_stop),
+            name="singer-sdk-flusher",
+            daemon=True,
+        ).start()
+
+    def _flush_worker(self, buffer: _OutputBuffer, stop: threading.Event) -> None:
+        timeout = buffer.flush_interval
+        while not stop.wait(timeout):
+            with t.cast(threading.RLock, self._output_lock):
+                if stop.is_set():
+                    return
+                age = time.monotonic() - buffer.last_flush_at
+                if buffer.lines and age >= buffer.flush_interval:
+                    try:
+                        self._flush_output_buffer()
+                    except Exception as exc:  # noqa: BLE001
+                        self._output_error = exc
+                        return
+                    age = 0
+            # Sleep until the buffer is due, or a full interval if it is empty.
+            timeout = (
+                max(buffer.flush_interval - age, 0.01)
+                if buffer.lines
+                else buffer.flush_interval
+            )
+
+    def _flush_output_buffer(self) -> None:
+        if self._output_buffer is None or not self._output_buffer.lines:
+            sys.stdout.flush()
+            return
+
+        with t.cast(threading.RLock, self._output_lock):
+            if self._output_buffer.lines:
+                self._write_output(self._output_buffer.drain())
+
+    def flush_output(self) -> None:
+        """Write any pending messages to stdout and flush it.
+
+        When :attr:`threaded_output` is enabled, this waits for the writer thread
+        to process every queued message.
+        """
+        if self._output_queue is not None:
+            self._output_queue.join()
+            self._raise_output_error()
+        self._flush_output_buffer()
+
+    def close_output(self) -> None:
+        """Write any pending messages and end the output stream.
+
+        This writes the trailer of compressed output. Messages written afterwards
+        start a new compressed stream, which readers decode as a continuation.
+        """
+        self.flush_output()
+        if self._output_flush_stop is not None:
+            with t.cast(threading.RLock, self._output_lock):
+                self._output_flush_stop.set()
+                self._output_flush_stop = None
+                self._output_buffer = None
+        if self._compressed_output is not None:
+            self._compressed_output.close()
+            self._compressed_output = None
@@ -24,6 +24,8 @@ from singer_sdk.helpers._flattening import (
     flatten_schema,
     get_flattening_options,
 )
+from singer_sdk.helpers._util import BoundedCache
+from singer_sdk.helpers._validation import schema_fingerprint
 
 if t.TYPE_CHECKING:
     import sys
@@ -43,6 +45,9 @@ MAPPER_ALIAS_OPTION = "__alias__"
 MAPPER_KEY_PROPERTIES_OPTION = "__key_properties__"
 NULL_STRING = "__NULL__"
 
+# Recently flattened schemas, by schema fingerprint and flattening options
+_flattened_schemas: BoundedCache[tuple[str, int, str], dict] = BoundedCache(256)
+
 
 def md5(string: str) -> str:
     """Digest a string using MD5. This is a function for inline calculations.
@@ -86,6 +91,15 @@ class StreamMap(metaclass=abc.ABCMeta):
         if self.flattening_enabled:
             self.transformed_schema = self.flatten_schema(self.transformed_schema)
 
+    @property
+    def is_passthrough(self) -> bool:
+        """True if records are emitted unchanged, apart from the stream alias.
+
+        Returns:
+            True if the map neither filters nor transforms records.
+        """
+        return False
+
     @property
     def flattening_enabled(self) -> bool:
         """True if flattening is enabled for this stream map.
@@ -132,11 +146,17 @@ class StreamMap(metaclass=abc.ABCMeta):
         if not self.flattening_options or not self.flattening_enabled:
             return raw_schema
 
-        return flatten_schema(
-            raw_schema,
-            separator=self.flattening_options.separator,
-            max_level=self.flattening_options.max_level,
+        options = self.flattening_options
+        flattened_schema = _flattened_schemas.get(
+            (schema_fingerprint(raw_schema), options.max_level, options.separator),
+            lambda: flatten_schema(
+                raw_schema,
+                separator=options.separator,
+                max_level=options.max_level,
+            ),
         )
+        # Sinks change the schemas they are given
+        return copy.deepcopy(flattened_schema)
 
     @abc.abstractmethod
     def transform(self, record: dict) -> dict | None:
@@ -201,6 +221,15 @@ class RemoveRecordTransform(DefaultStreamMap):
 class SameRecordTransform(DefaultStreamMap):
     """Default mapper which simply returns the original records."""
 
+    @property
+    def is_passthrough(self) -> bool:
+        """True unless records are flattened.
+
+        Returns:
+            True if flattening is disabled.
+        """
+        return not self.flattening_enabled
+
     def transform(self, record: dict) -> dict | None:
         """Return original record unchanged.
 
@@ -254,6 +283,7 @@ class CustomStreamMap(StreamMap):
         )
 
         self.map_config = map_config
+        self._is_passthrough = False
         self._transform_fn: t.Callable[[dict], dict | None]
         self._filter_fn: t.Callable[[dict], bool]
         (
@@ -263,6 +293,15 @@ class CustomStreamMap(StreamMap):
         ) = self._init_functions_and_schema(stream_map=map_transform)
         self.expr_evaluator = simpleeval.EvalWithCompoundTypes(functions=self.functions)
 
+    @property
+    def is_passthrough(self) -> bool:
+        """True if the map only sets a stream alias or key properties.
+
+        Returns:
+            True if the map has no filter, property expressions or flattening.
+        """
+        return self._is_passthrough
+
     def transform(self, record: dict) -> dict | None:
         """Return a transformed record.
 
@@ -511,6 +550,13 @@ class CustomStreamMap(StreamMap):
         if self.flattening_enabled:
             transformed_schema = self.flatten_schema(transformed_schema)
 
+        self._is_passthrough = (
+            filter_rule is None
+            and include_by_default
+            and not stream_map_parsed
+            and not self.flattening_enabled
+        )
+
         # Declare function variables
 
         def eval_filter(
@@ -644,6 +690,21 @@ class PluginMapper:
                 msg = f"Option '{stream_map_key}:{stream_def}' is not expected."
                 raise StreamMapConfigError(msg)
 
+    def get_passthrough_alias(self, stream_name: str) -> str | None:
+        """Get the output stream name if records of a stream are passed through.
+
+        Args:
+            stream_name: The input stream name.
+
+        Returns:
+            The stream alias if the stream has a single map that does not change
+            records, otherwise None.
+        """
+        stream_maps = self.stream_maps.get(stream_name, [])
+        if len(stream_maps) == 1 and stream_maps[0].is_passthrough:
+            return stream_maps[0].stream_alias
+        return None
+
     def register_raw_streams_from_catalog(self, catalog: Catalog) -> None:
         """Register all streams as described in the catalog dict.
 
@@ -7,9 +7,16 @@ import typing as t
 
 import click
 
+from singer_sdk._singerlib.compression import GZIP, ZSTD
 from singer_sdk.helpers._classproperty import classproperty
+from singer_sdk.helpers._util import utc_now
 from singer_sdk.helpers.capabilities import CapabilitiesEnum, PluginCapabilities
-from singer_sdk.io_base import SingerReader, SingerWriter
+from singer_sdk.io_base import (
+    LazyMessageDict,
+    SingerMessageType,
+    SingerReader,
+    SingerWriter,
+)
 from singer_sdk.plugin_base import PluginBase
 
 if t.TYPE_CHECKING:
@@ -19,6 +26,15 @@ if t.TYPE_CHECKING:
 class InlineMapper(PluginBase, SingerReader, SingerWriter, metaclass=abc.ABCMeta):
     """Abstract base class for inline mappers."""
 
+    #: Forward RECORD messages of streams that are not transformed without
+    #: running :meth:`map_record_message`. Only the envelope is re-encoded, with the
+    #: stream alias and a new ``time_extracted``. Combined with :attr:`lazy_messages`
+    #: and the msgspec input codec, record bodies are neither decoded nor
+    #: re-encoded. See :meth:`get_passthrough_stream_alias`.
+    raw_passthrough: bool = False
+
+    _passthrough_aliases: dict[str, str | None] | None = None
+
     @classproperty
     def capabilities(self) -> list[CapabilitiesEnum]:
         """Get capabilities.
@@ -36,10 +52,52 @@ class InlineMapper(PluginBase, SingerReader, SingerWriter, metaclass=abc.ABCMeta
 
     def _process_schema_message(self, message_dict: dict) -> None:
         self._write_messages(self.map_schema_message(message_dict))
+        if self.raw_passthrough:
+            if self._passthrough_aliases is None:
+                self._passthrough_aliases = {}
+            stream_name = message_dict["stream"]
+            self._passthrough_aliases[stream_name] = self.get_passthrough_stream_alias(
+                stream_name,
+            )
 
     def _process_record_message(self, message_dict: dict) -> None:
+        if self._passthrough_aliases:
+            alias = self._passthrough_aliases.get(message_dict["stream"])
+            if alias is not None:
+                self._write_passthrough_record(message_dict, alias)
+                return
+
         self._write_messages(self.map_record_message(message_dict))
 
+    def _write_passthrough_record(self, message_dict: dict, alias: str) -> None:
+        codec = self.output_codec
+        message = dict(dict.items(message_dict), stream=alias, time_extracted=utc_now())
+        if isinstance(message_dict, LazyMessageDict) and not message_dict.is_decoded:
+            message["record"] = codec.raw(t.cast(str, message_dict.raw_record))
+        self.write_raw_message(codec.dumps(message), SingerMessageType.RECORD)
+
+    def get_passthrough_stream_alias(self, stream_name: str) -> str | None:
+        """Get the output stream name if records of a stream are passed through.
+
+        Only used when :attr:`raw_passthrough` is enabled. Called after each SCHEMA
+        message is mapped. By default, this consults the plugin's
+        :class:`~singer_sdk.mapper.PluginMapper`, if one is set, and returns the
+        stream alias when the stream has a single map that neither filters,
+        transforms nor flattens records.
+
+        Developers may override this method when records of a stream are written
+        unchanged by :meth:`map_record_message`.
+
+        Args:
+            stream_name: The input stream name.
+
+        Returns:
+            The output stream name, or None if records must be mapped.
+        """
+        if self._mapper is None:
+            return None
+        return self._mapper.get_passthrough_alias(stream_name)
+
     def _process_state_message(self, message_dict: dict) -> None:
         self._write_messages(self.map_state_message(message_dict))
 
@@ -49,6 +107,10 @@ class InlineMapper(PluginBase, SingerReader, SingerWriter, metaclass=abc.ABCMeta
     def _process_batch_message(self, message_dict: dict) -> None:
         self._write_messages(self.map_batch_message(message_dict))
 
+    def _process_endofpipe(self) -> None:
+        super()._process_endofpipe()
+        self.close_output()
+
     @abc.abstractmethod
     def map_schema_message(self, message_dict: dict) -> t.Iterable[singer.Message]:
         """Map a schema message to zero or more new messages.
@@ -112,7 +174,8 @@ class InlineMapper(PluginBase, SingerReader, SingerWriter, metaclass=abc.ABCMeta
         about: bool = False,
         about_format: str | None = None,
         config: tuple[str, ...] = (),
-        file_input: t.IO[str] | None = None,
+        file_input: t.IO[bytes] | None = None,
+        compress: str | None = None,
     ) -> None:
         """Invoke the mapper.
 
@@ -122,6 +185,7 @@ class InlineMapper(PluginBase, SingerReader, SingerWriter, metaclass=abc.ABCMeta
             config: Configuration file location or 'ENV' to use environment
                 variables. Accepts multiple inputs as a tuple.
             file_input: Optional file to read input from.
+            compress: Compression of the output stream.
         """
         super().invoke(about=about, about_format=about_format)
         cls.print_version(print_fn=cls.logger.info)
@@ -132,6 +196,8 @@ class InlineMapper(PluginBase, SingerReader, SingerWriter, metaclass=abc.ABCMeta
             validate_config=True,
             parse_env_config=parse_env_config,
         )
+        if compress:
+            mapper.output_compression = compress
         mapper.listen(file_input)
 
     @classmethod
@@ -148,7 +214,12 @@ class InlineMapper(PluginBase, SingerReader, SingerWriter, metaclass=abc.ABCMeta
                 click.Option(
                     ["--input", "file_input"],
                     help="A path to read messages from instead of from standard in.",
-                    type=click.File("r"),
+                    type=click.File("rb"),
+                ),
+                click.Option(
+                    ["--compress"],
+                    help="Compress the output stream.",
+                    type=click.Choice([GZIP, ZSTD]),
                 ),
             ],
         )
@@ -54,6 +54,10 @@ class Metric(str, enum.Enum):
     HTTP_REQUEST_COUNT = "http_request_count"
     JOB_DURATION = "job_duration"
     SYNC_DURATION = "sync_duration"
+    WRITER_QUEUE_DEPTH = "writer_queue_depth"
+    BUFFER_SIZE = "buffer_size"
+    DRAIN_DURATION = "drain_duration"
+    CHECKPOINT_LAG = "checkpoint_lag"
 
 
 @dataclass
@@ -227,6 +231,67 @@ class Counter(Meter):
         return time() - self.last_log_time > self.log_interval
 
 
+class Gauge(Meter):
+    """A meter for sampling a value that can go up and down."""
+
+    def __init__(
+        self,
+        metric: Metric,
+        tags: dict | None = None,
+        log_interval: float = DEFAULT_LOG_INTERVAL,
+    ) -> None:
+        """Initialize a gauge.
+
+        Args:
+            metric: The metric type.
+            tags: Tags to add to the measurement.
+            log_interval: The interval at which to log the value.
+        """
+        super().__init__(metric, tags)
+        self.value: float = 0
+        self.log_interval = log_interval
+        self.last_log_time = time()
+
+    def __enter__(self) -> Gauge:
+        """Enter the gauge context.
+
+        Returns:
+            The gauge instance.
+        """
+        self.last_log_time = time()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit the gauge context.
+
+        Args:
+            exc_type: The exception type.
+            exc_val: The exception value.
+            exc_tb: The exception traceback.
+        """
+        self._pop()
+
+    def _pop(self) -> None:
+        """Log the current value."""
+        log(self.logger, Point("gauge", self.metric, self.value, self.tags))
+        self.last_log_time = time()
+
+    def set(self, value: float) -> None:  # noqa: A003
+        """Set the gauge value, logging it if the log interval has elapsed.
+
+        Args:
+            value: The new value.
+        """
+        self.value = value
+        if time() - self.last_log_time > self.log_interval:
+            self._pop()
+
+
 class Timer(Meter):
     """A meter for timing things."""
 
@@ -377,6 +442,71 @@ def sync_timer(stream: str, **tags: t.Any) -> Timer:
     return Timer(Metric.SYNC_DURATION, tags)
 
 
+def drain_timer(stream: str, **tags: t.Any) -> Timer:
+    """Use for timing the drain of a batch of records by a sink.
+
+    Args:
+        stream: The stream name.
+        tags: Tags to add to the measurement.
+
+    Returns:
+        A timer for timing the drain of a sink.
+    """
+    tags[Tag.STREAM] = stream
+    return Timer(Metric.DRAIN_DURATION, tags)
+
+
+def writer_queue_gauge(
+    log_interval: float = DEFAULT_LOG_INTERVAL,
+    **tags: t.Any,
+) -> Gauge:
+    """Use for sampling the number of messages waiting to be written.
+
+    Args:
+        log_interval: The interval at which to log the queue depth.
+        tags: Tags to add to the measurement.
+
+    Returns:
+        A gauge for the writer queue depth.
+    """
+    return Gauge(Metric.WRITER_QUEUE_DEPTH, tags, log_interval=log_interval)
+
+
+def buffer_size_gauge(
+    stream: str,
+    log_interval: float = DEFAULT_LOG_INTERVAL,
+    **tags: t.Any,
+) -> Gauge:
+    """Use for sampling the approximate bytes of records buffered by a sink.
+
+    Args:
+        stream: The stream name.
+        log_interval: The interval at which to log the buffer size.
+        tags: Tags to add to the measurement.
+
+    Returns:
+        A gauge for the buffer size of a sink.
+    """
+    tags[Tag.STREAM] = stream
+    return Gauge(Metric.BUFFER_SIZE, tags, log_interval=log_interval)
+
+
+def checkpoint_lag_gauge(
+    log_interval: float = DEFAULT_LOG_INTERVAL,
+    **tags: t.Any,
+) -> Gauge:
+    """Use for sampling how long the oldest unwritten STATE message has waited.
+
+    Args:
+        log_interval: The interval at which to log the lag.
+        tags: Tags to add to the measurement.
+
+    Returns:
+        A gauge for the checkpoint lag of a target, in seconds.
+    """
+    return Gauge(Metric.CHECKPOINT_LAG, tags, log_interval=log_interval)
+
+
 def _load_yaml_logging_config(path: Traversable | Path) -> t.Any:  # noqa: ANN401
     """Load the logging config from the YAML file.
 
@@ -4,14 +4,47 @@ from __future__ import annotations
 
 import abc
 import datetime
+import typing as t
 import uuid
 
+from singer_sdk.helpers._columnar import ColumnarRecords, arrow_fields
+from singer_sdk.helpers._spill import SpilledRecords
+from singer_sdk.helpers._util import approximate_size
 from singer_sdk.sinks.core import Sink
 
+if t.TYPE_CHECKING:
+    import pyarrow as pa
+
 
 class BatchSink(Sink):
     """Base class for batched record writers."""
 
+    #: Keep only the last record read for each key in a batch. Records are keyed on
+    #: the stream `key_properties`, and replaced records are tallied with
+    #: :meth:`~singer_sdk.Sink.tally_duplicate_merged`.
+    deduplicate_records: bool = False
+
+    #: Property that orders records with the same key, such as the replication key,
+    #: when :attr:`deduplicate_records` is set. A record only replaces a buffered
+    #: record whose value is not greater. When None, the last record read wins.
+    deduplication_order_by: str | None = None
+
+    #: Approximate size in bytes of the records of a batch that are kept in memory.
+    #: Further records of the batch are spilled to a temporary file, and
+    #: `context["records"]` becomes an iterable of the records in memory and on
+    #: disk. When 0, batches are kept in memory. Batches are not spilled when
+    #: :attr:`deduplicate_records` is set.
+    max_bytes_in_memory: int = 0
+
+    #: Buffer batches column by column in Arrow arrays instead of a list of dicts,
+    #: and process them with :meth:`process_batch_table`. Requires `pyarrow`.
+    #: Batches are not buffered in columns when :attr:`deduplicate_records` is set.
+    columnar_buffer: bool = False
+
+    _batch_bytes_in_memory: int = 0
+    _deduplicated_records: list[dict] | None = None
+    _record_positions: dict[t.Hashable, int]
+
     def _get_context(self, record: dict) -> dict:  # noqa: ARG002
         """Return a batch context. If no batch is active, return a new batch context.
 
@@ -63,14 +96,115 @@ class BatchSink(Sink):
         If duplicates are merged, these can be tracked via
         :meth:`~singer_sdk.Sink.tally_duplicate_merged()`.
 
+        With :attr:`deduplicate_records`, a record with the same key as a record
+        already in the batch replaces it, at its position in `context["records"]`.
+
+        With :attr:`max_bytes_in_memory`, records are spilled to disk once the batch
+        is over that size, and `context["records"]` is a
+        :class:`~singer_sdk.helpers._spill.SpilledRecords` instead of a list.
+
+        With :attr:`columnar_buffer`, `context["records"]` is a
+        :class:`~singer_sdk.helpers._columnar.ColumnarRecords`.
+
         Args:
             record: Individual record in the stream.
             context: Stream partition or context dictionary.
         """
+        deduplicate = self.deduplicate_records and self._key_properties
         if "records" not in context:
-            context["records"] = []
+            context["records"] = (
+                ColumnarRecords(
+                    arrow_fields(
+                        self.schema,
+                        parse_timestamps=not self.defer_timestamp_parsing,
+                    ),
+                )
+                if self.columnar_buffer and not deduplicate
+                else []
+            )
+
+        if deduplicate:
+            self._merge_record(record, context["records"])
+            return
+
+        records = context["records"]
+        records.append(record)
+        if self.max_bytes_in_memory and isinstance(records, list):
+            self._batch_bytes_in_memory += approximate_size(record)
+            if self._batch_bytes_in_memory > self.max_bytes_in_memory:
+                self.logger.info(
+                    "Batch of stream '%s' is over %d bytes, spilling to disk",
+                    self.stream_name,
+                    self.max_bytes_in_memory,
+                )
+                context["records"] = SpilledRecords(records)
+
+    def _tally_buffered_bytes(self, record: dict) -> int:
+        if self._pending_batch is not None and isinstance(
+            self._pending_batch.get("records"),
+            SpilledRecords,
+        ):
+            # Spilled records do not use memory
+            return 0
+        return super()._tally_buffered_bytes(record)
+
+    def _reset_buffer_tally(self) -> None:
+        super()._reset_buffer_tally()
+        self._batch_bytes_in_memory = 0
+        self._deduplicated_records = None
+
+    def _merge_record(self, record: dict, records: list[dict]) -> None:
+        """Add a record to a batch, replacing the buffered record with its key.
+
+        Args:
+            record: Individual record in the stream.
+            records: The records of the batch.
+        """
+        if records is not self._deduplicated_records:
+            self._deduplicated_records = records
+            self._record_positions = {}
+
+        key = tuple(record.get(name) for name in self._key_properties)
+        try:
+            position = self._record_positions.get(key)
+        except TypeError:
+            # Unhashable key values are not deduplicated
+            records.append(record)
+            return
+
+        if position is None:
+            self._record_positions[key] = len(records)
+            records.append(record)
+            return
+
+        self.tally_duplicate_merged()
+        order_by = self.deduplication_order_by
+        if order_by is not None and not self._is_newer(
+            record.get(order_by),
+            records[position].get(order_by),
+        ):
+            return
+        records[position] = record
+
+    @staticmethod
+    def _is_newer(value: t.Any, buffered_value: t.Any) -> bool:  # noqa: ANN401
+        """Check if a record should replace a buffered record with the same key.
+
+        Args:
+            value: Ordering value of the new record.
+            buffered_value: Ordering value of the buffered record.
 
-        context["records"].append(record)
+        Returns:
+            True unless the buffered value is greater. Missing values sort first.
+        """
+        if buffered_value is None:
+            return True
+        if value is None:
+            return False
+        try:
+            return not value < buffered_value
+        except TypeError:
+            return True
 
     @abc.abstractmethod
     def process_batch(self, context: dict) -> None:
@@ -88,3 +222,34 @@ class BatchSink(Sink):
         Args:
             context: Stream partition or context dictionary.
         """
+
+    def process_batch_table(self, table: pa.Table, context: dict) -> None:
+        """Process a batch that was buffered in columns, as an Arrow table.
+
+        Called instead of :meth:`process_batch` for batches buffered with
+        :attr:`columnar_buffer`, unless they fell back to dicts. Developers may
+        override this method to load the table without building a dict per record.
+
+        By default, calls :meth:`process_batch`, where `context["records"]` yields
+        the records of the table as dicts.
+
+        Args:
+            table: The records of the batch.
+            context: Stream partition or context dictionary.
+        """
+        _ = table
+        self.process_batch(context)
+
+    def _process_batch_table(self, table: pa.Table, context: dict) -> None:
+        if self.columnar_buffer:
+            self.process_batch_table(table, context)
+        else:
+            super()._process_batch_table(table, context)
+
+    def _process_batch(self, context: dict) -> None:
+        records = context.get("records")
+        table = records.to_table() if isinstance(records, ColumnarRecords) else None
+        if table is None:
+            self.process_batch(context)
+        else:
+            self.process_batch_table(table, context)
@@ -5,7 +5,9 @@ from __future__ import annotations
 import abc
 import copy
 import datetime
+import functools
 import importlib.util
+import itertools
 import json
 import time
 import typing as t
@@ -13,7 +15,7 @@ from gzip import GzipFile
 from gzip import open as gzip_open
 from types import MappingProxyType
 
-from jsonschema import Draft7Validator
+from jsonschema import Draft7Validator, ValidationError
 
 from singer_sdk.exceptions import MissingKeyPropertiesError
 from singer_sdk.helpers._batch import (
@@ -22,26 +24,51 @@ from singer_sdk.helpers._batch import (
     BatchFileFormat,
     StorageTarget,
 )
-from singer_sdk.helpers._compat import (
-    date_fromisoformat,
-    datetime_fromisoformat,
-    final,
-    time_fromisoformat,
+from singer_sdk.helpers._columnar import ColumnarRecords, TableRecords
+from singer_sdk.helpers._compat import final
+from singer_sdk.helpers._prefetch import prefetch
+from singer_sdk.helpers._spill import SpilledRecords
+from singer_sdk.helpers._timestamps import (
+    SchemaPlan,
+    parse_columns,
+    parse_fields,
+    plan_schema,
 )
-from singer_sdk.helpers._typing import (
-    DatetimeErrorTreatmentEnum,
-    get_datelike_property_type,
-    handle_invalid_timestamp_in_record,
+from singer_sdk.helpers._typing import DatetimeErrorTreatmentEnum
+from singer_sdk.helpers._util import approximate_size
+from singer_sdk.helpers._validation import (
+    BATCH_VALIDATION,
+    BATCH_VALIDATION_CHUNK_SIZE,
+    FULL_VALIDATION,
+    JSONSCHEMA_BACKEND,
+    SAMPLE_VALIDATION,
+    get_record_check,
+    get_validator,
+    schema_fingerprint,
+    submit_batch_validation,
 )
+from singer_sdk.metrics import buffer_size_gauge
 
 if t.TYPE_CHECKING:
+    from concurrent.futures import Future
     from logging import Logger
 
+    import pyarrow as pa
+
+    from singer_sdk.helpers._validation import RecordCheck
     from singer_sdk.target_base import Target
 
 JSONSchemaValidator = Draft7Validator
 
 
+class _SchemaArtifacts(t.NamedTuple):
+    """The validator and record check of a schema, shared by sinks of that schema."""
+
+    fingerprint: str
+    validator: Draft7Validator
+    record_check: RecordCheck | None
+
+
 class Sink(metaclass=abc.ABCMeta):
     """Abstract base class for target sinks."""
 
@@ -51,6 +78,44 @@ class Sink(metaclass=abc.ABCMeta):
 
     MAX_SIZE_DEFAULT = 10000
 
+    #: Number of full batches that can be drained in the background while new
+    #: records are read into a fresh buffer. When 0, full batches are drained before
+    #: more input is read. Sinks that drain in the background must read their batch
+    #: from the `context` passed to :meth:`process_batch`, not from sink attributes.
+    max_batches_in_flight: int = 0
+
+    #: Maximum number of sinks of the same :attr:`drain_concurrency_group` that can be
+    #: drained at the same time. When 0, drains are not limited.
+    max_concurrent_drains: int = 0
+
+    #: Also parse date-like values in nested objects and arrays. Off by default,
+    #: since sinks often serialize nested values to JSON, which has no date types.
+    parse_nested_timestamps: bool = False
+
+    #: Parse date-like values when a batch is drained, one field at a time, instead
+    #: of as each record is read. Only records in `context["records"]` are parsed,
+    #: so this is meant for batch sinks that keep the default
+    #: :meth:`~singer_sdk.BatchSink.process_record`.
+    defer_timestamp_parsing: bool = False
+
+    # Records are kept until the sink is drained, not written as they are read
+    _buffers_records: bool = True
+
+    #: Number of records of a BATCH message file read and processed at a time, with
+    #: :meth:`process_batch`. When 0, each file is processed at once.
+    batch_file_chunk_size: int = 0
+
+    #: Maximum number of files of a BATCH message that are read and decoded at the
+    #: same time, ahead of processing.
+    max_concurrent_batch_files: int = 1
+
+    #: Maximum age, in minutes, of the oldest buffered record before the sink is
+    #: drained, independently of other sinks. When None, the target default is used.
+    max_record_age_in_minutes: float | None = None
+
+    _timestamp_plan: tuple[dict, SchemaPlan] | None = None
+    _sdc_batched_at: tuple[datetime.datetime | None, str] = (None, "")
+
     def __init__(
         self,
         target: Target,
@@ -94,11 +159,46 @@ class Sink(metaclass=abc.ABCMeta):
         self._total_records_read: int = 0
         self._batch_records_read: int = 0
         self._batch_dupe_records_merged: int = 0
-
-        self._validator = Draft7Validator(
-            schema,
-            format_checker=Draft7Validator.FORMAT_CHECKER,
+        self._batch_bytes_buffered: int = 0
+        self._batch_started_at: float | None = None
+        # Number of batches taken from the buffer to be drained, and drained
+        self._drains_started: int = 0
+        self._drains_completed: int = 0
+        self._buffer_size_gauge = buffer_size_gauge(stream=stream_name)
+
+        # Schema artifacts are reused by sinks created for the same schema. They are
+        # looked up on first use, after the sink is done changing its schema.
+        self._validation_backend: str = self.config.get(
+            "validation_backend",
+            JSONSCHEMA_BACKEND,
         )
+        self._schema_artifacts: _SchemaArtifacts | None = None
+        self._validation_mode: str = self.config.get(
+            "validation_mode",
+            FULL_VALIDATION,
+        )
+        self._validation_sample_rate: int = self.config.get(
+            "validation_sample_rate",
+            100,
+        )
+        self._validation_sample_size: int = self.config.get(
+            "validation_sample_size",
+            0,
+        )
+        if self._validation_mode == BATCH_VALIDATION and not self._buffers_records:
+            # Records are written as they are read, so they are validated first
+            self._validation_mode = FULL_VALIDATION
+
+        # Copies of the records read in `batch` mode, by position in the stream, and
+        # chunks of them being validated in the background
+        self._records_to_validate: list[tuple[int, dict]] = []
+        self._validation_chunks: list[Future] = []
+        # Records to validate and chunks of the batches taken from the buffer, by
+        # batch context id
+        self._batch_validations: dict[
+            int,
+            tuple[list[Future], list[tuple[int, dict]]],
+        ] = {}
 
     def _get_context(self, record: dict) -> dict:  # noqa: ARG002
         """Return an empty dictionary by default.
@@ -142,6 +242,61 @@ class Sink(metaclass=abc.ABCMeta):
         """
         return self.current_size >= self.max_size
 
+    @property
+    def buffered_bytes(self) -> int:
+        """Get the approximate size of the records in the current batch.
+
+        Only tracked if the target has a `max_buffer_bytes` setting.
+
+        Returns:
+            The approximate size in bytes of the records to drain.
+        """
+        return self._batch_bytes_buffered
+
+    @property
+    def drain_concurrency_group(self) -> t.Hashable:
+        """Get the group of sinks that share :attr:`max_concurrent_drains`.
+
+        Defaults to the sink class, so that `max_concurrent_drains` limits the drains
+        of all sinks of the same class.
+
+        Returns:
+            A hashable group key.
+        """
+        return type(self)
+
+    def _get_schema_artifacts(self) -> _SchemaArtifacts:
+        """Get the validator and record check of the current schema.
+
+        They are looked up again for each batch, so that changes to :attr:`schema`
+        made by the sink between batches are seen.
+
+        Returns:
+            The schema artifacts.
+        """
+        artifacts = self._schema_artifacts
+        if artifacts is None:
+            fingerprint = schema_fingerprint(self.schema)
+            artifacts = _SchemaArtifacts(
+                fingerprint,
+                get_validator(self.schema, fingerprint),
+                get_record_check(self._validation_backend, self.schema, fingerprint),
+            )
+            self._schema_artifacts = artifacts
+        return artifacts
+
+    @property
+    def _schema_fingerprint(self) -> str:
+        return self._get_schema_artifacts().fingerprint
+
+    @property
+    def _validator(self) -> Draft7Validator:
+        return self._get_schema_artifacts().validator
+
+    @property
+    def _record_check(self) -> RecordCheck | None:
+        return self._get_schema_artifacts().record_check
+
     # Tally methods
 
     @final
@@ -153,9 +308,35 @@ class Sink(metaclass=abc.ABCMeta):
         Args:
             count: Number to increase record count by.
         """
+        if not self._batch_records_read:
+            self._batch_started_at = time.time()
         self._total_records_read += count
         self._batch_records_read += count
 
+    def _tally_buffered_bytes(self, record: dict) -> int:
+        """Add the approximate size of a record to the size of the current batch.
+
+        Args:
+            record: The buffered record.
+
+        Returns:
+            The approximate size of the record.
+        """
+        size = approximate_size(record)
+        self._batch_bytes_buffered += size
+        self._buffer_size_gauge.set(self._batch_bytes_buffered)
+        return size
+
+    def _reset_buffer_tally(self) -> None:
+        self._batch_records_read = 0
+        self._reset_buffered_bytes()
+        self._batch_started_at = None
+
+    def _reset_buffered_bytes(self) -> None:
+        if self._batch_bytes_buffered:
+            self._batch_bytes_buffered = 0
+            self._buffer_size_gauge.set(0)
+
     @final
     def tally_record_written(self, count: int = 1) -> None:
         """Increment the records written tally.
@@ -250,14 +431,22 @@ class Sink(metaclass=abc.ABCMeta):
             message: The record message.
             context: Stream partition or context dictionary.
         """
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        batch_start_time = context.get("batch_start_time")
+        if batch_start_time:
+            # The batch start time is formatted once per batch
+            if self._sdc_batched_at[0] is not batch_start_time:
+                self._sdc_batched_at = (
+                    batch_start_time,
+                    batch_start_time.isoformat(),
+                )
+            batched_at = self._sdc_batched_at[1]
+        else:
+            batched_at = now.isoformat()
+
         record["_sdc_extracted_at"] = message.get("time_extracted")
-        record["_sdc_received_at"] = datetime.datetime.now(
-            tz=datetime.timezone.utc,
-        ).isoformat()
-        record["_sdc_batched_at"] = (
-            context.get("batch_start_time")
-            or datetime.datetime.now(tz=datetime.timezone.utc)
-        ).isoformat()
+        record["_sdc_received_at"] = now.isoformat()
+        record["_sdc_batched_at"] = batched_at
         record["_sdc_deleted_at"] = record.get("_sdc_deleted_at")
         record["_sdc_sequence"] = int(round(time.time() * 1000))
         record["_sdc_table_version"] = message.get("version")
@@ -329,14 +518,110 @@ class Sink(metaclass=abc.ABCMeta):
         Returns:
             TODO
         """
-        self._validator.validate(record)
-        self._parse_timestamps_in_record(
-            record=record,
-            schema=self.schema,
-            treatment=self.datetime_error_treatment,
-        )
+        mode = self._validation_mode
+        if mode == BATCH_VALIDATION:
+            self._queue_batch_validation(record)
+        elif mode != SAMPLE_VALIDATION or self._is_sampled():
+            self._validate_record(record, self._total_records_read)
+        if not self.defer_timestamp_parsing:
+            self._parse_timestamps_in_record(
+                record=record,
+                schema=self.schema,
+                treatment=self.datetime_error_treatment,
+            )
         return record
 
+    def _is_sampled(self) -> bool:
+        """Check if the next record is picked for validation in `sample` mode.
+
+        Returns:
+            True if the record should be validated.
+        """
+        batch_index = self._batch_records_read
+        rate = self._validation_sample_rate
+        return batch_index < self._validation_sample_size or (
+            rate > 0 and batch_index % rate == 0
+        )
+
+    def _validate_record(self, record: dict, record_index: int) -> None:
+        """Validate a record against the stream schema.
+
+        Args:
+            record: Individual record in the stream.
+            record_index: Position of the record in the stream, starting at 0.
+
+        Raises:
+            ValidationError: If the record is not valid.
+        """
+        artifacts = self._schema_artifacts or self._get_schema_artifacts()
+        if artifacts.record_check is not None and artifacts.record_check(record):
+            return
+
+        # The reference validator decides, and reports the error
+        try:
+            artifacts.validator.validate(record)
+        except ValidationError as exc:
+            self.logger.error(
+                "Record %d of stream '%s' failed validation: %s",
+                record_index,
+                self.stream_name,
+                exc.message,
+            )
+            raise
+
+    def _queue_batch_validation(self, record: dict) -> None:
+        """Keep a copy of a record as read, to validate it in `batch` mode.
+
+        The copy is not changed when timestamps are parsed, or by
+        :meth:`preprocess_record` unless it changes nested values in place. Copies
+        are validated in the background by chunks, as they are read.
+
+        Args:
+            record: Individual record in the stream.
+        """
+        self._records_to_validate.append(
+            (
+                self._total_records_read,
+                copy.deepcopy(record) if self.parse_nested_timestamps else dict(record),
+            ),
+        )
+        if len(self._records_to_validate) >= BATCH_VALIDATION_CHUNK_SIZE:
+            self._validation_chunks.append(
+                submit_batch_validation(
+                    self._validate_records,
+                    self._records_to_validate,
+                ),
+            )
+            self._records_to_validate = []
+
+    def _validate_records(self, records: list[tuple[int, dict]]) -> None:
+        """Validate records against the stream schema.
+
+        Args:
+            records: The records, with their position in the stream.
+        """
+        for record_index, record in records:
+            self._validate_record(record, record_index)
+
+    def _validate_batch(self, context: dict) -> None:
+        """Validate the records of a batch in `batch` mode, before it is processed.
+
+        Records are validated as they were read, whichever way the sink buffers
+        them. Chunks already validated in the background are waited for, and the
+        remaining records are validated in the thread that drains the batch.
+
+        Args:
+            context: Stream partition or context dictionary of the batch.
+        """
+        pending = self._batch_validations.pop(id(context), None)
+        if pending is None:
+            return
+
+        chunks, records = pending
+        for chunk in chunks:
+            chunk.result()
+        self._validate_records(records)
+
     def _singer_validate_message(self, record: dict) -> None:
         """Ensure record conforms to Singer Spec.
 
@@ -368,37 +653,98 @@ class Sink(metaclass=abc.ABCMeta):
         is out of range, repair logic will be driven by the `treatment` input arg:
         MAX, NULL, or ERROR.
 
+        The date-like fields of a schema are only looked up once, the first time a
+        record of that schema is parsed.
+
         Args:
             record: Individual record in the stream.
             schema: TODO
             treatment: TODO
         """
-        for key, value in record.items():
-            if key not in schema["properties"]:
+        plan = self._get_timestamp_plan(schema)
+        if not plan.property_names.issuperset(record):
+            for key in record.keys() - plan.property_names:
                 self.logger.warning("No schema for record field '%s'", key)
-                continue
-            datelike_type = get_datelike_property_type(schema["properties"][key])
-            if datelike_type:
-                date_val = value
-                try:
-                    if value is not None:
-                        if datelike_type == "time":
-                            date_val = time_fromisoformat(date_val)
-                        elif datelike_type == "date":
-                            date_val = date_fromisoformat(date_val)
-                        else:
-                            date_val = datetime_fromisoformat(date_val)
-                except ValueError as ex:
-                    date_val = handle_invalid_timestamp_in_record(
-                        record,
-                        [key],
-                        date_val,
-                        datelike_type,
-                        ex,
-                        treatment,
-                        self.logger,
-                    )
-                record[key] = date_val
+        parse_fields(record, record, plan.fields, [], treatment, self.logger)
+
+    def _get_timestamp_plan(self, schema: dict) -> SchemaPlan:
+        """Get the timestamp parsing plan of a schema.
+
+        Args:
+            schema: The schema of the records to parse.
+
+        Returns:
+            The parsing plan, which is cached for the last schema seen.
+        """
+        if self._timestamp_plan is None or self._timestamp_plan[0] is not schema:
+            plan = plan_schema(schema, nested=self.parse_nested_timestamps)
+            self._timestamp_plan = (schema, plan)
+        return self._timestamp_plan[1]
+
+    def _parse_batch_timestamps(self, context: dict) -> None:
+        """Parse the date-like values of a batch whose parsing was deferred.
+
+        Records spilled to disk, or built from a columnar buffer, are parsed one by
+        one as they are read.
+
+        Args:
+            context: Stream partition or context dictionary of the batch.
+        """
+        records = context.get("records")
+        if not self.defer_timestamp_parsing or not records:
+            return
+
+        plan = self._get_timestamp_plan(self.schema)
+        treatment = self.datetime_error_treatment
+        warned_keys: set[str] = set()
+
+        def parse_record(record: dict) -> None:
+            self._warn_unknown_keys([record], plan, warned_keys)
+            parse_fields(record, record, plan.fields, [], treatment, self.logger)
+
+        if isinstance(records, ColumnarRecords):
+            dict_records = records.dict_records()
+            if dict_records is None:
+                records.on_read = parse_record
+                return
+            records = dict_records
+        elif isinstance(records, SpilledRecords):
+            records.on_read = parse_record
+            records = records.in_memory
+
+        self._warn_unknown_keys(records, plan, warned_keys)
+        parse_columns(records, plan.fields, treatment, self.logger)
+
+    def _warn_unknown_keys(
+        self,
+        records: t.Iterable[dict],
+        plan: SchemaPlan,
+        warned_keys: set[str],
+    ) -> None:
+        """Warn once about each record field that is not in the schema.
+
+        Args:
+            records: The records to check.
+            plan: The timestamp parsing plan of the schema.
+            warned_keys: Fields already warned about, updated in place.
+        """
+        unknown_keys: set[str] = set()
+        for record in records:
+            if not plan.property_names.issuperset(record):
+                unknown_keys.update(record.keys() - plan.property_names)
+        for key in sorted(unknown_keys - warned_keys):
+            self.logger.warning("No schema for record field '%s'", key)
+        warned_keys.update(unknown_keys)
+
+    def _release_batch(self, context: dict) -> None:
+        """Free the resources of a batch once it is processed.
+
+        Args:
+            context: Stream partition or context dictionary of the batch.
+        """
+        records = context.get("records")
+        if isinstance(records, SpilledRecords):
+            records.close()
 
     def _after_process_record(self, context: dict) -> None:
         """Perform post-processing and record keeping. Internal hook.
@@ -450,8 +796,32 @@ class Sink(metaclass=abc.ABCMeta):
         """
         self._context_draining = self._pending_batch or {}
         self._pending_batch = None
+        self._drains_started += 1
+        # Look the schema artifacts up again for the next batch
+        self._schema_artifacts = None
+        if self._records_to_validate or self._validation_chunks:
+            self._batch_validations[id(self._context_draining)] = (
+                self._validation_chunks,
+                self._records_to_validate,
+            )
+            self._records_to_validate = []
+            self._validation_chunks = []
         return self._context_draining
 
+    def _detach_batch(self) -> tuple[dict, int]:
+        """Hand off the pending batch, so that new records go to a fresh buffer.
+
+        Returns:
+            The batch context, and the number of records to tally as written once
+            the batch is drained.
+        """
+        context = self.start_drain()
+        self._context_draining = None
+        records_written = self._batch_records_read - self._batch_dupe_records_merged
+        self._batch_dupe_records_merged = 0
+        self._reset_buffer_tally()
+        return context, records_written
+
     @abc.abstractmethod
     def process_batch(self, context: dict) -> None:
         """Process all records per the batch's `context` dictionary.
@@ -468,6 +838,14 @@ class Sink(metaclass=abc.ABCMeta):
         msg = "No handling exists for process_batch()."
         raise NotImplementedError(msg)
 
+    def _process_batch(self, context: dict) -> None:
+        """Process a drained batch with the hook that fits how it was buffered.
+
+        Args:
+            context: Stream partition or context dictionary of the batch.
+        """
+        self.process_batch(context)
+
     def mark_drained(self) -> None:
         """Reset `records_to_drain` and any other tracking."""
         self.drained_state = self._draining_state
@@ -477,7 +855,8 @@ class Sink(metaclass=abc.ABCMeta):
             self.tally_record_written(
                 self._batch_records_read - self._batch_dupe_records_merged,
             )
-        self._batch_records_read = 0
+        self._batch_dupe_records_merged = 0
+        self._reset_buffer_tally()
 
     def activate_version(self, new_version: int) -> None:
         """Bump the active version of the target table.
@@ -518,48 +897,100 @@ class Sink(metaclass=abc.ABCMeta):
     ) -> None:
         """Process a batch file with the given batch context.
 
+        With :attr:`batch_file_chunk_size`, files are processed in chunks of that
+        many records. With :attr:`max_concurrent_batch_files`, files are read and
+        decoded in a thread pool, but still processed one at a time, in order.
+
         Args:
             encoding: The batch file encoding.
             files: The batch files to process.
+        """
+        if self.max_concurrent_batch_files > 1 and len(files) > 1:
+            chunks = prefetch(
+                [
+                    functools.partial(self._read_batch_file, encoding, path)
+                    for path in files
+                ],
+                max_workers=self.max_concurrent_batch_files,
+            )
+        else:
+            chunks = itertools.chain.from_iterable(
+                self._read_batch_file(encoding, path) for path in files
+            )
+
+        for chunk in chunks:
+            if isinstance(chunk, list):
+                self.process_batch({"records": chunk})
+            else:
+                self._process_batch_table(chunk, {"records": TableRecords(chunk)})
+
+    def _read_batch_file(
+        self,
+        encoding: BaseBatchFileEncoding,
+        path: str,
+    ) -> t.Iterator[list[dict] | pa.Table]:
+        """Read the records of a batch file, in chunks.
+
+        Args:
+            encoding: The batch file encoding.
+            path: The batch file to read.
+
+        Yields:
+            Lists of records from JSONL files, and Arrow tables from Parquet files.
 
         Raises:
             NotImplementedError: If the batch file encoding is not supported.
         """
         file: GzipFile | t.IO
-        storage: StorageTarget | None = None
+        head, tail = StorageTarget.split_url(path)
+        if self.batch_config:
+            storage = self.batch_config.storage
+        else:
+            storage = StorageTarget.from_url(head)
+        chunk_size = self.batch_file_chunk_size or None
+
+        if encoding.format == BatchFileFormat.JSONL:
+            with storage.fs(create=False) as batch_fs, batch_fs.open(
+                tail,
+                mode="rb",
+            ) as file:
+                context_file = (
+                    gzip_open(file) if encoding.compression == "gzip" else file
+                )
+                lines = iter(context_file)  # type: ignore[call-overload]
+                while True:
+                    chunk = [
+                        json.loads(line) for line in itertools.islice(lines, chunk_size)
+                    ]
+                    if not chunk:
+                        break
+                    yield chunk
+        elif (
+            importlib.util.find_spec("pyarrow")
+            and encoding.format == BatchFileFormat.PARQUET
+        ):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            with storage.fs(create=False) as batch_fs, batch_fs.open(
+                tail,
+                mode="rb",
+            ) as file:
+                if chunk_size is None:
+                    yield pq.read_table(file)
+                    return
+                for batch in pq.ParquetFile(file).iter_batches(batch_size=chunk_size):
+                    yield pa.Table.from_batches([batch])
+        else:
+            msg = f"Unsupported batch encoding format: {encoding.format}"
+            raise NotImplementedError(msg)
 
-        for path in files:
-            head, tail = StorageTarget.split_url(path)
+    def _process_batch_table(self, table: pa.Table, context: dict) -> None:
+        """Process records read from a batch file as an Arrow table.
 
-            if self.batch_config:
-                storage = self.batch_config.storage
-            else:
-                storage = StorageTarget.from_url(head)
-
-            if encoding.format == BatchFileFormat.JSONL:
-                with storage.fs(create=False) as batch_fs, batch_fs.open(
-                    tail,
-                    mode="rb",
-                ) as file:
-                    context_file = (
-                        gzip_open(file) if encoding.compression == "gzip" else file
-                    )
-                    context = {"records": [json.loads(line) for line in context_file]}  # type: ignore[attr-defined]
-                    self.process_batch(context)
-            elif (
-                importlib.util.find_spec("pyarrow")
-                and encoding.format == BatchFileFormat.PARQUET
-            ):
-                import pyarrow.parquet as pq
-
-                with storage.fs(create=False) as batch_fs, batch_fs.open(
-                    tail,
-                    mode="rb",
-                ) as file:
-                    context_file = file
-                    table = pq.read_table(context_file)
-                    context = {"records": table.to_pylist()}
-                    self.process_batch(context)
-            else:
-                msg = f"Unsupported batch encoding format: {encoding.format}"
-                raise NotImplementedError(msg)
+        Args:
+            table: The records.
+            context: Stream partition or context dictionary.
+        """
+        context["records"] = table.to_pylist()
+        self.process_batch(context)
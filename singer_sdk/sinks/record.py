@@ -12,6 +12,7 @@ class RecordSink(Sink):
     """Base class for singleton record writers."""
 
     current_size = 0  # Records are always written directly
+    _buffers_records = False
 
     def _after_process_record(self, context: dict) -> None:  # noqa: ARG002
         """Perform post-processing and record keeping. Internal hook.
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import itertools
 import re
 import typing as t
+import weakref
 from collections import defaultdict
 from copy import copy
 from textwrap import dedent
@@ -15,6 +17,8 @@ from sqlalchemy.sql.expression import bindparam
 from singer_sdk.connectors import SQLConnector
 from singer_sdk.exceptions import ConformedNameClashException
 from singer_sdk.helpers._conformers import replace_leading_digit
+from singer_sdk.helpers._util import BoundedCache
+from singer_sdk.helpers._validation import schema_fingerprint
 from singer_sdk.sinks.batch import BatchSink
 
 if t.TYPE_CHECKING:
@@ -23,6 +27,31 @@ if t.TYPE_CHECKING:
     from singer_sdk.target_base import Target
 
 
+class _SQLSinkCaches:
+    """Conformed names and schemas, and insert statements, of the sinks of a connector.
+
+    Entries are keyed by sink class and stream name, since sinks may override how
+    names are conformed and statements generated, and are bounded in number.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the caches."""
+        #: Conformed schemas, by schema fingerprint.
+        self.conformed_schemas: BoundedCache[
+            tuple[type, str, str], dict
+        ] = BoundedCache(256)
+        #: Insert statements, by table name and schema fingerprint.
+        self.insert_statements: BoundedCache[
+            tuple[type, str, str, str],
+            str | Executable,
+        ] = BoundedCache(256)
+        #: Conformed property names, by record keys.
+        self.conformed_property_names: BoundedCache[
+            tuple[type, str, tuple[str, ...]],
+            dict[str, str],
+        ] = BoundedCache(1024)
+
+
 class SQLSink(BatchSink):
     """SQL-type sink type."""
 
@@ -30,6 +59,22 @@ class SQLSink(BatchSink):
     soft_delete_column_name = "_sdc_deleted_at"
     version_column_name = "_sdc_table_version"
 
+    # One writer per table
+    max_concurrent_drains = 1
+
+    #: Number of records conformed and sent to the database at a time by
+    #: :meth:`bulk_insert_records`, within a single transaction. Batches spilled to
+    #: disk are read one chunk at a time, so they are never held in memory at once.
+    #: When 0, all records are inserted at once.
+    insert_chunk_size: int = 10_000
+
+    # Caches of the sinks that share a connector, so that sinks created again for a
+    # stream reuse them. Sinks of targets with another connector, and so another
+    # config, do not share them.
+    _caches_by_connector: t.ClassVar[
+        weakref.WeakKeyDictionary[SQLConnector, _SQLSinkCaches]
+    ] = weakref.WeakKeyDictionary()
+
     def __init__(
         self,
         target: Target,
@@ -49,6 +94,10 @@ class SQLSink(BatchSink):
         """
         self._connector: SQLConnector
         self._connector = connector or self.connector_class(dict(target.config))
+        self._caches = self._caches_by_connector.setdefault(
+            self._connector,
+            _SQLSinkCaches(),
+        )
         super().__init__(target, stream_name, schema, key_properties)
 
     @property
@@ -118,6 +167,15 @@ class SQLSink(BatchSink):
             db_name=self.database_name,
         )
 
+    @property
+    def drain_concurrency_group(self) -> t.Hashable:
+        """Get the group of sinks that share :attr:`max_concurrent_drains`.
+
+        Returns:
+            The fully qualified table name, so that a table has one writer at a time.
+        """
+        return self.full_table_name
+
     @property
     def full_schema_name(self) -> str:
         """Return the fully qualified schema name.
@@ -219,10 +277,61 @@ class SQLSink(BatchSink):
         Returns:
             New record dictionary with conformed column names.
         """
-        conformed_property_names = {key: self.conform_name(key) for key in record}
-        self._check_conformed_names_not_duplicated(conformed_property_names)
+        keys = tuple(record)
+        conformed_property_names = self._caches.conformed_property_names.get(
+            (type(self), self.stream_name, keys),
+            lambda: self._conform_property_names(keys),
+        )
         return {conformed_property_names[key]: value for key, value in record.items()}
 
+    def _conform_property_names(self, keys: tuple[str, ...]) -> dict[str, str]:
+        conformed_property_names = {key: self.conform_name(key) for key in keys}
+        self._check_conformed_names_not_duplicated(conformed_property_names)
+        return conformed_property_names
+
+    def _get_conformed_schema(self, schema: dict) -> dict:
+        """Get a schema with the property names conformed, built once per schema.
+
+        Args:
+            schema: JSON schema dictionary.
+
+        Returns:
+            The conformed schema, which must not be changed.
+        """
+        return self._caches.conformed_schemas.get(
+            (type(self), self.stream_name, self._get_schema_fingerprint(schema)),
+            lambda: self.conform_schema(schema),
+        )
+
+    def _get_insert_statement(
+        self,
+        full_table_name: str,
+        schema: dict,
+    ) -> str | Executable:
+        """Get the insert statement for a table, generated once per schema.
+
+        Args:
+            full_table_name: the target table name.
+            schema: the JSON schema for the table.
+
+        Returns:
+            An insert statement.
+        """
+        return self._caches.insert_statements.get(
+            (
+                type(self),
+                self.stream_name,
+                full_table_name,
+                self._get_schema_fingerprint(schema),
+            ),
+            lambda: self.generate_insert_statement(full_table_name, schema),
+        )
+
+    def _get_schema_fingerprint(self, schema: dict) -> str:
+        if schema is self.schema:
+            return self._schema_fingerprint
+        return schema_fingerprint(schema)
+
     def setup(self) -> None:
         """Set up Sink.
 
@@ -296,7 +405,8 @@ class SQLSink(BatchSink):
     ) -> int | None:
         """Bulk insert records to an existing destination table.
 
-        The default implementation uses a generic SQLAlchemy bulk insert operation.
+        The default implementation uses a generic SQLAlchemy bulk insert operation,
+        for :attr:`insert_chunk_size` records at a time in a single transaction.
         This method may optionally be overridden by developers in order to provide
         faster, native bulk uploads.
 
@@ -309,28 +419,36 @@ class SQLSink(BatchSink):
         Returns:
             True if table exists, False if not, None if unsure or undetectable.
         """
-        insert_sql = self.generate_insert_statement(
-            full_table_name,
-            schema,
-        )
+        insert_sql = self._get_insert_statement(full_table_name, schema)
         if isinstance(insert_sql, str):
             insert_sql = sqlalchemy.text(insert_sql)
 
-        conformed_records = [self.conform_record(record) for record in records]
-        property_names = list(self.conform_schema(schema)["properties"].keys())
-
-        # Create new record dicts with missing properties filled in with None
-        new_records = [
-            {name: record.get(name) for name in property_names}
-            for record in conformed_records
-        ]
+        property_names = list(self._get_conformed_schema(schema)["properties"].keys())
 
         self.logger.info("Inserting with SQL: %s", insert_sql)
 
+        rowcount: int | None = 0
+        records = iter(records)
         with self.connector._connect() as conn, conn.begin():  # noqa: SLF001
-            result = conn.execute(insert_sql, new_records)
-
-        return result.rowcount
+            while True:
+                # Create new record dicts with missing properties filled in with None
+                new_records = [
+                    {name: conformed.get(name) for name in property_names}
+                    for conformed in map(
+                        self.conform_record,
+                        itertools.islice(records, self.insert_chunk_size or None),
+                    )
+                ]
+                if not new_records:
+                    break
+                chunk_rowcount = conn.execute(insert_sql, new_records).rowcount
+                # Drivers report -1 when the count is unknown
+                if rowcount is not None and chunk_rowcount >= 0:
+                    rowcount += chunk_rowcount
+                else:
+                    rowcount = None
+
+        return rowcount
 
     def merge_upsert_from_table(
         self,
@@ -143,6 +143,7 @@ class Stream(metaclass=abc.ABCMeta):
         self._is_state_flushed: bool = True
         self._last_emitted_state: dict | None = None
         self._sync_costs: dict[str, int] = {}
+        self._time_extracted: datetime.datetime | None = None
         self.child_streams: list[Stream] = []
         if schema:
             if isinstance(schema, (PathLike, str)):
@@ -835,15 +836,15 @@ class Stream(metaclass=abc.ABCMeta):
             level=self.TYPE_CONFORMANCE_LEVEL,
             logger=self.logger,
         )
+        time_extracted = self._time_extracted or utc_now()
         for stream_map in self.stream_maps:
             mapped_record = stream_map.transform(record)
             # Emit record if not filtered
             if mapped_record is not None:
-                yield singer.RecordMessage(
+                yield singer.RecordMessage.unchecked(
                     stream=stream_map.stream_alias,
                     record=mapped_record,
-                    version=None,
-                    time_extracted=utc_now(),
+                    time_extracted=time_extracted,
                 )
 
     def _write_record_message(self, record: dict) -> None:
@@ -1072,6 +1073,7 @@ class Stream(metaclass=abc.ABCMeta):
                 timer.context = context_element
 
                 partition_record_index = 0
+                self._time_extracted = None
                 current_context = context_element or None
                 state = self.get_context_state(current_context)
                 state_partition_context = self._get_state_partition_context(
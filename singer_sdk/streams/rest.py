@@ -16,6 +16,7 @@ import requests
 from singer_sdk import metrics
 from singer_sdk.authenticators import SimpleAuthenticator
 from singer_sdk.exceptions import FatalAPIError, RetriableAPIError
+from singer_sdk.helpers._util import utc_now
 from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.pagination import (
     BaseAPIPaginator,
@@ -394,6 +395,8 @@ class RESTStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):
                     next_page_token=paginator.current_value,
                 )
                 resp = decorated_request(prepared_request, context)
+                # Records of the same page share their extraction time
+                self._time_extracted = utc_now()
                 request_counter.increment()
                 self.update_sync_costs(prepared_request, resp, context)
                 yield from self.parse_response(resp)
@@ -10,6 +10,7 @@ from sqlalchemy import nulls_first
 import singer_sdk.helpers._catalog as catalog
 from singer_sdk._singerlib import CatalogEntry, MetadataMapping
 from singer_sdk.connectors import SQLConnector
+from singer_sdk.helpers._util import utc_now
 from singer_sdk.streams.core import Stream
 
 if t.TYPE_CHECKING:
@@ -213,7 +214,10 @@ class SQLStream(Stream, metaclass=abc.ABCMeta):
             query = query.limit(self.ABORT_AT_RECORD_COUNT + 1)
 
         with self.connector._connect() as conn:  # noqa: SLF001
-            for record in conn.execute(query).mappings():
+            result = conn.execute(query)
+            # Records of the same query share their extraction time
+            self._time_extracted = utc_now()
+            for record in result.mappings():
                 # TODO: Standardize record mapping type
                 # https://github.com/meltano/sdk/issues/2096
                 transformed_record = self.post_process(dict(record))
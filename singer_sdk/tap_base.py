@@ -12,6 +12,8 @@ from enum import Enum
 import click
 
 from singer_sdk._singerlib import Catalog, StateMessage
+from singer_sdk._singerlib.compression import GZIP, ZSTD
+from singer_sdk._singerlib.framing import JSONL_FORMAT, MSGPACK_FORMAT
 from singer_sdk.configuration._dict_config import merge_missing_config_jsonschema
 from singer_sdk.exceptions import AbortedSyncFailedException, AbortedSyncPausedException
 from singer_sdk.helpers import _state
@@ -443,23 +445,26 @@ class Tap(PluginBase, SingerWriter, metaclass=abc.ABCMeta):
         self.write_message(StateMessage(value=self.state))
 
         stream: Stream
-        for stream in self.streams.values():
-            if not stream.selected and not stream.has_selected_descendents:
-                self.logger.info("Skipping deselected stream '%s'.", stream.name)
-                continue
-
-            if stream.parent_stream_type:
-                self.logger.debug(
-                    "Child stream '%s' is expected to be called "
-                    "by parent stream '%s'. "
-                    "Skipping direct invocation.",
-                    type(stream).__name__,
-                    stream.parent_stream_type.__name__,
-                )
-                continue
+        try:
+            for stream in self.streams.values():
+                if not stream.selected and not stream.has_selected_descendents:
+                    self.logger.info("Skipping deselected stream '%s'.", stream.name)
+                    continue
+
+                if stream.parent_stream_type:
+                    self.logger.debug(
+                        "Child stream '%s' is expected to be called "
+                        "by parent stream '%s'. "
+                        "Skipping direct invocation.",
+                        type(stream).__name__,
+                        stream.parent_stream_type.__name__,
+                    )
+                    continue
 
-            stream.sync()
-            stream.finalize_state_progress_markers()
+                stream.sync()
+                stream.finalize_state_progress_markers()
+        finally:
+            self.close_output()
 
         # this second loop is needed for all streams to print out their costs
         # including child streams which are otherwise skipped in the loop above
@@ -477,6 +482,8 @@ class Tap(PluginBase, SingerWriter, metaclass=abc.ABCMeta):
         config: tuple[str, ...] = (),
         state: str | None = None,
         catalog: str | None = None,
+        output_format: str | None = None,
+        compress: str | None = None,
     ) -> None:
         """Invoke the tap's command line interface.
 
@@ -487,6 +494,8 @@ class Tap(PluginBase, SingerWriter, metaclass=abc.ABCMeta):
                 variables. Accepts multiple inputs as a tuple.
             catalog: Use a Singer catalog file with the tap.",
             state: Use a bookmarks file for incremental replication.
+            output_format: Wire format of the output messages.
+            compress: Compression of the output stream.
         """
         super().invoke(about=about, about_format=about_format)
         cls.print_version(print_fn=cls.logger.info)
@@ -499,6 +508,10 @@ class Tap(PluginBase, SingerWriter, metaclass=abc.ABCMeta):
             parse_env_config=parse_env_config,
             validate_config=True,
         )
+        if output_format:
+            tap.output_format = output_format
+        if compress:
+            tap.output_compression = compress
         tap.sync_all()
 
     @classmethod
@@ -602,6 +615,19 @@ class Tap(PluginBase, SingerWriter, metaclass=abc.ABCMeta):
                     help="Use a bookmarks file for incremental replication.",
                     type=click.Path(),
                 ),
+                click.Option(
+                    ["--output-format"],
+                    help=(
+                        "Wire format of the output messages. 'msgpack' can only be "
+                        "read by targets built with the Singer SDK."
+                    ),
+                    type=click.Choice([JSONL_FORMAT, MSGPACK_FORMAT]),
+                ),
+                click.Option(
+                    ["--compress"],
+                    help="Compress the output stream.",
+                    type=click.Choice([GZIP, ZSTD]),
+                ),
             ],
         )
 
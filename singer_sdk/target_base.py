@@ -3,41 +3,138 @@
 from __future__ import annotations
 
 import abc
+import collections
 import copy
 import json
+import logging
+import math
+import operator
 import sys
 import time
 import typing as t
 
 import click
-from joblib import Parallel, delayed, parallel_backend
 
+from singer_sdk._singerlib.framing import JSONL_FORMAT, MSGPACK_FORMAT
 from singer_sdk.exceptions import RecordsWithoutSchemaException
 from singer_sdk.helpers._batch import BaseBatchFileEncoding
 from singer_sdk.helpers._classproperty import classproperty
 from singer_sdk.helpers._compat import final
+from singer_sdk.helpers._decode_pipeline import DecodePipeline
+from singer_sdk.helpers._drain_executor import DrainExecutor
+from singer_sdk.helpers._validation import BATCH_VALIDATION
 from singer_sdk.helpers.capabilities import (
     ADD_RECORD_METADATA_CONFIG,
     BATCH_CONFIG,
+    TARGET_BUFFER_CONFIG,
     TARGET_LOAD_METHOD_CONFIG,
     TARGET_SCHEMA_CONFIG,
+    TARGET_VALIDATION_CONFIG,
     CapabilitiesEnum,
     PluginCapabilities,
     TargetCapabilities,
 )
 from singer_sdk.io_base import SingerMessageType, SingerReader
+from singer_sdk.mapper import RemoveRecordTransform
+from singer_sdk.metrics import checkpoint_lag_gauge, drain_timer
 from singer_sdk.plugin_base import PluginBase
+from singer_sdk.sinks import Sink
 
 if t.TYPE_CHECKING:
+    from concurrent.futures import Future
     from pathlib import PurePath
 
     from singer_sdk.connectors import SQLConnector
     from singer_sdk.mapper import PluginMapper
-    from singer_sdk.sinks import Sink, SQLSink
+    from singer_sdk.sinks import SQLSink
 
 _MAX_PARALLELISM = 8
 
 
+class _PendingState(t.NamedTuple):
+    """A STATE message waiting for the records read before it to be drained."""
+
+    value: dict
+    # Number of drains each sink must complete, for sinks with records to drain
+    drains: dict[Sink, int]
+    read_at: float
+
+
+class _SinkRoute:
+    """The steps that process a transformed record in a sink.
+
+    Steps that do nothing for the sink, such as an inherited `preprocess_record`,
+    are left out when the route is built.
+    """
+
+    def __init__(self, target: Target, sink: Sink) -> None:
+        self.target = target
+        self.sink = sink
+
+        sink_class = type(sink)
+        self.add_sdc_metadata = sink.include_sdc_metadata_properties
+        self.preprocess_record = (
+            sink.preprocess_record
+            if sink_class.preprocess_record is not Sink.preprocess_record
+            else None
+        )
+        self.validate_message = (
+            sink._singer_validate_message  # noqa: SLF001
+            if sink._key_properties  # noqa: SLF001
+            or sink_class._singer_validate_message  # noqa: SLF001
+            is not Sink._singer_validate_message  # noqa: SLF001
+            else None
+        )
+        self.after_process_record = (
+            sink._after_process_record  # noqa: SLF001
+            if sink.logger.isEnabledFor(logging.DEBUG)
+            or sink_class._after_process_record  # noqa: SLF001
+            is not Sink._after_process_record  # noqa: SLF001
+            else None
+        )
+
+    def process(self, record: dict, message_dict: dict) -> None:
+        sink = self.sink
+        target = self.target
+
+        context = sink._get_context(record)  # noqa: SLF001
+        if self.add_sdc_metadata:
+            sink._add_sdc_metadata_to_record(record, message_dict, context)  # noqa: SLF001
+        else:
+            sink._remove_sdc_metadata_from_record(record)  # noqa: SLF001
+
+        if target._prevalidated_schema is sink.schema:  # noqa: SLF001
+            # Already validated by a decode worker
+            if not sink.defer_timestamp_parsing:
+                sink._parse_timestamps_in_record(  # noqa: SLF001
+                    record=record,
+                    schema=sink.schema,
+                    treatment=sink.datetime_error_treatment,
+                )
+        else:
+            sink._validate_and_parse(record)  # noqa: SLF001
+        if self.preprocess_record is not None:
+            record = self.preprocess_record(record, context)
+        if self.validate_message is not None:
+            self.validate_message(record)
+
+        sink.tally_record_read()
+        sink.process_record(record, context)
+        if self.after_process_record is not None:
+            self.after_process_record(context)
+        if target._max_buffer_bytes and sink._buffers_records:  # noqa: SLF001
+            target._buffered_bytes += sink._tally_buffered_bytes(record)  # noqa: SLF001
+
+        if sink.is_full:
+            target.logger.info(
+                "Target sink for '%s' is full. Draining...",
+                sink.stream_name,
+            )
+            target._drain_full_sink(sink)  # noqa: SLF001
+            if target._pending_states:  # noqa: SLF001
+                target._write_drained_state()  # noqa: SLF001
+
+
 class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
     """Abstract base class for targets.
 
@@ -54,6 +151,17 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
     # Required if `Target.get_sink_class()` is not defined.
     default_sink_class: type[Sink]
 
+    #: Number of worker processes used to decode and validate input messages. When
+    #: 0, messages are decoded and validated in the main thread.
+    decode_workers: int = 0
+
+    #: Number of input lines sent to a decode worker at a time.
+    decode_chunk_size: int = 1000
+
+    _decode_pipeline: DecodePipeline | None = None
+    _drain_executor: DrainExecutor | None = None
+    _prevalidated_schema: dict | None = None
+
     def __init__(
         self,
         *,
@@ -83,10 +191,28 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
         self._drained_state: dict[str, dict] = {}
         self._sinks_active: dict[str, Sink] = {}
         self._sinks_to_clear: list[Sink] = []
+        self._record_handlers: dict[str, t.Callable[[dict], None]] = {}
+        self._sink_routes: dict[Sink, _SinkRoute] = {}
         self._max_parallelism: int | None = _MAX_PARALLELISM
 
-        # Approximated for max record age enforcement
-        self._last_full_drain_at: float = time.time()
+        # Batches handed off to background drains, in order, by sink
+        self._background_drains: dict[Sink, collections.deque[Future]] = {}
+        # Approximate size of the batches in flight, while max_buffer_bytes is set
+        self._in_flight_bytes: dict[Future, int] = {}
+
+        # Earliest time at which the records of a sink may exceed their max age
+        self._next_record_age_check_at: float = 0
+        # States not yet written, in the order they were read
+        self._pending_states: collections.deque[_PendingState] = collections.deque()
+        self._checkpoint_lag_gauge = checkpoint_lag_gauge()
+
+        # Approximated for max buffer size enforcement, including batches in flight
+        self._max_buffer_bytes: int | None = self.config.get("max_buffer_bytes")
+        self._buffer_drain_order: str = self.config.get(
+            "buffer_drain_order",
+            "largest",
+        )
+        self._buffered_bytes: int = 0
 
         self._mapper: PluginMapper | None = None
 
@@ -110,7 +236,8 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
     def max_parallelism(self) -> int:
         """Get max parallel sinks.
 
-        The default is 8 if not overridden.
+        The default is 8 if not overridden. Sinks are drained by a pool of this many
+        threads, which drains fewer sinks at a time if that improves throughput.
 
         Returns:
             Max number of sinks that can be drained in parallel.
@@ -130,6 +257,21 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
             new_value: The new max degree of parallelism for this target.
         """
         self._max_parallelism = new_value
+        if self._drain_executor is not None:
+            # Resized on the next drain
+            self._wait_for_background_drains()
+            self._drain_executor.shutdown()
+            self._drain_executor = None
+
+    def _get_drain_executor(self) -> DrainExecutor:
+        """Get the thread pool that drains sinks, starting it if needed.
+
+        Returns:
+            The drain executor.
+        """
+        if self._drain_executor is None:
+            self._drain_executor = DrainExecutor(max_workers=self.max_parallelism)
+        return self._drain_executor
 
     def get_sink(
         self,
@@ -250,6 +392,11 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
         )
         sink.setup()
         self._sinks_active[stream_name] = sink
+
+        # Record handlers are built again for the new sink
+        self._record_handlers.clear()
+        self._sink_routes.clear()
+        self._next_record_age_check_at = 0
         return sink
 
     def _assert_sink_exists(self, stream_name: str) -> None:
@@ -273,16 +420,160 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
     # Message handling
 
     def _handle_max_record_age(self) -> None:
-        """Check if _MAX_RECORD_AGE_IN_MINUTES reached, and if so trigger drain."""
-        if self._max_record_age_in_minutes > self._MAX_RECORD_AGE_IN_MINUTES:
+        """Drain the sinks whose oldest buffered record exceeded its max age.
+
+        Each sink is drained on its own deadline, so a slow stream does not force
+        drains of busy streams. Sinks are checked again when the earliest deadline
+        passes, or after the default max age at the latest, and states whose records
+        are all drained are then written, even if no sink needed a drain.
+        """
+        now = time.time()
+        if now < self._next_record_age_check_at:
+            return
+
+        if any(
+            self._get_record_age_deadline(sink) < now for sink in self._sinks_to_clear
+        ):
+            # Sinks replaced after a schema change are drained first, in order
+            self._drain_cleared_sinks()
+
+        sinks = list(self._sinks_active.values())
+        for sink in sinks:
+            if self._get_record_age_deadline(sink) >= now:
+                continue
+            self.logger.info(
+                "Records of '%s' sink have exceeded the max age of %g minutes. "
+                "Draining...",
+                sink.stream_name,
+                self._get_max_record_age(sink) / 60,
+            )
+            self._drain_full_sink(sink)
+
+        # States are written on every check, whether or not a sink was drained above,
+        # since background drains may have completed the drains they wait for
+        if self._pending_states:
+            self._write_drained_state()
+
+        # New batches can start before the deadlines of buffered records, and states
+        # are checked at least as often as the default max age
+        max_record_ages = [self._get_max_record_age(sink) for sink in sinks]
+        default_max_record_age = self._MAX_RECORD_AGE_IN_MINUTES * 60
+        self._next_record_age_check_at = min(
+            [
+                now + min([default_max_record_age, *max_record_ages]),
+                *(self._get_record_age_deadline(sink) for sink in sinks),
+            ],
+        )
+
+    def _get_max_record_age(self, sink: Sink) -> float:
+        """Get the max age of the buffered records of a sink.
+
+        Args:
+            sink: The sink.
+
+        Returns:
+            The max age, in seconds.
+        """
+        max_record_age = sink.max_record_age_in_minutes
+        if max_record_age is None:
+            max_record_age = self._MAX_RECORD_AGE_IN_MINUTES
+        return max_record_age * 60
+
+    def _get_record_age_deadline(self, sink: Sink) -> float:
+        """Get the time after which the buffered records of a sink are drained.
+
+        Args:
+            sink: The sink.
+
+        Returns:
+            The deadline, as a Unix timestamp, or infinity if no records are buffered.
+        """
+        batch_started_at = sink._batch_started_at  # noqa: SLF001
+        if not sink.current_size or batch_started_at is None:
+            return math.inf
+        return batch_started_at + self._get_max_record_age(sink)
+
+    def _write_drained_state(self) -> None:
+        """Write the newest state whose preceding records have all been drained.
+
+        Sinks that only hold records read after that state do not hold it back, and
+        drains of other sinks still in progress are not waited for.
+        """
+        state = None
+        while self._pending_states and all(
+            sink._drains_completed >= count  # noqa: SLF001
+            for sink, count in self._pending_states[0].drains.items()
+        ):
+            state = self._pending_states.popleft().value
+        if state is not None:
+            self._write_state_message(copy.deepcopy(state))
+        self._set_checkpoint_lag()
+
+    def _set_checkpoint_lag(self) -> None:
+        """Report how long the oldest unwritten state has been waiting."""
+        self._checkpoint_lag_gauge.set(
+            time.time() - self._pending_states[0].read_at
+            if self._pending_states
+            else 0,
+        )
+
+    def _handle_max_buffer_bytes(self) -> None:
+        """Check if `max_buffer_bytes` is reached, and if so drain sinks until not.
+
+        Batches handed off to background drains count against the budget until
+        they are drained, so once every sink is drained this waits for the oldest
+        batches in flight.
+        """
+        max_buffer_bytes = self._max_buffer_bytes
+        if not max_buffer_bytes or self._buffered_bytes <= max_buffer_bytes:
+            return
+
+        for in_flight in self._background_drains.values():
+            while in_flight and in_flight[0].done():
+                self._pop_background_drain(in_flight)
+
+        self._drain_cleared_sinks()
+
+        sinks = [sink for sink in self._sinks_active.values() if sink.buffered_bytes]
+        if self._buffer_drain_order == "oldest":
+            sinks.sort(key=operator.attrgetter("_batch_started_at"))
+        else:
+            sinks.sort(key=operator.attrgetter("buffered_bytes"), reverse=True)
+
+        for sink in sinks:
+            if self._buffered_bytes <= max_buffer_bytes:
+                break
             self.logger.info(
-                "One or more records have exceeded the max age of %d minutes. "
-                "Draining all sinks.",
-                self._MAX_RECORD_AGE_IN_MINUTES,
+                "Target buffers exceed %d bytes. Draining '%s' sink (%d bytes)...",
+                max_buffer_bytes,
+                sink.stream_name,
+                sink.buffered_bytes,
             )
-            self.drain_all()
+            self._drain_full_sink(sink)
+
+        for in_flight in self._background_drains.values():
+            while in_flight and self._buffered_bytes > max_buffer_bytes:
+                self._pop_background_drain(in_flight)
+
+        if self._pending_states:
+            self._write_drained_state()
+
+    def _drain_cleared_sinks(self) -> None:
+        """Drain the sinks replaced after a schema change, in order.
 
-    def _process_lines(self, file_input: t.IO[str]) -> t.Counter[str]:
+        Batches of these sinks already handed off to background drains are drained
+        first, so each sink writes its records in the order they were read.
+        """
+        for sink in self._sinks_to_clear:
+            self._wait_for_background_drains(sink)
+            self._buffered_bytes -= sink.buffered_bytes
+            self.drain_one(sink)
+        self._sinks_to_clear = []
+
+    def _process_lines(
+        self,
+        file_input: t.IO[str] | t.IO[bytes],
+    ) -> t.Counter[str]:
         """Internal method to process jsonl lines from a Singer tap.
 
         Args:
@@ -309,9 +600,73 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
 
         return counter
 
+    def _iter_messages(
+        self,
+        file_input: t.Iterable[str | bytes],
+    ) -> t.Iterator[dict]:
+        """Deserialize each line of input, in worker processes if enabled.
+
+        Args:
+            file_input: Readable stream of messages, each on a separate line.
+
+        Yields:
+            A dictionary for each message.
+        """
+        if self.decode_workers < 1 or self._is_framed_input(file_input):
+            yield from super()._iter_messages(file_input)
+            return
+
+        self._decode_pipeline = DecodePipeline(
+            file_input,
+            codec_name=self.input_codec.name,
+            workers=self.decode_workers,
+            chunk_size=self.decode_chunk_size,
+        )
+        self._update_decode_schemas()
+        try:
+            with self._decode_pipeline as pipeline:
+                for message, schema in pipeline:
+                    # Lines the workers could not decode raise the error here
+                    self._prevalidated_schema = schema
+                    yield (
+                        message
+                        if isinstance(message, dict)
+                        else self.deserialize_json(message)
+                    )
+        finally:
+            self._decode_pipeline = None
+            self._prevalidated_schema = None
+
+    def _update_decode_schemas(self) -> None:
+        """Register the sink schemas that decode workers validate records against.
+
+        Records are only validated by the workers when they are loaded unchanged into
+        a sink with the default validation logic, and not in `batch` validation mode.
+        """
+        if self._decode_pipeline is None:
+            return
+
+        schemas = {}
+        for stream_name, sink in self._sinks_active.items():
+            if (
+                self.mapper.get_passthrough_alias(stream_name) == stream_name
+                and type(sink)._validate_and_parse is Sink._validate_and_parse  # noqa: SLF001
+                and sink._validation_mode != BATCH_VALIDATION  # noqa: SLF001
+            ):
+                validator = sink._validator  # noqa: SLF001
+                schemas[stream_name] = (
+                    type(validator),
+                    validator.format_checker,
+                    sink.schema,
+                )
+        self._decode_pipeline.set_schemas(schemas)
+
     def _process_endofpipe(self) -> None:
         """Called after all input lines have been read."""
         self.drain_all(is_endofpipe=True)
+        if self._drain_executor is not None:
+            self._drain_executor.shutdown()
+            self._drain_executor = None
 
     def _process_record_message(self, message_dict: dict) -> None:
         """Process a RECORD message.
@@ -319,45 +674,83 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
         Args:
             message_dict: TODO
         """
-        self._assert_line_requires(message_dict, requires={"stream", "record"})
+        handler = self._record_handlers.get(message_dict.get("stream"))
+        if handler is None or "record" not in message_dict:
+            self._assert_line_requires(message_dict, requires={"stream", "record"})
 
-        stream_name = message_dict["stream"]
-        self._assert_sink_exists(stream_name)
+            stream_name = message_dict["stream"]
+            self._assert_sink_exists(stream_name)
+            handler = self._compile_record_handler(stream_name)
 
-        for stream_map in self.mapper.stream_maps[stream_name]:
-            raw_record = copy.copy(message_dict["record"])
-            transformed_record = stream_map.transform(raw_record)
-            if transformed_record is None:
-                # Record was filtered out by the map transform
-                continue
+        handler(message_dict)
+        self._handle_max_buffer_bytes()
+        self._handle_max_record_age()
 
-            sink = self.get_sink(stream_map.stream_alias, record=transformed_record)
-            context = sink._get_context(transformed_record)  # noqa: SLF001
-            if sink.include_sdc_metadata_properties:
-                sink._add_sdc_metadata_to_record(  # noqa: SLF001
-                    transformed_record,
-                    message_dict,
-                    context,
-                )
-            else:
-                sink._remove_sdc_metadata_from_record(transformed_record)  # noqa: SLF001
+    def _compile_record_handler(
+        self,
+        stream_name: str,
+    ) -> t.Callable[[dict], None]:
+        """Build the function that processes the RECORD messages of a stream.
 
-            sink._validate_and_parse(transformed_record)  # noqa: SLF001
-            transformed_record = sink.preprocess_record(transformed_record, context)
-            sink._singer_validate_message(transformed_record)  # noqa: SLF001
+        The stream maps and their sinks are looked up once, unless `get_sink` is
+        overridden to pick sinks by record. Each stream map gets its own copy of the
+        record, so that sinks may change it in place.
 
-            sink.tally_record_read()
-            sink.process_record(transformed_record, context)
-            sink._after_process_record(context)  # noqa: SLF001
+        Args:
+            stream_name: The name of the stream.
 
-            if sink.is_full:
-                self.logger.info(
-                    "Target sink for '%s' is full. Draining...",
-                    sink.stream_name,
+        Returns:
+            A function that processes a RECORD message of the stream.
+        """
+        stream_maps = [
+            stream_map
+            for stream_map in self.mapper.stream_maps[stream_name]
+            # Records are always filtered out, skip decoding them
+            if not isinstance(stream_map, RemoveRecordTransform)
+        ]
+        # Sinks are looked up per record if `get_sink` is overridden
+        sinks_by_record = type(self).get_sink not in {
+            Target.get_sink,
+            SQLTarget.get_sink,
+        }
+        routes = [
+            (
+                stream_map.transform,
+                stream_map.stream_alias,
+                None
+                if sinks_by_record
+                else self._get_sink_route(self.get_sink(stream_map.stream_alias)),
+            )
+            for stream_map in stream_maps
+        ]
+
+        def handle_record_message(message_dict: dict) -> None:
+            for transform, stream_alias, sink_route in routes:
+                transformed_record = transform(copy.copy(message_dict["record"]))
+                if transformed_record is None:
+                    # Record was filtered out by the map transform
+                    continue
+
+                route = sink_route or self._get_sink_route(
+                    self.get_sink(stream_alias, record=transformed_record),
                 )
-                self.drain_one(sink)
+                route.process(transformed_record, message_dict)
 
-        self._handle_max_record_age()
+        self._record_handlers[stream_name] = handle_record_message
+        return handle_record_message
+
+    def _get_sink_route(self, sink: Sink) -> _SinkRoute:
+        """Get the steps that process records in a sink.
+
+        Args:
+            sink: The sink.
+
+        Returns:
+            The sink route, which is built once per sink.
+        """
+        if sink not in self._sink_routes:
+            self._sink_routes[sink] = _SinkRoute(self, sink)
+        return self._sink_routes[sink]
 
     def _process_schema_message(self, message_dict: dict) -> None:
         """Process a SCHEMA messages.
@@ -409,13 +802,8 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
                 schema=stream_map.transformed_schema,
                 key_properties=stream_map.transformed_key_properties,
             )
-
-    @property
-    def _max_record_age_in_minutes(self) -> float:
-        return (time.time() - self._last_full_drain_at) / 60
-
-    def _reset_max_record_age(self) -> None:
-        self._last_full_drain_at = time.time()
+        self._compile_record_handler(stream_name)
+        self._update_decode_schemas()
 
     def _process_state_message(self, message_dict: dict) -> None:
         """Process a state message. drain sinks if needed.
@@ -431,6 +819,29 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
             return
         self._latest_state = state
 
+        # Records read before the state are drained by the drain in progress, or by
+        # the next drain of sinks that still buffer some
+        drains = {}
+        for sink in (*self._sinks_to_clear, *self._sinks_active.values()):
+            count = sink._drains_started + (1 if sink.current_size else 0)  # noqa: SLF001
+            if count > sink._drains_completed:  # noqa: SLF001
+                drains[sink] = count
+
+        if not drains:
+            # All records read so far are drained, or were written as they were read
+            # by record sinks, so this and any older states are done
+            self._pending_states.clear()
+            self._write_state_message(copy.deepcopy(state))
+            self._set_checkpoint_lag()
+            return
+
+        read_at = time.time()
+        if self._pending_states and self._pending_states[-1].drains == drains:
+            # Covered by the same drains, so the newer state replaces the older one
+            read_at = self._pending_states.pop().read_at
+        self._pending_states.append(_PendingState(state, drains, read_at))
+        self._set_checkpoint_lag()
+
     def _process_activate_version_message(self, message_dict: dict) -> None:
         """Handle the optional ACTIVATE_VERSION message extension.
 
@@ -439,6 +850,7 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
         """
         stream_name = message_dict["stream"]
         sink = self.get_sink(stream_name)
+        self._wait_for_background_drains(sink)
         sink.activate_version(message_dict["version"])
 
     def _process_batch_message(self, message_dict: dict) -> None:
@@ -448,6 +860,7 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
             message_dict: TODO
         """
         sink = self.get_sink(message_dict["stream"])
+        self._wait_for_background_drains(sink)
 
         encoding = BaseBatchFileEncoding.from_dict(message_dict["encoding"])
         sink.process_batch_files(
@@ -471,6 +884,7 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
                           listening to the stdin
         """
         state = copy.deepcopy(self._latest_state)
+        self._wait_for_background_drains()
         self._drain_all(self._sinks_to_clear, 1)
         if is_endofpipe:
             for sink in self._sinks_to_clear:
@@ -481,7 +895,9 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
             for sink in self._sinks_active.values():
                 sink.clean_up()
         self._write_state_message(state)
-        self._reset_max_record_age()
+        self._pending_states.clear()
+        self._set_checkpoint_lag()
+        self._buffered_bytes = 0
 
     @final
     def drain_one(self, sink: Sink) -> None:
@@ -493,11 +909,108 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
             sink: Sink to be drained.
         """
         if sink.current_size == 0:
+            # Nothing left counts against `max_buffer_bytes`
+            sink._reset_buffered_bytes()  # noqa: SLF001
             return
 
         draining_status = sink.start_drain()
-        sink.process_batch(draining_status)
+        with drain_timer(sink.stream_name):
+            try:
+                sink._validate_batch(draining_status)  # noqa: SLF001
+                sink._parse_batch_timestamps(draining_status)  # noqa: SLF001
+                sink._process_batch(draining_status)  # noqa: SLF001
+            finally:
+                sink._release_batch(draining_status)  # noqa: SLF001
         sink.mark_drained()
+        sink._drains_completed += 1  # noqa: SLF001
+
+    def _drain_full_sink(self, sink: Sink) -> None:
+        """Drain a sink, in the background if it allows batches in flight.
+
+        Args:
+            sink: Sink to be drained.
+        """
+        if sink.max_batches_in_flight > 0:
+            self._drain_in_background(sink)
+        else:
+            self._buffered_bytes -= sink.buffered_bytes
+            self.drain_one(sink)
+
+    def _drain_in_background(self, sink: Sink) -> None:
+        """Hand off the pending batch of a sink to a background drain.
+
+        Batches of the same sink are drained one at a time, in order. If the sink
+        already has `max_batches_in_flight` batches waiting to be drained, this blocks
+        until the oldest one is done.
+
+        Args:
+            sink: Sink to be drained.
+        """
+        if sink.current_size == 0:
+            return
+
+        in_flight = self._background_drains.setdefault(sink, collections.deque())
+        while in_flight and (
+            in_flight[0].done() or len(in_flight) >= sink.max_batches_in_flight
+        ):
+            self._pop_background_drain(in_flight)
+
+        buffered_bytes = sink.buffered_bytes
+        context, records_written = sink._detach_batch()  # noqa: SLF001
+        future = self._get_drain_executor().submit(
+            sink,
+            self._drain_batch,
+            sink,
+            context,
+            records_written,
+            after=in_flight[-1] if in_flight else None,
+        )
+        in_flight.append(future)
+        if buffered_bytes:
+            self._in_flight_bytes[future] = buffered_bytes
+
+    def _pop_background_drain(self, in_flight: collections.deque[Future]) -> None:
+        """Wait for the oldest batch of a sink in flight to be drained.
+
+        Its size no longer counts against `max_buffer_bytes` afterwards.
+
+        Args:
+            in_flight: Batches of a sink handed off to background drains.
+        """
+        future = in_flight.popleft()
+        self._buffered_bytes -= self._in_flight_bytes.pop(future, 0)
+        # Raises the error of a failed drain
+        future.result()
+
+    @staticmethod
+    def _drain_batch(
+        sink: Sink,
+        context: dict,
+        records_written: int,
+    ) -> None:
+        with drain_timer(sink.stream_name):
+            try:
+                sink._validate_batch(context)  # noqa: SLF001
+                sink._parse_batch_timestamps(context)  # noqa: SLF001
+                sink._process_batch(context)  # noqa: SLF001
+            finally:
+                sink._release_batch(context)  # noqa: SLF001
+        sink.tally_record_written(records_written)
+        sink._drains_completed += 1  # noqa: SLF001
+
+    def _wait_for_background_drains(self, sink: Sink | None = None) -> None:
+        """Wait until batches handed off to background drains are drained.
+
+        The error of the first failed drain, if any, is raised here.
+
+        Args:
+            sink: Only wait for the batches of this sink. Defaults to all sinks.
+        """
+        sinks = list(self._background_drains) if sink is None else [sink]
+        for pending_sink in sinks:
+            in_flight = self._background_drains.pop(pending_sink, None)
+            while in_flight:
+                self._pop_background_drain(in_flight)
 
     def _drain_all(self, sink_list: list[Sink], parallelism: int) -> None:
         if parallelism == 1:
@@ -505,15 +1018,13 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
                 self.drain_one(sink)
             return
 
-        def _drain_sink(sink: Sink) -> None:
-            self.drain_one(sink)
-
-        with parallel_backend("threading", n_jobs=parallelism):
-            Parallel()(delayed(_drain_sink)(sink=sink) for sink in sink_list)
+        self._get_drain_executor().drain(sink_list, self.drain_one)
 
     def _write_state_message(self, state: dict) -> None:
         """Emit the stream's latest state.
 
+        Only states whose preceding records have all been drained are passed here.
+
         Args:
             state: TODO
         """
@@ -531,7 +1042,8 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
         about: bool = False,
         about_format: str | None = None,
         config: tuple[str, ...] = (),
-        file_input: t.IO[str] | None = None,
+        file_input: t.IO[bytes] | None = None,
+        input_format: str | None = None,
     ) -> None:
         """Invoke the target.
 
@@ -541,6 +1053,7 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
             config: Configuration file location or 'ENV' to use environment
                 variables. Accepts multiple inputs as a tuple.
             file_input: Optional file to read input from.
+            input_format: Wire format of the input, or 'auto' to detect it.
         """
         super().invoke(about=about, about_format=about_format)
         cls.print_version(print_fn=cls.logger.info)
@@ -551,6 +1064,8 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
             validate_config=True,
             parse_env_config=parse_env_config,
         )
+        if input_format:
+            target.input_format = input_format
         target.listen(file_input)
 
     @classmethod
@@ -567,7 +1082,15 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
                 click.Option(
                     ["--input", "file_input"],
                     help="A path to read messages from instead of from standard in.",
-                    type=click.File("r"),
+                    type=click.File("rb"),
+                ),
+                click.Option(
+                    ["--input-format"],
+                    help=(
+                        "Wire format of the input messages. By default, framed "
+                        "MessagePack input is detected from its header."
+                    ),
+                    type=click.Choice(["auto", JSONL_FORMAT, MSGPACK_FORMAT]),
                 ),
             ],
         )
@@ -599,6 +1122,8 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
 
         _merge_missing(ADD_RECORD_METADATA_CONFIG, config_jsonschema)
         _merge_missing(TARGET_LOAD_METHOD_CONFIG, config_jsonschema)
+        _merge_missing(TARGET_BUFFER_CONFIG, config_jsonschema)
+        _merge_missing(TARGET_VALIDATION_CONFIG, config_jsonschema)
 
         capabilities = cls.capabilities
 
@@ -701,6 +1226,10 @@ class SQLTarget(Target):
         sink.setup()
         self._sinks_active[stream_name] = sink
 
+        # Record handlers are built again for the new sink
+        self._record_handlers.clear()
+        self._sink_routes.clear()
+        self._next_record_age_check_at = 0
         return sink
 
     def get_sink_class(self, stream_name: str) -> type[SQLSink]:
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import io
+
+import pytest
+
+from singer_sdk._singerlib.compression import (
+    GZIP,
+    ZSTD,
+    CompressedOutput,
+    detect_compression,
+    open_decompressed,
+    peek,
+)
+
+COMPRESSIONS = [
+    GZIP,
+    pytest.param(
+        ZSTD,
+        marks=pytest.mark.skipif(
+            importlib.util.find_spec("zstandard") is None,
+            reason="zstandard is not installed",
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "stream,expected",
+    [
+        pytest.param(io.BytesIO(b"abc"), b"ab", id="seekable"),
+        pytest.param(io.BufferedReader(io.BytesIO(b"abc")), b"ab", id="peekable"),
+        pytest.param(io.StringIO("abc"), b"", id="text"),
+        pytest.param(io.BytesIO(b""), b"", id="empty"),
+    ],
+)
+def test_peek(stream: io.IOBase, expected: bytes):
+    assert peek(stream, 2) == expected
+    assert stream.tell() == 0
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        pytest.param(gzip.compress(b"{}\n"), GZIP, id="gzip"),
+        pytest.param(b"\x28\xb5\x2f\xfd\x00", ZSTD, id="zstd"),
+        pytest.param(b'{"type": "STATE"}\n', None, id="jsonl"),
+    ],
+)
+def test_detect_compression(data: bytes, expected: str | None):
+    assert detect_compression(io.BytesIO(data)) == expected
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_round_trip(compression: str):
+    stream = io.BytesIO()
+    output = CompressedOutput(stream, compression)
+    output.write(b'{"type": "RECORD"}\n')
+    output.flush()
+
+    # Flushed data can be decompressed before the stream ends
+    partial = open_decompressed(io.BytesIO(stream.getvalue()))
+    assert partial.readline() == b'{"type": "RECORD"}\n'
+
+    output.write(b'{"type": "STATE"}\n')
+    output.close()
+    assert not stream.closed
+
+    output = CompressedOutput(stream, compression)
+    output.write(b'{"type": "STATE"}\n')
+    output.close()
+
+    lines = list(open_decompressed(io.BytesIO(stream.getvalue())))
+    assert lines == [
+        b'{"type": "RECORD"}\n',
+        b'{"type": "STATE"}\n',
+        b'{"type": "STATE"}\n',
+    ]
+
+
+def test_uncompressed_input():
+    stream = io.BytesIO(b'{"type": "STATE"}\n')
+    assert open_decompressed(stream) is stream
+
+
+def test_unsupported_compression():
+    with pytest.raises(ValueError, match="Unsupported compression 'lz4'"):
+        CompressedOutput(io.BytesIO(), "lz4")
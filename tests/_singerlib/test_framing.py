@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import io
+
+import pendulum
+import pytest
+
+from singer_sdk._singerlib.framing import MSGPACK_MAGIC, get_framing, is_framed
+
+pytest.importorskip("msgspec")
+
+
+def test_round_trip():
+    framing = get_framing()
+    message = {
+        "type": "RECORD",
+        "stream": "users",
+        "record": {"id": 1, "amount": decimal.Decimal("1.10"), "tags": ["a", "b"]},
+        "time_extracted": datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+    }
+    stream = io.BytesIO(
+        MSGPACK_MAGIC + framing.encode_frame(message) + framing.encode_frame(message),
+    )
+
+    first, second = framing.iter_messages(stream)
+    assert first == second
+    assert first["record"]["amount"] == decimal.Decimal("1.10")
+    assert str(first["record"]["amount"]) == "1.10"
+    assert first["time_extracted"].startswith("2023-01-01T00:00:00")
+
+
+def test_json_values():
+    message = {
+        "type": "RECORD",
+        "stream": "users",
+        "record": {
+            "id": 1,
+            "amount": decimal.Decimal("1.10"),
+            "ratio": 0.1,
+            "scores": [1.5, 2],
+            "created_at": datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+            "birthday": datetime.date(2000, 1, 1),
+            "tags": ("a", "b"),
+        },
+        "time_extracted": pendulum.datetime(2023, 1, 1, 12, 30, tz="UTC"),
+    }
+    framing = get_framing()
+    framed = framing.decode_frame(framing.encode_frame(message)[4:])
+
+    # Values are those of JSON, with Decimals kept and floats decoded as floats
+    assert framed == {
+        "type": "RECORD",
+        "stream": "users",
+        "record": {
+            "id": 1,
+            "amount": decimal.Decimal("1.10"),
+            "ratio": 0.1,
+            "scores": [1.5, 2],
+            "created_at": "2023-01-01T00:00:00Z",
+            "birthday": "2000-01-01",
+            "tags": ["a", "b"],
+        },
+        "time_extracted": "2023-01-01T12:30:00+00:00",
+    }
+
+
+@pytest.mark.parametrize(
+    "data,match",
+    [
+        pytest.param(b'{"type": "STATE"}', "not a framed", id="missing_header"),
+        pytest.param(MSGPACK_MAGIC + b"\x00\x00", "Truncated", id="short_prefix"),
+        pytest.param(
+            MSGPACK_MAGIC + b"\x00\x00\x00\x10\x81",
+            "Truncated",
+            id="short_payload",
+        ),
+        pytest.param(MSGPACK_MAGIC + b"\x00\x00\x00\x01\xc1", "Invalid", id="invalid"),
+    ],
+)
+def test_invalid_stream(data: bytes, match: str):
+    with pytest.raises(ValueError, match=match):
+        list(get_framing().iter_messages(io.BytesIO(data)))
+
+
+@pytest.mark.parametrize(
+    "stream,expected",
+    [
+        pytest.param(io.BytesIO(MSGPACK_MAGIC), True, id="framed"),
+        pytest.param(io.BufferedReader(io.BytesIO(MSGPACK_MAGIC)), True, id="peek"),
+        pytest.param(io.BytesIO(b'{"type": "STATE"}\n'), False, id="jsonl"),
+        pytest.param(io.StringIO('{"type": "STATE"}\n'), False, id="text"),
+        pytest.param(io.BytesIO(b""), False, id="empty"),
+    ],
+)
+def test_is_framed(stream: io.IOBase, expected: bool):
+    assert is_framed(stream) is expected
+    assert stream.tell() == 0
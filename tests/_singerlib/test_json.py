@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import json
+
+import pytest
+
+from singer_sdk._singerlib.json import (
+    CODECS,
+    DECODE_AUTO_DETECT,
+    ENCODE_AUTO_DETECT,
+    JSON_CODEC_ENV_VAR,
+    SimpleJSONCodec,
+    get_codec,
+    reset_codecs,
+)
+
+AVAILABLE_CODECS = [name for name, codec in CODECS.items() if codec.is_available()]
+LOSSLESS_CODECS = [name for name in AVAILABLE_CODECS if name != "orjson"]
+
+
+@pytest.mark.parametrize("codec_name", LOSSLESS_CODECS)
+@pytest.mark.parametrize("line", ['{"value": 1.10}', b'{"value": 1.10}'])
+def test_loads_decimal(codec_name: str, line: str | bytes):
+    codec = get_codec(codec_name)
+    assert codec.loads(line) == {"value": decimal.Decimal("1.10")}
+    assert str(codec.loads(line)["value"]) == "1.10"
+
+
+@pytest.mark.parametrize("codec_name", LOSSLESS_CODECS)
+def test_dumps_decimal(codec_name: str):
+    codec = get_codec(codec_name)
+    obj = {"value": decimal.Decimal("0.12345678901234567890")}
+    decoded = json.loads(codec.dumps(obj), parse_float=str)
+    assert decoded["value"] == "0.12345678901234567890"
+
+
+@pytest.mark.parametrize("codec_name", LOSSLESS_CODECS)
+def test_dumps_raw(codec_name: str):
+    codec = get_codec(codec_name)
+    decoded = json.loads(
+        codec.dumps({"record": codec.raw('{"x": 1.10}')}), parse_float=str
+    )
+    assert decoded == {"record": {"x": "1.10"}}
+
+
+@pytest.mark.parametrize("codec_name", AVAILABLE_CODECS)
+def test_loads_invalid(codec_name: str):
+    with pytest.raises(json.JSONDecodeError):
+        get_codec(codec_name).loads(b"not-valid-json")
+
+
+@pytest.mark.parametrize("codec_name", LOSSLESS_CODECS)
+def test_loads_non_finite(codec_name: str):
+    codec = get_codec(codec_name)
+    line = b'{"a": NaN, "b": Infinity, "c": -Infinity}'
+    decoded = codec.loads(line)
+    assert decoded["a"] != decoded["a"]
+    assert decoded["b"] == float("inf")
+    assert decoded["c"] == float("-inf")
+
+
+@pytest.mark.parametrize("codec_name", AVAILABLE_CODECS)
+def test_dumps_roundtrip(codec_name: str):
+    codec = get_codec(codec_name)
+    obj = {
+        "id": 1,
+        "value": decimal.Decimal("1.5"),
+        "time_extracted": datetime.datetime(
+            2021,
+            1,
+            1,
+            tzinfo=datetime.timezone.utc,
+        ),
+    }
+    decoded = json.loads(codec.dumps_bytes(obj))
+    assert decoded["id"] == 1
+    assert decoded["value"] == 1.5
+    assert (
+        datetime.datetime.fromisoformat(decoded["time_extracted"])
+        == (obj["time_extracted"])
+    )
+
+
+@pytest.fixture
+def _reset_codecs():
+    reset_codecs()
+    yield
+    reset_codecs()
+
+
+@pytest.mark.usefixtures("_reset_codecs")
+def test_get_codec_from_env(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv(JSON_CODEC_ENV_VAR, "simplejson")
+    assert isinstance(get_codec(), SimpleJSONCodec)
+
+    # The default codec is resolved once
+    monkeypatch.setenv(JSON_CODEC_ENV_VAR, "stdlib")
+    assert isinstance(get_codec(), SimpleJSONCodec)
+    reset_codecs()
+    assert get_codec().name == "stdlib"
+
+
+@pytest.mark.usefixtures("_reset_codecs")
+def test_get_codec_auto_detect(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(JSON_CODEC_ENV_VAR, raising=False)
+    assert get_codec(auto_detect=ENCODE_AUTO_DETECT).name == "simplejson"
+    assert get_codec(auto_detect=DECODE_AUTO_DETECT).name in DECODE_AUTO_DETECT
+
+
+def test_get_codec_unknown():
+    with pytest.raises(ValueError, match="Unknown JSON codec 'ujson'"):
+        get_codec("ujson")
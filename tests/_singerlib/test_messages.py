@@ -157,3 +157,20 @@ def test_activate_version_message():
     }
 
     assert singer.ActivateVersionMessage.from_dict(version.to_dict()) == version
+
+
+def test_record_message_unchecked():
+    time_extracted = datetime.datetime(2021, 1, 1, tzinfo=UTC)
+    record = singer.RecordMessage.unchecked(
+        "test",
+        {"id": 1, "name": "test"},
+        time_extracted=time_extracted,
+    )
+    assert record == singer.RecordMessage(
+        stream="test",
+        record={"id": 1, "name": "test"},
+        time_extracted=time_extracted,
+    )
+    assert record.type == singer.SingerMessageType.RECORD
+    assert record.version is None
+    assert record.to_dict()["time_extracted"] is time_extracted
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import io
+import typing as t
+
+import pytest
+
+from singer_sdk._singerlib.mmap_input import MappedInput
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        pytest.param(b"a\nbb\n", [b"a\n", b"bb\n"], id="trailing_newline"),
+        pytest.param(b"a\nbb", [b"a\n", b"bb"], id="no_trailing_newline"),
+        pytest.param(b"a\n\nbb\n", [b"a\n", b"\n", b"bb\n"], id="blank_line"),
+        pytest.param(b"", [], id="empty"),
+    ],
+)
+def test_iter_lines(tmp_path: Path, data: bytes, expected: list[bytes]):
+    path = tmp_path / "data.singer"
+    path.write_bytes(data)
+
+    with path.open("rb") as file:
+        mapped = MappedInput.from_file(file)
+        assert mapped is not None
+        assert list(mapped) == expected
+        mapped.close()
+
+
+def test_from_file_position(tmp_path: Path):
+    path = tmp_path / "data.singer"
+    path.write_bytes(b"a\nbb\nccc\n")
+
+    with path.open("rb") as file:
+        file.readline()
+        mapped = MappedInput.from_file(file)
+        assert mapped is not None
+        assert mapped.path == str(path)
+        assert mapped.peek(2) == b"bb"
+        assert list(mapped) == [b"bb\n", b"ccc\n"]
+        mapped.close()
+
+
+@pytest.mark.parametrize(
+    "file",
+    [
+        pytest.param(io.BytesIO(b"a\n"), id="bytes_io"),
+        pytest.param(io.StringIO("a\n"), id="text"),
+    ],
+)
+def test_from_file_unsupported(file: io.IOBase):
+    assert MappedInput.from_file(file) is None
+
+
+@pytest.mark.parametrize(
+    "data,lines,expected",
+    [
+        pytest.param(b"a\nb\nc\n", 2, [(0, 4), (4, 6)], id="uneven"),
+        pytest.param(b"a\nb\nc", 1, [(0, 2), (2, 4), (4, 5)], id="no_trailing"),
+        pytest.param(b"a\nb\n", 5, [(0, 4)], id="single"),
+    ],
+)
+def test_split(data: bytes, lines: int, expected: list[tuple[int, int]]):
+    mapped = MappedInput(data)
+    ranges = list(mapped.split(lines))
+    assert ranges == expected
+    assert [
+        line
+        for start, end in ranges
+        for line in MappedInput(data, start=start, end=end)
+    ] == list(mapped)
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import io
+import json
+
+import pytest
+
+from singer_sdk.helpers import _columnar
+from singer_sdk.helpers._columnar import ColumnarRecords, arrow_fields
+from tests.conftest import BatchSinkMock, TargetMock
+
+pa = pytest.importorskip("pyarrow")
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "amount": {"type": ["number", "null"]},
+        "created_at": {"type": "string", "format": "date-time"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+
+class ColumnarSink(BatchSinkMock):
+    columnar_buffer = True
+
+    def process_batch_table(self, table, context: dict) -> None:  # noqa: ARG002
+        self.target.tables.append(table)
+
+
+class DeferredColumnarSink(BatchSinkMock):
+    columnar_buffer = True
+    defer_timestamp_parsing = True
+
+
+def _run(sink_class: type[BatchSinkMock], records: list[dict]) -> TargetMock:
+    class Target(TargetMock):
+        default_sink_class = sink_class
+
+    target = Target()
+    target.tables = []
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": SCHEMA, "key_properties": []},
+        *({"type": "RECORD", "stream": "users", "record": r} for r in records),
+    ]
+    target._process_lines(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+    target.drain_all()
+    return target
+
+
+def test_process_batch_table():
+    target = _run(
+        ColumnarSink,
+        [
+            {
+                "id": 1,
+                "amount": 1.5,
+                "created_at": "2021-01-01T00:00:00-07:00",
+                "tags": ["a"],
+            },
+            {"id": 2, "created_at": "2021-01-02T00:00:00+00:00", "tags": []},
+        ],
+    )
+
+    assert target.records_written == []
+    (table,) = target.tables
+    assert table.schema == pa.schema(
+        [
+            ("id", pa.int64()),
+            ("amount", pa.decimal128(2, 1)),
+            ("created_at", pa.timestamp("us", tz="UTC")),
+            ("tags", pa.list_(pa.string())),
+        ],
+    )
+    assert table.to_pydict() == {
+        "id": [1, 2],
+        "amount": [decimal.Decimal("1.5"), None],
+        "created_at": [
+            datetime.datetime(2021, 1, 1, 7, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2021, 1, 2, tzinfo=datetime.timezone.utc),
+        ],
+        "tags": [["a"], []],
+    }
+
+
+def test_columnar_buffer_schema_drift():
+    target = _run(
+        ColumnarSink,
+        [
+            {"id": 1, "created_at": "2021-01-01T00:00:00+00:00"},
+            {"id": 2, "created_at": "2021-01-02T00:00:00+00:00", "other": True},
+        ],
+    )
+
+    # The batch falls back to dicts, and is processed by process_batch
+    assert target.tables == []
+    assert [record["id"] for record in target.records_written] == [1, 2]
+    assert target.records_written[1]["other"] is True
+
+
+def test_deferred_timestamps_in_columnar_buffer():
+    target = _run(
+        DeferredColumnarSink,
+        [{"id": 1, "created_at": "2021-01-01T00:00:00+00:00"}],
+    )
+
+    # Missing properties are stored as nulls, and left out of the records
+    assert target.records_written == [
+        {
+            "id": 1,
+            "created_at": datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc),
+        },
+    ]
+
+
+def test_columnar_records_exact_numbers(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_columnar, "_CHUNK_SIZE", 2)
+    schema = {"type": "object", "properties": {"amount": {"type": "number"}}}
+    amounts = [
+        decimal.Decimal("0.10000000000000000001"),
+        decimal.Decimal("12345678901234567.5"),
+        2,
+        3,
+    ]
+    records = ColumnarRecords(arrow_fields(schema))
+    for amount in amounts:
+        records.append({"amount": amount})
+
+    # Integer and decimal chunks are cast to a decimal type that fits both
+    table = records.to_table()
+    assert table is not None
+    assert table.column("amount").type == pa.decimal256(39, 20)
+    assert [record["amount"] for record in records] == amounts
+
+    records.append({"amount": 1.5})
+    records.append({"amount": decimal.Decimal("NaN")})
+
+    # Values Arrow cannot store exactly fall back to dicts
+    assert records.to_table() is None
+    assert [record["amount"] for record in records][:4] == amounts
+
+
+def test_columnar_records_missing_properties(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_columnar, "_CHUNK_SIZE", 2)
+    schema = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+    }
+    rows = [{"id": 1}, {"id": 2, "name": None}, {"name": "c"}]
+    records = ColumnarRecords(arrow_fields(schema))
+    for row in rows:
+        records.append(row)
+
+    assert records.to_table().to_pydict() == {
+        "id": [1, 2, None],
+        "name": [None, None, "c"],
+    }
+    assert list(records) == rows
+
+    # Falling back to dicts keeps the properties missing
+    records.append({"id": 4, "other": True})
+    assert records.dict_records() == [*rows, {"id": 4, "other": True}]
+
+
+def test_columnar_records_inferred_types(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_columnar, "_CHUNK_SIZE", 2)
+    schema = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "data": {"type": "object"}},
+    }
+    records = ColumnarRecords(arrow_fields(schema))
+    for i, data in enumerate([None, None, {"a": 1}, {"a": 2}]):
+        records.append({"id": i, "data": data})
+
+    # Chunks of nulls take the type inferred from later chunks
+    table = records.to_table()
+    assert table is not None
+    assert table.column("data").type == pa.struct([("a", pa.int64())])
+
+    records.append({"id": 4, "data": {"a": "x"}})
+    records.append({"id": 5, "data": {"a": "y"}})
+
+    # Chunks whose inferred types differ fall back to dicts
+    assert records.to_table() is None
+    assert len(records) == 6
+    assert [record["data"] for record in records] == [
+        None,
+        None,
+        {"a": 1},
+        {"a": 2},
+        {"a": "x"},
+        {"a": "y"},
+    ]
+
+
+def _write_parquet_batch_files(tmp_path, records: list[dict]) -> list[str]:
+    from singer_sdk.contrib.batch_encoder_parquet import ParquetBatcher
+    from singer_sdk.helpers._batch import BatchConfig, ParquetEncoding, StorageTarget
+
+    batcher = ParquetBatcher(
+        "tap-test",
+        "users",
+        batch_config=BatchConfig(
+            encoding=ParquetEncoding(),
+            storage=StorageTarget(tmp_path.as_uri()),
+            batch_size=3,
+        ),
+    )
+    return [path for batch in batcher.get_batches(records) for path in batch]
+
+
+def test_process_parquet_batch_files_as_tables(tmp_path):
+    from singer_sdk.helpers._batch import ParquetEncoding
+
+    class ChunkedColumnarSink(ColumnarSink):
+        batch_file_chunk_size = 2
+
+    files = _write_parquet_batch_files(tmp_path, [{"id": i} for i in range(3)])
+
+    target = TargetMock()
+    target.tables = []
+    sink = ChunkedColumnarSink(target, "users", SCHEMA, ["id"])
+    sink.process_batch_files(ParquetEncoding(), files)
+
+    # Arrow record batches are passed on without building dicts
+    assert target.records_written == []
+    assert [table.to_pylist() for table in target.tables] == [
+        [{"id": 0}, {"id": 1}],
+        [{"id": 2}],
+    ]
+
+
+def test_process_parquet_batch_files_by_default(tmp_path):
+    from singer_sdk.helpers._batch import ParquetEncoding
+
+    class ChunkedColumnarSink(DeferredColumnarSink):
+        batch_file_chunk_size = 2
+
+    files = _write_parquet_batch_files(tmp_path, [{"id": i} for i in range(3)])
+
+    target = TargetMock()
+    sink = ChunkedColumnarSink(target, "users", SCHEMA, ["id"])
+    sink.process_batch_files(ParquetEncoding(), files)
+
+    # The default process_batch_table passes the records of the table on
+    assert target.records_written == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert target.num_batches_processed == 2
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from tests.conftest import BatchSinkMock, TargetMock
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+        "updated_at": {"type": ["string", "null"], "format": "date-time"},
+    },
+}
+
+
+def _run(target: TargetMock, records: list[dict]) -> None:
+    lines = [
+        {
+            "type": "SCHEMA",
+            "stream": "users",
+            "schema": SCHEMA,
+            "key_properties": ["id"],
+        },
+        *({"type": "RECORD", "stream": "users", "record": r} for r in records),
+    ]
+    target._process_lines(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+    target.drain_all()
+
+
+class DeduplicatingSink(BatchSinkMock):
+    deduplicate_records = True
+
+
+class OrderedDeduplicatingSink(DeduplicatingSink):
+    deduplication_order_by = "updated_at"
+
+
+@pytest.mark.parametrize(
+    "sink_class,names",
+    [
+        pytest.param(BatchSinkMock, ["a", "b", "c", "d", "e"], id="disabled"),
+        pytest.param(DeduplicatingSink, ["e", "c"], id="last-write-wins"),
+        pytest.param(OrderedDeduplicatingSink, ["b", "c"], id="ordered"),
+    ],
+)
+def test_deduplicate_records(sink_class: type[BatchSinkMock], names: list[str]):
+    class Target(TargetMock):
+        default_sink_class = sink_class
+
+    target = Target()
+    _run(
+        target,
+        [
+            {"id": 1, "name": "a", "updated_at": "2021-01-01T00:00:00+00:00"},
+            {"id": 1, "name": "b", "updated_at": "2021-01-03T00:00:00+00:00"},
+            {"id": 2, "name": "c", "updated_at": None},
+            {"id": 1, "name": "d", "updated_at": None},
+            {"id": 1, "name": "e", "updated_at": "2021-01-02T00:00:00+00:00"},
+        ],
+    )
+
+    assert [record["name"] for record in target.records_written] == names
+
+    sink = target.get_sink("users")
+    assert sink._total_records_read == 5
+    assert sink._total_dupe_records_merged == 5 - len(names)
+    assert sink._total_records_written == len(names)
+
+
+def test_deduplicate_records_per_batch():
+    class Target(TargetMock):
+        default_sink_class = DeduplicatingSink
+
+    target = Target()
+    _run(target, [{"id": 1, "name": "a"}, {"id": 1, "name": "b"}])
+    _run(target, [{"id": 1, "name": "c"}])
+
+    assert [record["name"] for record in target.records_written] == ["b", "c"]
+    assert target.get_sink("users")._total_records_written == 2
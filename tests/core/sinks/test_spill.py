@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import io
+import json
+
+import pytest
+
+from singer_sdk.helpers._spill import SpilledRecords
+from tests.conftest import BatchSinkMock, TargetMock
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "amount": {"type": "number"},
+        "created_at": {"type": "string", "format": "date-time"},
+    },
+}
+
+
+class SpillingSink(BatchSinkMock):
+    max_bytes_in_memory = 100
+
+    def process_batch(self, context: dict) -> None:
+        self.target.batches.append(context["records"])
+        super().process_batch(context)
+
+
+class DeferredSpillingSink(SpillingSink):
+    defer_timestamp_parsing = True
+
+
+def test_spilled_records():
+    records = SpilledRecords([{"id": 0}])
+    for i in range(1, 2500):
+        records.append({"id": i, "at": datetime.date(2021, 1, 1)})
+
+    assert len(records) == 2500
+    assert records.spilled_count == 2499
+    assert [record["id"] for record in records] == list(range(2500))
+
+    # Records can be read again, but not added to once read
+    assert sum(1 for _ in records) == 2500
+    with pytest.raises(RuntimeError, match="after reading it"):
+        records.append({"id": 2500})
+
+    records.close()
+
+
+@pytest.mark.parametrize("sink_class", [SpillingSink, DeferredSpillingSink])
+def test_spill_batch_to_disk(sink_class: type[SpillingSink]):
+    class SpillingTarget(TargetMock):
+        default_sink_class = sink_class
+
+    target = SpillingTarget()
+    target.batches = []
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": SCHEMA, "key_properties": []},
+        *(
+            {
+                "type": "RECORD",
+                "stream": "users",
+                "record": {
+                    "id": i,
+                    "amount": 1.5,
+                    "created_at": f"2021-01-0{i + 1}T00:00:00+00:00",
+                },
+            }
+            for i in range(5)
+        ),
+    ]
+    target._process_lines(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+    target.drain_all()
+
+    # The first records that fit in memory are kept there
+    (batch,) = target.batches
+    assert isinstance(batch, SpilledRecords)
+    assert len(batch.in_memory) == 2
+    assert batch.spilled_count == 3
+    assert batch._file.closed
+
+    # Spilled records are read back with their parsed types
+    assert target.records_written == [
+        {
+            "id": i,
+            "amount": decimal.Decimal("1.5"),
+            "created_at": datetime.datetime(
+                2021,
+                1,
+                i + 1,
+                tzinfo=datetime.timezone.utc,
+            ),
+        }
+        for i in range(5)
+    ]
+    assert target.get_sink("users")._total_records_written == 5
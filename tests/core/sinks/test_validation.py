@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import copy
 import datetime
+import io
 import itertools
+import json
 
+import jsonschema
 import pytest
 
+from singer_sdk.helpers._util import BoundedCache
+from singer_sdk.helpers._validation import compile_record_check, get_record_check
+from singer_sdk.sinks import RecordSink
 from tests.conftest import BatchSinkMock, TargetMock
 
 
@@ -58,6 +65,194 @@ def test_validate_record():
     assert updated_record["invalid_datetime"] == "9999-12-31 23:59:59.999999"
 
 
+def test_parse_nested_timestamps():
+    class NestedSink(BatchSinkMock):
+        parse_nested_timestamps = True
+
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "created_at": {"type": ["string", "null"], "format": "date-time"},
+            "owner": {
+                "type": ["object", "null"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "born_on": {"type": "string", "format": "date"},
+                },
+            },
+            "events": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "at": {"type": "string", "format": "date-time"},
+                    },
+                },
+            },
+            "holidays": {
+                "type": "array",
+                "items": {"type": "string", "format": "date"},
+            },
+        },
+    }
+    record = {
+        "id": 1,
+        "created_at": None,
+        "owner": {"name": "Alice", "born_on": "1990-01-01"},
+        "events": [{"at": "2021-01-01T00:00:00+00:00"}, {"at": "not a datetime"}],
+        "holidays": ["2021-12-25", "2022-12-25"],
+    }
+    original = copy.deepcopy(record)
+    record_copy = record.copy()
+
+    flat_sink = BatchSinkMock(TargetMock(), "users", schema, ["id"])
+    assert flat_sink._validate_and_parse(copy.deepcopy(record)) == original
+
+    sink = NestedSink(TargetMock(), "users", schema, ["id"])
+    assert sink._validate_and_parse(record) == {
+        "id": 1,
+        "created_at": None,
+        "owner": {"name": "Alice", "born_on": datetime.date(1990, 1, 1)},
+        "events": [
+            {"at": datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)},
+            {"at": "9999-12-31 23:59:59.999999"},
+        ],
+        "holidays": [datetime.date(2021, 12, 25), datetime.date(2022, 12, 25)],
+    }
+
+    # Nested values are replaced, not updated in place
+    assert record_copy == original
+
+
+@pytest.mark.parametrize(
+    "schema,valid,invalid",
+    [
+        pytest.param(
+            {"type": "object", "properties": {"id": {"type": "integer"}}},
+            [{"id": 1}, {"id": 1.0}, {}, {"other": "x"}],
+            [{"id": "1"}, {"id": True}, {"id": 1.5}, []],
+            id="integer",
+        ),
+        pytest.param(
+            {
+                "type": "object",
+                "properties": {"name": {"type": ["string", "null"], "maxLength": 3}},
+                "required": ["name"],
+                "additionalProperties": False,
+            },
+            [{"name": None}, {"name": "abc"}],
+            [{}, {"name": "abcd"}, {"name": 1}, {"name": "a", "other": 1}],
+            id="nullable",
+        ),
+        pytest.param(
+            {
+                "type": "object",
+                "properties": {
+                    "tags": {
+                        "type": "array",
+                        "items": {"anyOf": [{"type": "number"}, {"type": "null"}]},
+                        "minItems": 1,
+                    },
+                    "day": {"type": "string", "format": "date"},
+                },
+            },
+            [{"tags": [1, None, 2.5]}, {"day": "2021-01-01"}],
+            [{"tags": []}, {"tags": ["1"]}, {"tags": [False]}, {"day": "01/01/2021"}],
+            id="array-format",
+        ),
+        pytest.param(
+            {
+                "definitions": {"positive": {"type": "number", "minimum": 0}},
+                "type": "object",
+                "properties": {
+                    "amount": {"$ref": "#/definitions/positive"},
+                    "code": {"enum": ["a", "b"]},
+                },
+            },
+            [{"amount": 0}, {"code": "a"}],
+            [{"amount": -1}, {"code": "c"}],
+            id="unsupported-keywords",
+        ),
+    ],
+)
+def test_compiled_record_check(schema: dict, valid: list, invalid: list):
+    check = compile_record_check(schema)
+    validator = jsonschema.Draft7Validator(
+        schema,
+        format_checker=jsonschema.Draft7Validator.FORMAT_CHECKER,
+    )
+    for record in valid:
+        assert validator.is_valid(record)
+        assert check(record), record
+    for record in invalid:
+        assert not validator.is_valid(record)
+        assert not check(record), record
+
+
+def test_sinks_reuse_validators():
+    target = TargetMock()
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    sink = BatchSinkMock(target, "users", schema, ["id"])
+    other_sink = BatchSinkMock(target, "users", copy.deepcopy(schema), ["id"])
+
+    # Sinks created for the same schema share its validator
+    assert other_sink._validator is sink._validator
+
+    # Changes a sink makes to its schema are seen from its next batch, and do not
+    # change the validator of other sinks
+    schema["properties"]["id"]["type"] = "string"
+    assert sink._validator.is_valid({"id": 1})
+    sink.start_drain()
+    assert not sink._validator.is_valid({"id": 1})
+    assert other_sink._validator.is_valid({"id": 1})
+
+
+def test_validator_sees_schema_changes_on_init():
+    class NamedSink(BatchSinkMock):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            self.schema["properties"]["name"] = {"type": "string"}
+
+    target = TargetMock()
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    BatchSinkMock(target, "users", copy.deepcopy(schema), ["id"])._validator  # noqa: B018
+    sink = NamedSink(target, "users", schema, ["id"])
+
+    # The schema is looked up after the sink is done changing it
+    with pytest.raises(jsonschema.ValidationError):
+        sink._validate_and_parse({"id": 1, "name": 1})
+
+
+def test_bounded_cache():
+    cache: BoundedCache[str, int] = BoundedCache(2)
+    assert cache.get("a", lambda: 1) == 1
+    assert cache.get("b", lambda: 2) == 2
+
+    # Cached values are reused, and the least recently used entry is evicted
+    assert cache.get("a", lambda: 10) == 1
+    assert cache.get("c", lambda: 3) == 3
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+
+
+def test_compiled_validation_backend():
+    target = TargetMock(config={"validation_backend": "compiled"})
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    sink = BatchSinkMock(target, "users", schema, ["id"])
+
+    assert sink._record_check is get_record_check("compiled", schema)
+    assert sink._validate_and_parse({"id": 1}) == {"id": 1}
+    with pytest.raises(jsonschema.ValidationError, match="'1' is not of type"):
+        sink._validate_and_parse({"id": "1"})
+
+
+def test_unknown_validation_backend():
+    with pytest.raises(ValueError, match="Unknown validation backend 'other'"):
+        get_record_check("other", {"type": "object"})
+
+
 @pytest.fixture
 def bench_sink() -> BatchSinkMock:
     target = TargetMock()
@@ -102,6 +297,20 @@ def test_bench_parse_timestamps_in_record(benchmark, bench_sink, bench_record):
     benchmark(run_parse_timestamps_in_record)
 
 
+def test_bench_parse_batch_timestamps(benchmark, bench_sink, bench_record):
+    """Run benchmark for Sink method _parse_batch_timestamps."""
+    number_of_runs = 1000
+
+    sink: BatchSinkMock = bench_sink
+    sink.defer_timestamp_parsing = True
+
+    def run_parse_batch_timestamps():
+        records = [record.copy() for record in [bench_record] * number_of_runs]
+        sink._parse_batch_timestamps({"records": records})
+
+    benchmark(run_parse_batch_timestamps)
+
+
 def test_bench_validate_and_parse(benchmark, bench_sink, bench_record):
     """Run benchmark for Sink method _validate_and_parse."""
     number_of_runs = 1000
@@ -126,3 +335,257 @@ def test_bench_validate_record_with_schema(benchmark, bench_sink, bench_record):
             sink._validator.validate(record)
 
     benchmark(run_validate_record_with_schema)
+
+
+def test_bench_validate_record_with_compiled_check(
+    benchmark,
+    bench_sink,
+    bench_record,
+):
+    """Run benchmark for a compiled record check."""
+    number_of_runs = 1000
+
+    check = get_record_check("compiled", bench_sink.schema)
+
+    def run_validate_record_with_compiled_check():
+        for record in itertools.repeat(bench_record, number_of_runs):
+            check(record)
+
+    benchmark(run_validate_record_with_compiled_check)
+
+
+def test_bench_validate_record_with_fastjsonschema(
+    benchmark,
+    bench_sink,
+    bench_record,
+):
+    """Run benchmark for a fastjsonschema record check."""
+    pytest.importorskip("fastjsonschema")
+    number_of_runs = 1000
+
+    check = get_record_check("fastjsonschema", bench_sink.schema)
+
+    def run_validate_record_with_fastjsonschema():
+        for record in itertools.repeat(bench_record, number_of_runs):
+            check(record)
+
+    benchmark(run_validate_record_with_fastjsonschema)
+
+
+def test_sample_validation_mode():
+    target = TargetMock(
+        config={
+            "validation_mode": "sample",
+            "validation_sample_rate": 3,
+            "validation_sample_size": 2,
+        },
+    )
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    sink = BatchSinkMock(target, "users", schema, ["id"])
+
+    validated = []
+    for index in range(8):
+        try:
+            sink._validate_and_parse({"id": str(index)})
+        except jsonschema.ValidationError:
+            validated.append(index)
+        sink.tally_record_read()
+
+    assert validated == [0, 1, 3, 6]
+
+
+def test_batch_validation_mode(monkeypatch: pytest.MonkeyPatch):
+    target = TargetMock(config={"validation_mode": "batch"})
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "created_at": {"type": "string", "format": "date-time"},
+        },
+    }
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        *(
+            {
+                "type": "RECORD",
+                "stream": "users",
+                "record": {"id": i, "created_at": "2021-01-01T00:00:00+00:00"},
+            }
+            for i in range(2)
+        ),
+        {"type": "RECORD", "stream": "users", "record": {"id": "2"}},
+    ]
+
+    # Records are read without being validated
+    target._process_lines(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+    assert target.num_records_processed == 3
+
+    errors = []
+    sink = target.get_sink("users")
+    monkeypatch.setattr(
+        sink.logger, "error", lambda msg, *args: errors.append(msg % args)
+    )
+
+    # Parsed timestamps do not fail validation, the invalid record does
+    with pytest.raises(jsonschema.ValidationError, match="'2' is not of type"):
+        target.drain_all()
+
+    assert target.records_written == []
+    assert errors == [
+        "Record 2 of stream 'users' failed validation: '2' is not of type 'integer'",
+    ]
+
+
+def test_batch_validation_mode_validates_records_as_read():
+    class RenamingSink(BatchSinkMock):
+        def preprocess_record(self, record: dict, context: dict) -> dict:
+            record["id"] = str(record["id"])
+            return super().preprocess_record(record, context)
+
+    class RenamingTarget(TargetMock):
+        default_sink_class = RenamingSink
+
+    target = RenamingTarget(config={"validation_mode": "batch"})
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "created_at": {"type": "string", "format": "date-time"},
+        },
+    }
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        {
+            "type": "RECORD",
+            "stream": "users",
+            "record": {"id": 1, "created_at": "2021-01-01T00:00:00+00:00"},
+        },
+    ]
+    target._process_lines(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+
+    # Timestamps are parsed as records are read
+    buffered = target.get_sink("users")._pending_batch["records"]
+    assert isinstance(buffered[0]["created_at"], datetime.datetime)
+
+    # Records are validated as read, before they were preprocessed
+    target.drain_all()
+    assert target.records_written == buffered
+    assert buffered[0]["id"] == "1"
+
+
+def test_batch_validation_mode_custom_buffer():
+    class CustomBufferSink(BatchSinkMock):
+        def process_record(self, record: dict, context: dict) -> None:
+            context.setdefault("rows", []).append(record)
+
+        def process_batch(self, context: dict) -> None:
+            self.target.records_written.extend(context["rows"])
+
+    class CustomBufferTarget(TargetMock):
+        default_sink_class = CustomBufferSink
+
+    target = CustomBufferTarget(config={"validation_mode": "batch"})
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        {"type": "RECORD", "stream": "users", "record": {"id": 1}},
+        {"type": "RECORD", "stream": "users", "record": {"id": "2"}},
+    ]
+    target._process_lines(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+
+    # Records are validated whichever way the sink buffers them
+    with pytest.raises(jsonschema.ValidationError, match="'2' is not of type"):
+        target.drain_all()
+    assert target.records_written == []
+
+
+def test_batch_validation_mode_in_chunks(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("singer_sdk.sinks.core.BATCH_VALIDATION_CHUNK_SIZE", 2)
+    target = TargetMock(config={"validation_mode": "batch"})
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        *({"type": "RECORD", "stream": "users", "record": {"id": i}} for i in range(4)),
+        {"type": "RECORD", "stream": "users", "record": {"id": "4"}},
+    ]
+    target._process_lines(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+
+    # Full chunks are validated in the background as records are read
+    sink = target.get_sink("users")
+    assert len(sink._validation_chunks) == 2
+    assert len(sink._records_to_validate) == 1
+
+    with pytest.raises(jsonschema.ValidationError, match="'4' is not of type"):
+        target.drain_all()
+    assert target.records_written == []
+
+
+def test_batch_validation_mode_record_sink():
+    class ListRecordSink(RecordSink):
+        def process_record(self, record: dict, context: dict) -> None:  # noqa: ARG002
+            self.target.records_written.append(record)
+
+    class RecordTarget(TargetMock):
+        default_sink_class = ListRecordSink
+
+    target = RecordTarget(config={"validation_mode": "batch"})
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        {"type": "RECORD", "stream": "users", "record": {"id": "1"}},
+    ]
+
+    # Records are written as they are read, so they are validated first
+    with pytest.raises(jsonschema.ValidationError):
+        target._process_lines(
+            io.StringIO("\n".join(json.dumps(line) for line in lines)),
+        )
+    assert target.records_written == []
+
+
+def test_deferred_timestamp_parsing():
+    class DeferredSink(BatchSinkMock):
+        defer_timestamp_parsing = True
+
+    class DeferredTarget(TargetMock):
+        default_sink_class = DeferredSink
+
+    # Invalid dates are only let through when records are not validated
+    target = DeferredTarget(
+        config={"validation_mode": "sample", "validation_sample_rate": 0},
+    )
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "created_on": {"type": ["string", "null"], "format": "date"},
+        },
+    }
+    created_on = ["2021-01-01", None, "not a date", "2021-01-01", "not a date"]
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        *(
+            {"type": "RECORD", "stream": "users", "record": {"id": i, "created_on": v}}
+            for i, v in enumerate(created_on)
+        ),
+        {"type": "RECORD", "stream": "users", "record": {"id": 5}},
+    ]
+    target._process_lines(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+
+    # Records are buffered as they were read
+    sink = target.get_sink("users")
+    assert [record.get("created_on") for record in sink._pending_batch["records"]] == [
+        *created_on,
+        None,
+    ]
+
+    target.drain_all()
+    assert [record.get("created_on") for record in target.records_written] == [
+        datetime.date(2021, 1, 1),
+        None,
+        "9999-12-31 23:59:59.999999",
+        datetime.date(2021, 1, 1),
+        "9999-12-31 23:59:59.999999",
+        None,
+    ]
+    assert "created_on" not in target.records_written[-1]
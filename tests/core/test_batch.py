@@ -250,3 +250,77 @@ def test_batcher_with_parquet_encoding():
         for batch in batches
         for filepath in batch
     )
+
+
+@pytest.mark.parametrize(
+    "batcher_class,encoding",
+    [
+        pytest.param(JSONLinesBatcher, JSONLinesEncoding("gzip"), id="jsonl"),
+        pytest.param(
+            ParquetBatcher,
+            ParquetEncoding(),
+            id="parquet",
+            marks=skip_if_no_pyarrow,
+        ),
+    ],
+)
+@pytest.mark.parametrize("max_concurrent_batch_files", [1, 3])
+def test_process_batch_files_in_chunks(
+    tmp_path,
+    batcher_class: type[Batcher],
+    encoding: BaseBatchFileEncoding,
+    max_concurrent_batch_files: int,
+):
+    from tests.conftest import BatchSinkMock, TargetMock
+
+    class ChunkedSink(BatchSinkMock):
+        batch_file_chunk_size = 2
+
+    batcher = batcher_class(
+        "tap-test",
+        "stream-test",
+        batch_config=BatchConfig(
+            encoding=encoding,
+            storage=StorageTarget(tmp_path.as_uri()),
+            batch_size=3,
+        ),
+    )
+    records = [{"id": i, "name": f"name-{i}"} for i in range(7)]
+    files = [path for batch in batcher.get_batches(records) for path in batch]
+    assert len(files) == 3
+
+    target = TargetMock()
+    sink = ChunkedSink(
+        target,
+        "stream-test",
+        {
+            "type": "object",
+            "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+        },
+        ["id"],
+    )
+    sink.max_concurrent_batch_files = max_concurrent_batch_files
+    sink.process_batch_files(encoding, files)
+
+    # Files are processed in order, in chunks of up to 2 records
+    assert target.records_written == records
+    assert target.num_batches_processed == 5
+
+
+def test_prefetch():
+    from singer_sdk.helpers._prefetch import prefetch
+
+    def source(n: int):
+        return lambda: iter(range(n * 10, n * 10 + 5))
+
+    items = prefetch([source(n) for n in range(4)], max_workers=2)
+    assert list(items) == [n * 10 + i for n in range(4) for i in range(5)]
+
+    def failing_source():
+        yield 1
+        msg = "Boom"
+        raise ValueError(msg)
+
+    items = prefetch([source(0), failing_source, source(2)], max_workers=3)
+    with pytest.raises(ValueError, match="Boom"):
+        list(items)
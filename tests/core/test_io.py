@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import copy
 import decimal
+import gzip
+import io
 import itertools
 import json
-from contextlib import nullcontext
+import threading
+import time
+from contextlib import nullcontext, redirect_stdout
 
 import pytest
 
-from singer_sdk._singerlib import RecordMessage
-from singer_sdk.io_base import SingerReader, SingerWriter
+from singer_sdk._singerlib import RecordMessage, StateMessage
+from singer_sdk._singerlib.json import get_codec
+from singer_sdk.io_base import LazyMessageDict, SingerReader, SingerWriter
 
 
 class DummyReader(SingerReader):
@@ -49,6 +55,16 @@ class DummyReader(SingerReader):
             nullcontext(),
             id="record",
         ),
+        pytest.param(
+            b'{"type": "RECORD", "stream": "users", "record": {"value": 1.23}}',
+            {
+                "type": "RECORD",
+                "stream": "users",
+                "record": {"value": decimal.Decimal("1.23")},
+            },
+            nullcontext(),
+            id="record_bytes",
+        ),
     ],
 )
 def test_deserialize(line, expected, exception):
@@ -111,3 +127,248 @@ def test_bench_deserialize_json(benchmark, bench_encoded_record):
             reader.deserialize_json(record)
 
     benchmark(run_deserialize_json)
+
+
+def test_buffered_writer_flushes_on_state():
+    writer = SingerWriter()
+    writer.buffered_output = True
+    writer.output_flush_interval = 60
+
+    record = RecordMessage(stream="users", record={"id": 1})
+    with redirect_stdout(io.StringIO()) as out:
+        writer.write_message(record)
+        writer.write_message(record)
+        assert out.getvalue() == ""
+
+        writer.write_message(StateMessage(value={"bookmarks": {}}))
+        lines = out.getvalue().splitlines()
+
+    assert len(lines) == 3
+    assert json.loads(lines[-1]) == {"type": "STATE", "value": {"bookmarks": {}}}
+
+
+def test_buffered_writer_flushes_on_size():
+    writer = SingerWriter()
+    writer.buffered_output = True
+    writer.output_buffer_size = 100
+    writer.output_flush_interval = 60
+
+    record = RecordMessage(stream="users", record={"id": 1})
+    with redirect_stdout(io.StringIO()) as out:
+        writer.write_message(record)
+        assert out.getvalue() == ""
+
+        writer.write_message(record)
+        assert len(out.getvalue().splitlines()) == 2
+
+        writer.write_message(record)
+        writer.flush_output()
+        assert len(out.getvalue().splitlines()) == 3
+
+
+@pytest.mark.parametrize("threaded_output", [False, True])
+def test_buffered_writer_flushes_when_idle(threaded_output: bool):
+    writer = SingerWriter()
+    writer.buffered_output = True
+    writer.threaded_output = threaded_output
+    writer.output_flush_interval = 0.05
+
+    with redirect_stdout(io.StringIO()) as out:
+        writer.write_message(RecordMessage(stream="users", record={"id": 1}))
+        deadline = time.monotonic() + 5
+        while not out.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(out.getvalue().splitlines()) == 1
+        writer.close_output()
+
+
+def test_threaded_writer():
+    writer = SingerWriter()
+    writer.threaded_output = True
+    writer.output_queue_size = 2
+
+    with redirect_stdout(io.StringIO()) as out:
+        for i in range(10):
+            writer.write_message(RecordMessage(stream="users", record={"id": i}))
+        writer.flush_output()
+
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [line["record"]["id"] for line in lines] == list(range(10))
+
+
+def test_threaded_writer_state_snapshot():
+    record_written = threading.Event()
+
+    class SlowWriter(SingerWriter):
+        threaded_output = True
+
+        def format_message(self, message):
+            if message.type == "RECORD":
+                record_written.wait(5)
+            return super().format_message(message)
+
+    writer = SlowWriter()
+    state = {"bookmarks": {"users": {"id": 1}}}
+    with redirect_stdout(io.StringIO()) as out:
+        writer.write_message(RecordMessage(stream="users", record={"id": 1}))
+        writer.write_message(StateMessage(value=state))
+        state["bookmarks"]["users"]["id"] = 2
+        record_written.set()
+        writer.flush_output()
+
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert lines[-1]["value"] == {"bookmarks": {"users": {"id": 1}}}
+
+
+def test_threaded_writer_error():
+    class FailingWriter(SingerWriter):
+        threaded_output = True
+
+        def format_message(self, message):  # noqa: ARG002
+            msg = "Cannot format message"
+            raise RuntimeError(msg)
+
+    writer = FailingWriter()
+    writer.write_message(RecordMessage(stream="users", record={"id": 1}))
+    with pytest.raises(RuntimeError, match="Cannot format message"):
+        writer.flush_output()
+
+
+def test_lazy_message_dict():
+    reader = DummyReader()
+    reader.input_codec = "msgspec"
+    line = b'{"type": "RECORD", "stream": "users", "record": {"id": 1, "value": 1.5}}'
+    message = reader.deserialize_json_lazy(line)
+
+    assert isinstance(message, LazyMessageDict)
+    assert message["type"] == "RECORD"
+    assert message["stream"] == "users"
+    assert "record" in message
+    assert not message.is_decoded
+
+    assert message["record"] == {"id": 1, "value": decimal.Decimal("1.5")}
+    assert message.is_decoded
+    assert message == {
+        "type": "RECORD",
+        "stream": "users",
+        "record": {"id": 1, "value": decimal.Decimal("1.5")},
+    }
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        pytest.param(b'{"type": "STATE", "value": {"bookmarks": {}}}', id="state"),
+        pytest.param(b'{"type": "ACTIVATE_VERSION", "record": {}}', id="unknown"),
+    ],
+)
+def test_lazy_message_non_record(line: bytes):
+    reader = DummyReader()
+    reader.input_codec = "msgspec"
+    message = reader.deserialize_json_lazy(line)
+    assert not isinstance(message, LazyMessageDict)
+    assert message == json.loads(line)
+
+
+def test_lazy_message_copy():
+    message = LazyMessageDict(
+        {"type": "RECORD", "stream": "users"},
+        b'{"id": 1}',
+        get_codec("stdlib"),
+    )
+    assert copy.copy(message) == {
+        "type": "RECORD",
+        "stream": "users",
+        "record": {"id": 1},
+    }
+    assert not isinstance(copy.copy(message), LazyMessageDict)
+
+
+@pytest.mark.parametrize("buffered_output", [False, True])
+def test_msgpack_round_trip(buffered_output: bool):
+    pytest.importorskip("msgspec")
+
+    class RecordingReader(DummyReader):
+        def __init__(self):
+            self.messages = []
+
+        def _process_record_message(self, message_dict: dict) -> None:
+            self.messages.append(message_dict)
+
+        def _process_state_message(self, message_dict: dict) -> None:
+            self.messages.append(message_dict)
+
+    writer = SingerWriter()
+    writer.output_format = "msgpack"
+    writer.buffered_output = buffered_output
+
+    output = io.BytesIO()
+    with redirect_stdout(io.TextIOWrapper(output, write_through=True)):
+        writer.write_message(
+            RecordMessage(stream="users", record={"amount": decimal.Decimal("1.10")}),
+        )
+        writer.write_raw_message(
+            '{"type": "RECORD", "stream": "users", "record": {}}', "RECORD"
+        )
+        writer.write_message(StateMessage(value={"bookmarks": {}}))
+        writer.flush_output()
+        data = output.getvalue()
+
+    reader = RecordingReader()
+    reader.listen(io.BytesIO(data))
+    assert reader.messages == [
+        {
+            "type": "RECORD",
+            "stream": "users",
+            "record": {"amount": decimal.Decimal("1.10")},
+        },
+        {"type": "RECORD", "stream": "users", "record": {}},
+        {"type": "STATE", "value": {"bookmarks": {}}},
+    ]
+
+
+def test_compressed_output():
+    writer = SingerWriter()
+    writer.output_compression = "gzip"
+    writer.buffered_output = True
+
+    output = io.BytesIO()
+    with redirect_stdout(io.TextIOWrapper(output, write_through=True)):
+        writer.write_message(RecordMessage(stream="users", record={"id": 1}))
+        writer.write_message(StateMessage(value={"bookmarks": {}}))
+        # STATE messages are flushed as a complete compressed block
+        assert gzip.GzipFile(fileobj=io.BytesIO(output.getvalue())).readline()
+
+        writer.write_message(RecordMessage(stream="users", record={"id": 2}))
+        writer.close_output()
+        data = output.getvalue()
+
+    lines = [json.loads(line) for line in gzip.decompress(data).splitlines()]
+    assert [line["type"] for line in lines] == ["RECORD", "STATE", "RECORD"]
+
+    class RecordingReader(DummyReader):
+        def __init__(self):
+            self.records = []
+
+        def _process_record_message(self, message_dict: dict) -> None:
+            self.records.append(message_dict["record"])
+
+    reader = RecordingReader()
+    reader.listen(io.BytesIO(data))
+    assert reader.records == [{"id": 1}, {"id": 2}]
+
+
+def test_listen_text_stdin(monkeypatch: pytest.MonkeyPatch):
+    class RecordingReader(DummyReader):
+        def __init__(self):
+            self.records = []
+
+        def _process_record_message(self, message_dict: dict) -> None:
+            self.records.append(message_dict["record"])
+
+    line = '{"type": "RECORD", "stream": "users", "record": {"id": 1}}\n'
+    monkeypatch.setattr("sys.stdin", io.StringIO(line))
+
+    reader = RecordingReader()
+    reader.listen()
+    assert reader.records == [{"id": 1}]
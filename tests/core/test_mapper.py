@@ -798,3 +798,90 @@ def test_bench_simple_map_transforms(
         sample_stream=repositories_sample_stream,
         sample_catalog_obj=repositories_sample_catalog_obj,
     )
+
+
+@pytest.mark.parametrize(
+    "stream_maps,expected_alias",
+    [
+        pytest.param({}, "repositories", id="no_maps"),
+        pytest.param(
+            {"repositories": {"__alias__": "repos"}},
+            "repos",
+            id="alias",
+        ),
+        pytest.param(
+            {"repositories": {"__key_properties__": ["name"]}},
+            "repositories",
+            id="key_properties",
+        ),
+        pytest.param(
+            {"repositories": {"__filter__": "True"}},
+            None,
+            id="filter",
+        ),
+        pytest.param(
+            {"repositories": {"name": "name"}},
+            None,
+            id="property_expression",
+        ),
+        pytest.param(
+            {"repositories": {"__else__": None}},
+            None,
+            id="exclude_by_default",
+        ),
+        pytest.param({"repositories": None}, None, id="removed"),
+        pytest.param(
+            {"repos": {"__source__": "repositories"}},
+            None,
+            id="cloned",
+        ),
+    ],
+)
+def test_get_passthrough_alias(
+    sample_catalog_obj,
+    stream_maps: dict,
+    expected_alias: str | None,
+):
+    mapper = PluginMapper(
+        plugin_config={"stream_maps": stream_maps},
+        logger=logging.getLogger(),
+    )
+    mapper.register_raw_streams_from_catalog(sample_catalog_obj)
+    assert mapper.get_passthrough_alias("repositories") == expected_alias
+
+
+def test_get_passthrough_alias_flattening(sample_catalog_obj):
+    mapper = PluginMapper(
+        plugin_config={"flattening_enabled": True, "flattening_max_depth": 1},
+        logger=logging.getLogger(),
+    )
+    mapper.register_raw_streams_from_catalog(sample_catalog_obj)
+    assert mapper.get_passthrough_alias("repositories") is None
+
+
+def test_flattened_schemas_reused():
+    mapper = PluginMapper(
+        plugin_config={
+            "flattening_enabled": True,
+            "flattening_max_depth": 1,
+            "stream_maps": {"users_copy": {"__source__": "users"}},
+        },
+        logger=logging.getLogger(),
+    )
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "address": {
+                "type": "object",
+                "properties": {"city": {"type": "string"}},
+            },
+        },
+    }
+    mapper.register_raw_stream_schema("users", schema, ["id"])
+
+    # Each stream map gets its own copy of the flattened schema
+    users, users_copy = mapper.stream_maps["users"]
+    assert users.transformed_schema == users_copy.transformed_schema
+    assert users.transformed_schema is not users_copy.transformed_schema
+    assert list(users.transformed_schema["properties"]) == ["id", "address__city"]
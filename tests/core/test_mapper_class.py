@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import io
 import json
-from contextlib import nullcontext
+from contextlib import nullcontext, redirect_stdout
 
 import pytest
 from click.testing import CliRunner
@@ -52,3 +53,54 @@ def test_cli_config_validation(tmp_path):
     assert result.exit_code == 1
     assert not result.stdout
     assert "'stream_maps' is a required property" in result.stderr
+
+
+@pytest.mark.parametrize(
+    "stream_maps,expected_streams",
+    [
+        pytest.param({}, ["users", "users"], id="same_stream"),
+        pytest.param(
+            {"users": {"__alias__": "people"}},
+            ["people", "people"],
+            id="aliased_stream",
+        ),
+        pytest.param(
+            {"users": {"__filter__": "id > 1"}},
+            ["users"],
+            id="filtered_stream",
+        ),
+    ],
+)
+@pytest.mark.parametrize("lazy_messages", [True, False])
+def test_raw_passthrough(
+    stream_maps: dict,
+    expected_streams: list[str],
+    lazy_messages: bool,
+):
+    mapper = StreamTransform(config={"stream_maps": stream_maps})
+    mapper.raw_passthrough = True
+    mapper.lazy_messages = lazy_messages
+    mapper.input_codec = "msgspec"
+
+    schema = {"properties": {"id": {"type": "integer"}, "amount": {"type": "number"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        {"type": "RECORD", "stream": "users", "record": {"id": 1, "amount": 1.10}},
+        {"type": "RECORD", "stream": "users", "record": {"id": 2, "amount": 2.20}},
+    ]
+    output = io.StringIO()
+    with redirect_stdout(output):
+        mapper.listen(io.BytesIO("\n".join(json.dumps(x) for x in lines).encode()))
+
+    records = [
+        json.loads(line)
+        for line in output.getvalue().splitlines()
+        if json.loads(line)["type"] == "RECORD"
+    ]
+    assert [record["stream"] for record in records] == expected_streams
+    # Records passed through are stamped like mapped records
+    assert all("time_extracted" in record for record in records)
+    passthrough = "__filter__" not in stream_maps.get("users", {})
+    assert [record["record"] for record in records] == [
+        line["record"] for line in lines[1:] if passthrough or line["record"]["id"] > 1
+    ]
@@ -101,3 +101,23 @@ def test_sync_timer(caplog: pytest.LogCaptureFixture):
     }
 
     assert pytest.approx(point.value, rel=0.001) == end_time - start_time
+
+
+def test_gauge(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.INFO, logger=metrics.METRICS_LOGGER_NAME)
+
+    with metrics.writer_queue_gauge(custom_tag="pytest") as gauge:
+        gauge.set(3)
+        assert not caplog.records
+
+        gauge.last_log_time = 0
+        gauge.set(5)
+        gauge.set(2)
+
+    assert len(caplog.records) == 2
+    points: list[metrics.Point[float]] = [record.args[0] for record in caplog.records]
+    assert [point.value for point in points] == [5, 2]
+    for point in points:
+        assert point.metric_type == "gauge"
+        assert point.metric == "writer_queue_depth"
+        assert point.tags == {"custom_tag": "pytest"}
@@ -548,3 +548,47 @@ def test_stream_class_selection(tap_class, input_catalog, selection):
     assert all(
         tap.streams[stream].selected is selection[stream] for stream in selection
     )
+
+
+def test_time_extracted_per_page(tap: Tap, requests_mock, monkeypatch):
+    """Records of the same page share their extraction time."""
+    page_times = iter(
+        [
+            pendulum.datetime(2023, 1, 1, tz="UTC"),
+            pendulum.datetime(2023, 1, 2, tz="UTC"),
+        ],
+    )
+    monkeypatch.setattr("singer_sdk.streams.rest.utc_now", lambda: next(page_times))
+
+    requests_mock.get(
+        "https://example.com/example",
+        [
+            {
+                "json": [
+                    {"id": 1, "value": "a", "updatedAt": "2022-01-01"},
+                    {"id": 2, "value": "b", "updatedAt": "2022-01-02"},
+                ],
+                "headers": {"X-Next-Page": "2"},
+            },
+            {"json": [{"id": 3, "value": "c", "updatedAt": "2022-01-03"}]},
+        ],
+    )
+
+    stream = RestTestStream(tap)
+    stream.records_jsonpath = "$[*]"
+    stream.next_page_token_jsonpath = None
+    tap.mapper.register_raw_stream_schema(
+        stream.name,
+        stream.schema,
+        stream.primary_keys,
+    )
+    records = [
+        message
+        for record in stream.get_records(None)
+        for message in stream._generate_record_messages(record)
+    ]
+    assert [(m.record["id"], m.time_extracted.day) for m in records] == [
+        (1, 1),
+        (2, 1),
+        (3, 2),
+    ]
@@ -1,16 +1,31 @@
 from __future__ import annotations
 
 import copy
+import io
+import json
+import threading
+import time
+import typing as t
 
+import jsonschema
 import pytest
+import time_machine
 
+from singer_sdk import metrics
+from singer_sdk._singerlib.framing import MSGPACK_MAGIC, get_framing
 from singer_sdk.exceptions import (
     MissingKeyPropertiesError,
     RecordsWithoutSchemaException,
 )
+from singer_sdk.helpers._drain_executor import DrainExecutor
+from singer_sdk.helpers._util import approximate_size
 from singer_sdk.helpers.capabilities import PluginCapabilities
+from singer_sdk.sinks import RecordSink
 from tests.conftest import BatchSinkMock, SQLSinkMock, SQLTargetMock, TargetMock
 
+if t.TYPE_CHECKING:
+    from singer_sdk.sinks import Sink
+
 
 def test_get_sink():
     input_schema_1 = {
@@ -141,3 +156,769 @@ def test_add_sqlsink_and_get_sink():
         target.get_sink(
             "bar",
         )
+
+
+def test_lazy_messages_skip_filtered_streams():
+    target = TargetMock(config={"stream_maps": {"skipped": None}})
+    target.lazy_messages = True
+    target.input_codec = "msgspec"
+
+    schema = {"properties": {"id": {"type": "integer"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": "kept", "schema": schema, "key_properties": []},
+        {"type": "SCHEMA", "stream": "skipped", "schema": schema, "key_properties": []},
+        {"type": "RECORD", "stream": "kept", "record": {"id": 1}},
+        {"type": "RECORD", "stream": "skipped", "record": {"id": 2}},
+    ]
+    messages = []
+    process_record_message = target._process_record_message
+
+    def _spy(message_dict: dict) -> None:
+        messages.append(message_dict)
+        process_record_message(message_dict)
+
+    target._process_record_message = _spy
+    target.listen(io.BytesIO("\n".join(json.dumps(line) for line in lines).encode()))
+
+    assert target.records_written == [{"id": 1}]
+    kept, skipped = messages
+    assert kept.is_decoded
+    assert not skipped.is_decoded
+
+
+def test_decode_workers(monkeypatch: pytest.MonkeyPatch):
+    target = TargetMock(config={"add_record_metadata": True})
+    target.decode_workers = 2
+    target.decode_chunk_size = 3
+
+    schema = {
+        "properties": {
+            "id": {"type": "integer"},
+            "updated_at": {"type": "string", "format": "date-time"},
+        },
+    }
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        *(
+            {
+                "type": "RECORD",
+                "stream": "users",
+                "record": {"id": i, "updated_at": "2023-01-01T00:00:00+00:00"},
+            }
+            for i in range(60)
+        ),
+        {"type": "STATE", "value": {"bookmarks": {"users": {"id": 59}}}},
+    ]
+
+    validated = []
+    validate = jsonschema.Draft7Validator.validate
+
+    def _spy(self, instance: dict, *args, **kwargs) -> None:
+        validated.append(instance["id"])
+        validate(self, instance, *args, **kwargs)
+
+    monkeypatch.setattr(jsonschema.Draft7Validator, "validate", _spy)
+    target.listen(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+
+    assert [record["id"] for record in target.records_written] == list(range(60))
+    # Records decoded after the SCHEMA message was processed are validated by workers
+    assert len(validated) < 60
+    assert all(record["updated_at"].year == 2023 for record in target.records_written)
+    assert target.state_messages_written[-1] == lines[-1]["value"]
+
+
+def test_decode_workers_validation_error():
+    target = TargetMock()
+    target.decode_workers = 1
+
+    schema = {"properties": {"id": {"type": "integer"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        {"type": "RECORD", "stream": "users", "record": {"id": "not an integer"}},
+    ]
+    with pytest.raises(jsonschema.ValidationError):
+        target.listen(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+
+
+def test_decode_workers_invalid_json():
+    target = TargetMock()
+    target.decode_workers = 1
+
+    with pytest.raises(json.JSONDecodeError):
+        target.listen(io.StringIO('{"type": "STATE", "value": {}}\n{"type": '))
+
+
+@pytest.mark.parametrize("decode_workers", [0, 2])
+def test_msgpack_input(decode_workers: int):
+    pytest.importorskip("msgspec")
+
+    target = TargetMock()
+    target.decode_workers = decode_workers
+
+    schema = {"properties": {"id": {"type": "integer"}}}
+    messages = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        {"type": "RECORD", "stream": "users", "record": {"id": 1}},
+        {"type": "STATE", "value": {"bookmarks": {"users": {"id": 1}}}},
+    ]
+    framing = get_framing()
+    target.listen(
+        io.BytesIO(MSGPACK_MAGIC + b"".join(map(framing.encode_frame, messages))),
+    )
+
+    assert target.records_written == [{"id": 1}]
+    assert target.state_messages_written[-1] == messages[-1]["value"]
+
+
+@pytest.mark.parametrize("decode_workers", [0, 2])
+def test_mmap_input(tmp_path, decode_workers: int):
+    target = TargetMock()
+    target.mmap_input = True
+    target.decode_workers = decode_workers
+    target.decode_chunk_size = 4
+
+    schema = {"properties": {"id": {"type": "integer"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        *(
+            {"type": "RECORD", "stream": "users", "record": {"id": i}}
+            for i in range(10)
+        ),
+        {"type": "STATE", "value": {"bookmarks": {"users": {"id": 9}}}},
+    ]
+    path = tmp_path / "data.singer"
+    path.write_text("\n".join(json.dumps(line) for line in lines))
+
+    with path.open("rb") as file_input:
+        target.listen(file_input)
+
+    assert target.records_written == [{"id": i} for i in range(10)]
+    assert target.state_messages_written[-1] == lines[-1]["value"]
+
+
+@pytest.mark.parametrize("max_batches_in_flight", [1, 2])
+def test_background_drains(max_batches_in_flight: int):
+    drain_started = threading.Event()
+    release_drain = threading.Event()
+    records_read_during_drain: list[int] = []
+
+    class BlockingSink(BatchSinkMock):
+        MAX_SIZE_DEFAULT = 2
+
+        def process_batch(self, context: dict) -> None:
+            drain_started.set()
+            release_drain.wait(timeout=5)
+            super().process_batch(context)
+
+    class BlockingTarget(TargetMock):
+        default_sink_class = BlockingSink
+
+        def _process_record_message(self, message_dict: dict) -> None:
+            if drain_started.is_set() and not release_drain.is_set():
+                records_read_during_drain.append(message_dict["record"]["id"])
+                if len(records_read_during_drain) == 2 * max_batches_in_flight:
+                    release_drain.set()
+            super()._process_record_message(message_dict)
+
+    BlockingSink.max_batches_in_flight = max_batches_in_flight
+    target = BlockingTarget()
+
+    schema = {"properties": {"id": {"type": "integer"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        {"type": "RECORD", "stream": "users", "record": {"id": 0}},
+        {"type": "RECORD", "stream": "users", "record": {"id": 1}},
+        {"type": "STATE", "value": {"bookmarks": {"users": {"id": 1}}}},
+        *(
+            {"type": "RECORD", "stream": "users", "record": {"id": i}}
+            for i in range(2, 10)
+        ),
+    ]
+    target.listen(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+
+    # Input was read while the first batch was being drained
+    assert records_read_during_drain[0] == 2
+    assert target.records_written == [{"id": i} for i in range(10)]
+    assert target.num_batches_processed == 5
+
+    sink = target.get_sink("users")
+    assert sink._total_records_written == 10
+    # Written once the batch read before it was drained, and again by the final drain
+    assert target.state_messages_written == [lines[3]["value"]] * 2
+
+
+def test_background_drain_error():
+    class FailingSink(BatchSinkMock):
+        MAX_SIZE_DEFAULT = 1
+        max_batches_in_flight = 1
+
+        def process_batch(self, context: dict) -> None:  # noqa: ARG002
+            msg = "Drain failed"
+            raise RuntimeError(msg)
+
+    class FailingTarget(TargetMock):
+        default_sink_class = FailingSink
+
+    target = FailingTarget()
+    schema = {"properties": {"id": {"type": "integer"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        {"type": "RECORD", "stream": "users", "record": {"id": 1}},
+        {"type": "STATE", "value": {"bookmarks": {"users": {"id": 1}}}},
+    ]
+    with pytest.raises(RuntimeError, match="Drain failed"):
+        target.listen(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+
+    assert target.state_messages_written == []
+
+
+@pytest.mark.parametrize(
+    "drain_order,expected_streams",
+    [
+        pytest.param("largest", ["large"], id="largest"),
+        pytest.param("oldest", ["small", "large"], id="oldest"),
+    ],
+)
+def test_max_buffer_bytes(drain_order: str, expected_streams: list[str]):
+    target = TargetMock(
+        config={"max_buffer_bytes": 1000, "buffer_drain_order": drain_order},
+    )
+
+    schema = {"properties": {"id": {"type": "integer"}, "data": {"type": "string"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": name, "schema": schema, "key_properties": []}
+        for name in ("small", "large")
+    ]
+    lines.append({"type": "RECORD", "stream": "small", "record": {"id": 0}})
+    lines.extend(
+        {"type": "RECORD", "stream": "large", "record": {"id": i, "data": "x" * 300}}
+        for i in range(4)
+    )
+
+    drained_streams: list[str] = []
+    drain_one = target.drain_one
+
+    def _spy(sink: Sink) -> None:
+        drained_streams.append(sink.stream_name)
+        drain_one(sink)
+
+    target.drain_one = _spy  # type: ignore[method-assign]
+    target._process_lines(
+        io.StringIO("\n".join(json.dumps(line) for line in lines)),
+    )
+
+    # The budget is exceeded by the fourth large record
+    assert drained_streams == expected_streams
+    assert target.get_sink("large").buffered_bytes == 0
+    assert target._buffered_bytes <= 1000
+
+    for name in ("small", "large"):
+        sink = target.get_sink(name)
+        assert sink._buffer_size_gauge.value == sink.buffered_bytes
+
+
+def test_max_buffer_bytes_with_record_sinks():
+    events: list[dict] = []
+
+    class ListRecordSink(RecordSink):
+        def process_record(self, record: dict, context: dict) -> None:  # noqa: ARG002
+            events.append(record)
+
+    class MixedTarget(TargetMock):
+        def get_sink_class(self, stream_name: str) -> type[Sink]:
+            return ListRecordSink if stream_name == "events" else BatchSinkMock
+
+    target = MixedTarget(config={"max_buffer_bytes": 1000})
+    schema = {"properties": {"id": {"type": "integer"}, "data": {"type": "string"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": name, "schema": schema, "key_properties": []}
+        for name in ("events", "users")
+    ]
+    for i in range(10):
+        lines.extend(
+            {"type": "RECORD", "stream": name, "record": {"id": i, "data": "x" * 100}}
+            for name in ("events", "users")
+        )
+    target._process_lines(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+
+    # Records written as they are read do not count against the budget
+    users = target.get_sink("users")
+    assert target.get_sink("events").buffered_bytes == 0
+    assert target._buffered_bytes >= 0
+    assert target._buffered_bytes == users.buffered_bytes
+    assert 0 < users.buffered_bytes <= 1000
+    assert len(events) == 10
+    assert target.num_batches_processed > 0
+
+
+@pytest.mark.parametrize("max_batches_in_flight", [0, 1])
+def test_max_buffer_bytes_counts_batches_in_flight(max_batches_in_flight: int):
+    release_drain = threading.Event()
+
+    class BlockingSink(BatchSinkMock):
+        MAX_SIZE_DEFAULT = 2
+
+        def process_batch(self, context: dict) -> None:
+            release_drain.wait(timeout=5)
+            super().process_batch(context)
+
+    class BlockingTarget(TargetMock):
+        default_sink_class = BlockingSink
+
+    BlockingSink.max_batches_in_flight = max_batches_in_flight
+    if not max_batches_in_flight:
+        release_drain.set()
+
+    target = BlockingTarget(config={"max_buffer_bytes": 10_000})
+    schema = {"properties": {"id": {"type": "integer"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        *({"type": "RECORD", "stream": "users", "record": {"id": i}} for i in range(3)),
+    ]
+    target._process_lines(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+    sink = target.get_sink("users")
+    record_bytes = sink.buffered_bytes
+
+    # The full batch counts against the budget until it is drained
+    expected_bytes = record_bytes * (1 + 2 * max_batches_in_flight)
+    assert target._buffered_bytes == expected_bytes
+
+    release_drain.set()
+    target._wait_for_background_drains()
+    assert target._buffered_bytes == record_bytes
+
+
+def test_max_buffer_bytes_waits_for_background_drains():
+    other_batch_started = threading.Event()
+
+    class SlowSink(BatchSinkMock):
+        MAX_SIZE_DEFAULT = 2
+        max_batches_in_flight = 1
+
+        def process_batch(self, context: dict) -> None:
+            if context["records"][0]["id"] == 0:
+                other_batch_started.wait(timeout=0.5)
+            else:
+                other_batch_started.set()
+            super().process_batch(context)
+
+    class SlowTarget(TargetMock):
+        default_sink_class = SlowSink
+
+    target = SlowTarget(config={"max_buffer_bytes": 500})
+    schema = {"properties": {"id": {"type": "integer"}}}
+    new_schema = {"properties": {"id": {"type": "integer"}, "data": {"type": "string"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        *({"type": "RECORD", "stream": "users", "record": {"id": i}} for i in range(3)),
+        {"type": "SCHEMA", "stream": "users", "schema": new_schema},
+        {"type": "RECORD", "stream": "users", "record": {"id": 3, "data": "x" * 600}},
+    ]
+    target._process_lines(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+    target.drain_all()
+
+    # The replaced sink drains its buffered record after its batch in flight
+    assert [record["id"] for record in target.records_written] == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        pytest.param("abc", 5, id="string"),
+        pytest.param(1, 8, id="number"),
+        pytest.param({"a": "b"}, 10, id="object"),
+        pytest.param([1, None], 20, id="array"),
+    ],
+)
+def test_approximate_size(value: t.Any, expected: int):
+    assert approximate_size(value) == expected
+
+
+def test_drain_concurrency_group(monkeypatch: pytest.MonkeyPatch):
+    points: list[metrics.Point] = []
+    monkeypatch.setattr(metrics, "log", lambda _, point: points.append(point))
+    lock = threading.Lock()
+    running: list[str] = []
+    max_running = 0
+
+    class SharedTableSink(BatchSinkMock):
+        max_concurrent_drains = 1
+
+        @property
+        def drain_concurrency_group(self) -> str:
+            return "shared_table"
+
+        def process_batch(self, context: dict) -> None:
+            nonlocal max_running
+            with lock:
+                running.append(self.stream_name)
+                max_running = max(max_running, len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(self.stream_name)
+            super().process_batch(context)
+
+    class SharedTableTarget(TargetMock):
+        default_sink_class = SharedTableSink
+
+    target = SharedTableTarget()
+    schema = {"properties": {"id": {"type": "integer"}}}
+    streams = [f"stream_{i}" for i in range(4)]
+    lines = [
+        *(
+            {"type": "SCHEMA", "stream": name, "schema": schema, "key_properties": []}
+            for name in streams
+        ),
+        *({"type": "RECORD", "stream": name, "record": {"id": 1}} for name in streams),
+    ]
+    target.listen(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+
+    assert target.num_batches_processed == 4
+    assert max_running == 1
+
+    assert (
+        sorted(
+            point.tags[metrics.Tag.STREAM]
+            for point in points
+            if point.metric == metrics.Metric.DRAIN_DURATION
+        )
+        == streams
+    )
+
+
+def test_drain_executor_ignores_noise():
+    executor = DrainExecutor(max_workers=8)
+    parallelism = []
+    for i in range(30):
+        executor._adapt(115 if i % 2 else 85)
+        parallelism.append(executor.parallelism)
+    executor.shutdown()
+
+    # Single rounds vary by 35%, but the smoothed throughput does not move
+    assert parallelism == [8] * 30
+
+
+def test_drain_executor_converges():
+    # Once the database slows down, throughput is highest with 6 drains at a time
+    throughputs = {8: 400, 7: 500, 6: 600, 5: 540, 4: 450}
+    executor = DrainExecutor(max_workers=8)
+    parallelism = []
+    for i in range(50):
+        throughput = 800 if i < 5 else throughputs[executor.parallelism]
+        executor._adapt(throughput * (1.05 if i % 2 else 0.95))
+        parallelism.append(executor.parallelism)
+    executor.shutdown()
+
+    assert parallelism[:8] == [8] * 8
+    assert sorted(set(parallelism)) == [5, 6, 7, 8]
+    # Parallelism settles on the best value instead of oscillating around it
+    assert parallelism[-25:] == [6] * 25
+
+
+def test_record_handlers_copy_records_for_each_map():
+    target = TargetMock(
+        config={
+            "add_record_metadata": True,
+            "stream_maps": {"users_copy": {"__source__": "users"}},
+        },
+    )
+    schema = {"properties": {"id": {"type": "integer"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        {"type": "RECORD", "stream": "users", "record": {"id": 1}},
+        {"type": "RECORD", "stream": "users", "record": {"id": 2}},
+    ]
+    target._process_lines(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+    target.drain_all()
+
+    assert sorted(record["id"] for record in target.records_written) == [1, 1, 2, 2]
+    # Each stream map gets its own copy of the record
+    first, second = (r for r in target.records_written if r["id"] == 1)
+    assert first is not second
+
+
+def test_record_handlers_copy_records_for_sinks():
+    class RenamingSink(BatchSinkMock):
+        def preprocess_record(self, record: dict, context: dict) -> dict:
+            record["name"] = record.pop("id")
+            return super().preprocess_record(record, context)
+
+    class RenamingTarget(TargetMock):
+        default_sink_class = RenamingSink
+
+    target = RenamingTarget()
+    schema = {"properties": {"id": {"type": "integer"}}}
+    target._process_schema_message(
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+    )
+    message = {"type": "RECORD", "stream": "users", "record": {"id": 1}}
+    target._process_record_message(message)
+    target.drain_all()
+
+    # Sinks may change the record in place without changing the message
+    assert message["record"] == {"id": 1}
+    assert target.records_written == [{"name": 1}]
+
+
+def test_record_handlers_with_sinks_by_record():
+    class RoutingTarget(TargetMock):
+        def get_sink(self, stream_name: str, *, record=None, **kwargs) -> Sink:
+            if record is not None and record["id"] % 2:
+                stream_name = f"{stream_name}_odd"
+            return super().get_sink(stream_name, record=record, **kwargs)
+
+    target = RoutingTarget()
+    schema = {"properties": {"id": {"type": "integer"}}}
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        {"type": "SCHEMA", "stream": "users_odd", "schema": schema},
+        *({"type": "RECORD", "stream": "users", "record": {"id": i}} for i in range(4)),
+    ]
+    target._process_lines(io.StringIO("\n".join(json.dumps(line) for line in lines)))
+    users, users_odd = target.get_sink("users"), target.get_sink("users_odd")
+    target.drain_all()
+
+    # The sink is looked up for each record
+    assert users._total_records_written == 2
+    assert users_odd._total_records_written == 2
+
+
+def test_bench_process_lines(benchmark):
+    """Run benchmark for reading and processing RECORD messages end to end."""
+    schema = {
+        "properties": {
+            "id": {"type": "integer"},
+            "name": {"type": "string"},
+            "updated_at": {"type": "string", "format": "date-time"},
+        },
+    }
+    lines = "\n".join(
+        json.dumps(line)
+        for line in [
+            {
+                "type": "SCHEMA",
+                "stream": "users",
+                "schema": schema,
+                "key_properties": [],
+            },
+            *(
+                {
+                    "type": "RECORD",
+                    "stream": "users",
+                    "record": {
+                        "id": i,
+                        "name": f"user {i}",
+                        "updated_at": "2023-01-01T00:00:00+00:00",
+                    },
+                }
+                for i in range(1000)
+            ),
+        ]
+    )
+
+    def run_process_lines():
+        target = TargetMock(config={"add_record_metadata": True})
+        target._process_lines(io.StringIO(lines))
+
+    benchmark(run_process_lines)
+
+
+def test_drain_sinks_by_record_age():
+    schema = {"properties": {"id": {"type": "integer"}}}
+
+    def _process(target: TargetMock, lines: list[dict]) -> None:
+        target._process_lines(io.StringIO("\n".join(json.dumps(x) for x in lines)))
+
+    with time_machine.travel(0, tick=False) as traveller:
+        target = TargetMock()
+        _process(
+            target,
+            [
+                {"type": "SCHEMA", "stream": "slow", "schema": schema},
+                {"type": "SCHEMA", "stream": "busy", "schema": schema},
+            ],
+        )
+        target.get_sink("slow").max_record_age_in_minutes = 1
+        _process(
+            target,
+            [
+                {"type": "RECORD", "stream": "slow", "record": {"id": 1}},
+                {"type": "STATE", "value": {"slow": 1}},
+                {"type": "RECORD", "stream": "busy", "record": {"id": 1}},
+                {"type": "STATE", "value": {"slow": 1, "busy": 1}},
+            ],
+        )
+
+        # Only the slow sink is drained, with the state its records cover
+        traveller.shift(90)
+        _process(target, [{"type": "RECORD", "stream": "busy", "record": {"id": 2}}])
+        assert target.records_written == [{"id": 1}]
+        assert target.state_messages_written == [{"slow": 1}]
+
+        traveller.shift(60)
+        _process(target, [{"type": "RECORD", "stream": "busy", "record": {"id": 3}}])
+        assert target.num_batches_processed == 1
+
+        # Once all sinks are drained, the latest state is written
+        traveller.shift(300)
+        _process(target, [{"type": "RECORD", "stream": "busy", "record": {"id": 4}}])
+        assert target.num_batches_processed == 2
+        assert target.state_messages_written == [{"slow": 1}, {"slow": 1, "busy": 1}]
+
+
+def test_drain_sinks_by_default_record_age():
+    schema = {"properties": {"id": {"type": "integer"}}}
+
+    def _process(target: TargetMock, lines: list[dict]) -> None:
+        target._process_lines(io.StringIO("\n".join(json.dumps(x) for x in lines)))
+
+    with time_machine.travel(0, tick=False) as traveller:
+        target = TargetMock()
+
+        # Without sinks, the next check is after the default max age, in seconds
+        target._handle_max_record_age()
+        assert target._next_record_age_check_at == 300
+
+        _process(
+            target,
+            [
+                {"type": "SCHEMA", "stream": "users", "schema": schema},
+                {"type": "RECORD", "stream": "users", "record": {"id": 1}},
+                {"type": "STATE", "value": {"users": 1}},
+            ],
+        )
+        traveller.shift(290)
+        _process(target, [{"type": "RECORD", "stream": "users", "record": {"id": 2}}])
+        assert target.num_batches_processed == 0
+
+        traveller.shift(20)
+        _process(target, [{"type": "RECORD", "stream": "users", "record": {"id": 3}}])
+        assert target.num_batches_processed == 1
+        assert target.state_messages_written == [{"users": 1}]
+
+
+def test_write_state_after_background_drains():
+    release_drain = threading.Event()
+
+    class BlockingSink(BatchSinkMock):
+        MAX_SIZE_DEFAULT = 2
+        max_batches_in_flight = 1
+
+        def process_batch(self, context: dict) -> None:
+            release_drain.wait(timeout=5)
+            super().process_batch(context)
+
+    class BlockingTarget(TargetMock):
+        default_sink_class = BlockingSink
+
+    def _process(target: TargetMock, lines: list[dict]) -> None:
+        target._process_lines(io.StringIO("\n".join(json.dumps(x) for x in lines)))
+
+    with time_machine.travel(0, tick=False) as traveller:
+        target = BlockingTarget()
+        schema = {"properties": {"id": {"type": "integer"}}}
+        _process(
+            target,
+            [
+                {"type": "SCHEMA", "stream": "users", "schema": schema},
+                {"type": "RECORD", "stream": "users", "record": {"id": 1}},
+                {"type": "RECORD", "stream": "users", "record": {"id": 2}},
+                {"type": "STATE", "value": {"users": 2}},
+            ],
+        )
+        release_drain.set()
+        (in_flight,) = target._background_drains.values()
+        in_flight[0].result()
+        assert target.state_messages_written == []
+
+        traveller.shift(301)
+        _process(target, [{"type": "RECORD", "stream": "users", "record": {"id": 3}}])
+
+        # No sink needs a drain, but the state waiting for the background drain is
+        # written on the next periodic check
+        assert target.num_batches_processed == 1
+        assert target.state_messages_written == [{"users": 2}]
+        target.drain_all()
+
+
+def test_write_drained_state(monkeypatch: pytest.MonkeyPatch):
+    points: list[metrics.Point] = []
+    monkeypatch.setattr(metrics, "log", lambda _, point: points.append(point))
+
+    class SmallSink(BatchSinkMock):
+        MAX_SIZE_DEFAULT = 2
+
+    class SmallTarget(TargetMock):
+        default_sink_class = SmallSink
+
+    def _process(target: TargetMock, lines: list[dict]) -> None:
+        target._process_lines(io.StringIO("\n".join(json.dumps(x) for x in lines)))
+
+    with time_machine.travel(0, tick=False) as traveller:
+        target = SmallTarget()
+        target._checkpoint_lag_gauge.log_interval = -1
+        schema = {"properties": {"id": {"type": "integer"}}}
+        _process(
+            target,
+            [
+                {"type": "SCHEMA", "stream": "busy", "schema": schema},
+                {"type": "SCHEMA", "stream": "slow", "schema": schema},
+                {"type": "RECORD", "stream": "slow", "record": {"id": 1}},
+                {"type": "RECORD", "stream": "busy", "record": {"id": 1}},
+                {"type": "STATE", "value": {"busy": 1}},
+                {"type": "RECORD", "stream": "busy", "record": {"id": 2}},
+                {"type": "RECORD", "stream": "busy", "record": {"id": 3}},
+                {"type": "STATE", "value": {"busy": 3}},
+                {"type": "RECORD", "stream": "busy", "record": {"id": 4}},
+                {"type": "RECORD", "stream": "busy", "record": {"id": 5}},
+                {"type": "STATE", "value": {"busy": 5}},
+            ],
+        )
+
+        # The slow sink still holds a record read before all states
+        assert target.num_batches_processed == 2
+        assert target.state_messages_written == []
+
+        traveller.shift(10)
+        _process(target, [{"type": "RECORD", "stream": "slow", "record": {"id": 2}}])
+
+        # Once the slow sink is drained, the newest state it covers is written,
+        # while the busy sink still holds a record read before the latest state
+        assert target.num_batches_processed == 3
+        assert target.state_messages_written == [{"busy": 3}]
+
+        target.drain_all()
+        assert target.state_messages_written[-1] == {"busy": 5}
+
+    lags = [
+        point.value for point in points if point.metric == metrics.Metric.CHECKPOINT_LAG
+    ]
+    assert lags[-2:] == [10, 0]
+
+
+def test_write_state_of_record_sinks():
+    events: list[dict] = []
+
+    class ListRecordSink(RecordSink):
+        def process_record(self, record: dict, context: dict) -> None:  # noqa: ARG002
+            events.append(record)
+
+    class RecordTarget(TargetMock):
+        default_sink_class = ListRecordSink
+
+    target = RecordTarget()
+    schema = {"properties": {"id": {"type": "integer"}}}
+    lines: list[dict] = [{"type": "SCHEMA", "stream": "events", "schema": schema}]
+    for i in range(3):
+        lines.append({"type": "RECORD", "stream": "events", "record": {"id": i}})
+        lines.append({"type": "STATE", "value": {"events": i}})
+    target._process_lines(io.StringIO("\n".join(json.dumps(x) for x in lines)))
+
+    # Records are written as they are read, so states are written as they arrive
+    assert len(events) == 3
+    assert target.state_messages_written == [
+        {"events": 0},
+        {"events": 1},
+        {"events": 2},
+    ]
+    assert not target._pending_states
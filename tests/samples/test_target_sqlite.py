@@ -18,6 +18,8 @@ from samples.sample_tap_hostile import SampleTapHostile
 from samples.sample_tap_sqlite import SQLiteTap
 from samples.sample_target_sqlite import SQLiteSink, SQLiteTarget
 from singer_sdk import typing as th
+from singer_sdk.exceptions import ConformedNameClashException
+from singer_sdk.helpers._spill import SpilledRecords
 from singer_sdk.testing import (
     tap_sync_test,
     tap_to_target_sync_test,
@@ -520,6 +522,106 @@ def test_sqlite_generate_insert_statement(
     assert dml == expected_dml
 
 
+def test_sqlite_insert_statement_reused(
+    sqlite_sample_target: SQLiteTarget,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    schema = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "Name": {"type": "string"}},
+    }
+    statements = []
+
+    def _spy(full_table_name: str, schema: dict) -> str:
+        statements.append(full_table_name)
+        return SQLiteSink.generate_insert_statement(sink, full_table_name, schema)
+
+    for _ in range(2):
+        # Sinks created again for the schema reuse its statement
+        sink = SQLiteSink(
+            sqlite_sample_target,
+            stream_name="test_stream",
+            schema=deepcopy(schema),
+            key_properties=[],
+            connector=sqlite_sample_target.target_connector,
+        )
+        sink.setup()
+        monkeypatch.setattr(sink, "generate_insert_statement", _spy)
+        for i in range(3):
+            sink.bulk_insert_records(
+                sink.full_table_name,
+                sink.schema,
+                [{"id": i, "Name": f"name {i}"}],
+            )
+
+    # The statement is generated once per schema
+    assert statements == [sink.full_table_name]
+    assert sink.conform_record({"id": 1, "Name": "a"}) == {"id": 1, "name": "a"}
+
+
+def test_sqlite_insert_statements_by_connector(sqlite_target_test_config: dict):
+    class PrefixedSink(SQLiteSink):
+        def conform_name(self, name: str, object_type: str | None = None) -> str:
+            name = super().conform_name(name, object_type)
+            if object_type == "table":
+                return name
+            return f"{self.config.get('column_prefix', '')}{name}"
+
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    statements = []
+    for prefix in ("a_", "b_"):
+        target = SQLiteTarget(
+            config={**sqlite_target_test_config, "column_prefix": prefix},
+        )
+        sink = PrefixedSink(
+            target,
+            stream_name="test_stream",
+            schema=deepcopy(schema),
+            key_properties=[],
+            connector=target.target_connector,
+        )
+        statements.append(
+            str(sink._get_insert_statement(sink.full_table_name, sink.schema)),
+        )
+        assert sink.conform_record({"id": 1}) == {f"{prefix}id": 1}
+
+    # Sinks of targets with other connectors do not share statements
+    assert "(a_id)" in statements[0]
+    assert "(b_id)" in statements[1]
+    with pytest.raises(ConformedNameClashException):
+        sink.conform_record({"name": "a", "Name": "b"})
+
+
+def test_sqlite_bulk_insert_spilled_records(
+    sqlite_sample_target: SQLiteTarget,
+    sqlite_target_test_config: dict,
+):
+    schema = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+    }
+    sink = SQLiteSink(
+        sqlite_sample_target,
+        stream_name="test_stream",
+        schema=schema,
+        key_properties=[],
+    )
+    sink.insert_chunk_size = 2
+    sink.setup()
+
+    records = SpilledRecords([{"id": 0, "name": "a"}])
+    for i in range(1, 5):
+        records.append({"id": i})
+
+    # Records are inserted two at a time, in a single transaction
+    assert sink.bulk_insert_records(sink.full_table_name, sink.schema, records) == 5
+    records.close()
+
+    db = sqlite3.connect(sqlite_target_test_config["path_to_db"])
+    rows = db.execute("SELECT id, name FROM test_stream ORDER BY id").fetchall()
+    assert rows == [(0, "a"), *((i, None) for i in range(1, 5))]
+
+
 def test_hostile_to_sqlite(
     sqlite_sample_target: SQLTarget,
     sqlite_target_test_config: dict,